@@ -15,6 +15,8 @@ from app.models.submodel import Submodel
 from app.models.generation import Generation
 from app.models.base_spec import BaseSpecification
 from app.models.user import User
+from app.models.car_data import CarData
+from app.models.catalog_version import CatalogVersion
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -0,0 +1,35 @@
+"""Add trigram name indexes
+
+Revision ID: 40b30dfb013e
+Revises: 3b6585987c2b
+Create Date: 2026-10-18 13:02:41.227815
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '40b30dfb013e'
+down_revision: Union[str, Sequence[str], None] = '3b6585987c2b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.create_index('ix_brands_name_trgm', 'brands', ['name'], unique=False, postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'})
+    op.create_index('ix_models_name_trgm', 'models', ['name'], unique=False, postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'})
+    op.create_index('ix_submodels_name_trgm', 'submodels', ['name'], unique=False, postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'})
+    op.create_index('ix_generations_name_trgm', 'generations', ['name'], unique=False, postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'})
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_generations_name_trgm', table_name='generations')
+    op.drop_index('ix_submodels_name_trgm', table_name='submodels')
+    op.drop_index('ix_models_name_trgm', table_name='models')
+    op.drop_index('ix_brands_name_trgm', table_name='brands')
@@ -0,0 +1,89 @@
+"""Add car data table
+
+Revision ID: ae373edc655f
+Revises: 1d4d87a12a06
+Create Date: 2026-10-18 10:12:41.503112
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'ae373edc655f'
+down_revision: Union[str, Sequence[str], None] = '1d4d87a12a06'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('car_data',
+    sa.Column('spec_id', sa.UUID(), nullable=False),
+    sa.Column('brand_id', sa.UUID(), nullable=False),
+    sa.Column('brand_name', sa.String(), nullable=False),
+    sa.Column('brand_country', sa.String(), nullable=True),
+    sa.Column('model_id', sa.UUID(), nullable=False),
+    sa.Column('model_name', sa.String(), nullable=False),
+    sa.Column('model_description', sa.String(), nullable=True),
+    sa.Column('submodel_id', sa.UUID(), nullable=False),
+    sa.Column('submodel_name', sa.String(), nullable=False),
+    sa.Column('generation_id', sa.UUID(), nullable=False),
+    sa.Column('generation_name', sa.String(), nullable=False),
+    sa.Column('generation_year_from', sa.Integer(), nullable=True),
+    sa.Column('generation_year_to', sa.Integer(), nullable=True),
+    sa.Column('spec_year', sa.Integer(), nullable=True),
+    sa.Column('engine', sa.String(), nullable=True),
+    sa.Column('engine_displacement', sa.Integer(), nullable=True),
+    sa.Column('fuel_type', postgresql.ENUM('petrol', 'diesel', 'electric', 'hybrid', 'lpg', name='fueltypeenum', create_type=False), nullable=False),
+    sa.Column('horsepower', sa.Integer(), nullable=True),
+    sa.Column('torque', sa.Integer(), nullable=True),
+    sa.Column('transmission', sa.String(), nullable=True),
+    sa.Column('drivetrain', sa.String(), nullable=True),
+    sa.Column('doors', sa.Integer(), nullable=True),
+    sa.Column('seats', sa.Integer(), nullable=True),
+    sa.Column('weight', sa.Integer(), nullable=True),
+    sa.Column('zero_to_100', sa.Float(), nullable=True),
+    sa.Column('top_speed', sa.Integer(), nullable=True),
+    sa.ForeignKeyConstraint(['spec_id'], ['base_specs.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('spec_id')
+    )
+    op.create_index(op.f('ix_car_data_brand_id'), 'car_data', ['brand_id'], unique=False)
+    op.create_index(op.f('ix_car_data_model_id'), 'car_data', ['model_id'], unique=False)
+    op.create_index(op.f('ix_car_data_submodel_id'), 'car_data', ['submodel_id'], unique=False)
+    op.create_index(op.f('ix_car_data_generation_id'), 'car_data', ['generation_id'], unique=False)
+
+    op.execute(
+        """
+        INSERT INTO car_data
+        SELECT
+            base_specs.id,
+            brands.id, brands.name, brands.country,
+            models.id, models.name, models.description,
+            submodels.id, submodels.name,
+            generations.id, generations.name,
+            generations.year_from, generations.year_to,
+            base_specs.year, base_specs.engine, base_specs.engine_displacement,
+            base_specs.fuel_type, base_specs.horsepower, base_specs.torque,
+            base_specs.transmission, base_specs.drivetrain, base_specs.doors,
+            base_specs.seats, base_specs.weight, base_specs.zero_to_100,
+            base_specs.top_speed
+        FROM brands
+        JOIN models ON models.brand_id = brands.id
+        JOIN submodels ON submodels.model_id = models.id
+        JOIN generations ON generations.submodel_id = submodels.id
+        JOIN base_specs ON base_specs.generation_id = generations.id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_car_data_generation_id'), table_name='car_data')
+    op.drop_index(op.f('ix_car_data_submodel_id'), table_name='car_data')
+    op.drop_index(op.f('ix_car_data_model_id'), table_name='car_data')
+    op.drop_index(op.f('ix_car_data_brand_id'), table_name='car_data')
+    op.drop_table('car_data')
@@ -0,0 +1,44 @@
+"""Add descending car data sort indexes
+
+Revision ID: d41f6a3b92c7
+Revises: 8c4c8b7f9457
+Create Date: 2026-10-18 15:12:44.301862
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd41f6a3b92c7'
+down_revision: Union[str, Sequence[str], None] = '8c4c8b7f9457'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_car_data_spec_id_desc', 'car_data', [sa.text('spec_id DESC NULLS LAST')], unique=False)
+    op.create_index('ix_car_data_spec_year_desc', 'car_data', [sa.text('spec_year DESC NULLS LAST'), 'spec_id'], unique=False)
+    op.create_index('ix_car_data_horsepower_desc', 'car_data', [sa.text('horsepower DESC NULLS LAST'), 'spec_id'], unique=False)
+    op.create_index('ix_car_data_torque_desc', 'car_data', [sa.text('torque DESC NULLS LAST'), 'spec_id'], unique=False)
+    op.create_index('ix_car_data_weight_desc', 'car_data', [sa.text('weight DESC NULLS LAST'), 'spec_id'], unique=False)
+    op.create_index('ix_car_data_zero_to_100_desc', 'car_data', [sa.text('zero_to_100 DESC NULLS LAST'), 'spec_id'], unique=False)
+    op.create_index('ix_car_data_top_speed_desc', 'car_data', [sa.text('top_speed DESC NULLS LAST'), 'spec_id'], unique=False)
+    op.create_index('ix_car_data_brand_name_desc', 'car_data', [sa.text('brand_name DESC NULLS LAST'), 'spec_id'], unique=False)
+    op.create_index('ix_car_data_model_name_desc', 'car_data', [sa.text('model_name DESC NULLS LAST'), 'spec_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_car_data_model_name_desc', table_name='car_data')
+    op.drop_index('ix_car_data_brand_name_desc', table_name='car_data')
+    op.drop_index('ix_car_data_top_speed_desc', table_name='car_data')
+    op.drop_index('ix_car_data_zero_to_100_desc', table_name='car_data')
+    op.drop_index('ix_car_data_weight_desc', table_name='car_data')
+    op.drop_index('ix_car_data_torque_desc', table_name='car_data')
+    op.drop_index('ix_car_data_horsepower_desc', table_name='car_data')
+    op.drop_index('ix_car_data_spec_year_desc', table_name='car_data')
+    op.drop_index('ix_car_data_spec_id_desc', table_name='car_data')
@@ -0,0 +1,12 @@
+from app.utils.cache_backends import CacheBackend, MemoryCacheBackend, RedisCacheBackend
+from app.config import settings
+
+
+def create_cache_backend() -> CacheBackend:
+    if settings.CACHE_BACKEND == "redis":
+        return RedisCacheBackend(settings.CACHE_REDIS_URL, settings.CACHE_KEY_PREFIX)
+
+    return MemoryCacheBackend(max_bytes=settings.CACHE_MEMORY_MAX_BYTES)
+
+
+cache_backend = create_cache_backend()
@@ -0,0 +1,182 @@
+import argparse
+import asyncio
+import time
+from typing import Awaitable, Callable, List
+
+from sqlalchemy import Row, select
+from sqlalchemy.orm import joinedload
+
+from app.db import SessionLocal
+from app.models.base_spec import BaseSpecification
+from app.models.generation import Generation
+from app.models.submodel import Submodel
+from app.models.car_model import CarModel
+from app.repositories.base_spec import BaseSpecificationRepository
+from app.repositories.car_data import CarDataRepository
+from app.schemas.car_data_schemas import CarDataResponse
+
+
+def _from_spec(spec: BaseSpecification) -> CarDataResponse:
+    # The per-spec attribute walk the ORM read path used before the flat
+    # projection replaced it.
+    generation = spec.generation
+    submodel = generation.submodel
+    model = submodel.model
+    brand = model.brand
+
+    return CarDataResponse(
+        brand_id=str(brand.id),
+        brand_name=brand.name,
+        brand_country=brand.country,
+        model_id=str(model.id),
+        model_name=model.name,
+        model_description=model.description,
+        submodel_id=str(submodel.id),
+        submodel_name=submodel.name,
+        generation_id=str(generation.id),
+        generation_name=generation.name,
+        generation_year_from=generation.year_from,
+        generation_year_to=generation.year_to,
+        spec_id=str(spec.id),
+        spec_year=spec.year,
+        engine=spec.engine,
+        engine_displacement=spec.engine_displacement,
+        fuel_type=spec.fuel_type.value,
+        horsepower=spec.horsepower,
+        torque=spec.torque,
+        transmission=spec.transmission,
+        drivetrain=spec.drivetrain,
+        doors=spec.doors,
+        seats=spec.seats,
+        weight=spec.weight,
+        zero_to_100=spec.zero_to_100,
+        top_speed=spec.top_speed,
+    )
+
+
+async def joinedload_path(limit: int) -> List[CarDataResponse]:
+    async with SessionLocal() as db:
+        result = await db.execute(
+            select(BaseSpecification)
+            .options(
+                joinedload(BaseSpecification.generation)
+                .joinedload(Generation.submodel)
+                .joinedload(Submodel.model)
+                .joinedload(CarModel.brand)
+            )
+            .order_by(BaseSpecification.id)
+            .limit(limit)
+        )
+        return [_from_spec(spec) for spec in result.scalars().unique().all()]
+
+
+def _from_row(row: Row) -> CarDataResponse:
+    # Same conversions and the same validating constructor as _from_spec,
+    # so the two paths differ only in how the rows are loaded.
+    (
+        spec_id,
+        brand_id,
+        brand_name,
+        brand_country,
+        model_id,
+        model_name,
+        model_description,
+        submodel_id,
+        submodel_name,
+        generation_id,
+        generation_name,
+        generation_year_from,
+        generation_year_to,
+        spec_year,
+        engine,
+        engine_displacement,
+        fuel_type,
+        horsepower,
+        torque,
+        transmission,
+        drivetrain,
+        doors,
+        seats,
+        weight,
+        zero_to_100,
+        top_speed,
+    ) = row
+
+    return CarDataResponse(
+        brand_id=str(brand_id),
+        brand_name=brand_name,
+        brand_country=brand_country,
+        model_id=str(model_id),
+        model_name=model_name,
+        model_description=model_description,
+        submodel_id=str(submodel_id),
+        submodel_name=submodel_name,
+        generation_id=str(generation_id),
+        generation_name=generation_name,
+        generation_year_from=generation_year_from,
+        generation_year_to=generation_year_to,
+        spec_id=str(spec_id),
+        spec_year=spec_year,
+        engine=engine,
+        engine_displacement=engine_displacement,
+        fuel_type=fuel_type.value,
+        horsepower=horsepower,
+        torque=torque,
+        transmission=transmission,
+        drivetrain=drivetrain,
+        doors=doors,
+        seats=seats,
+        weight=weight,
+        zero_to_100=zero_to_100,
+        top_speed=top_speed,
+    )
+
+
+async def projection_path(limit: int) -> List[CarDataResponse]:
+    async with SessionLocal() as db:
+        result = await db.execute(
+            CarDataRepository._select_source()
+            .order_by(BaseSpecification.id)
+            .limit(limit)
+        )
+        return [_from_row(row) for row in result.all()]
+
+
+async def measure(
+    name: str, limit: int, repeat: int, read: Callable[[int], Awaitable[list]]
+) -> None:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        rows = len(await read(limit))
+        timings.append(time.perf_counter() - start)
+
+    best = min(timings)
+    print(
+        f"  {name:<12} {rows:>9,} rows {best * 1000:10.1f} ms"
+        f" {rows / best:12,.0f} rows/s"
+    )
+
+
+async def main(sizes: List[int], repeat: int) -> None:
+    async with SessionLocal() as db:
+        available = await BaseSpecificationRepository.count(db)
+
+    print(f"base_specs rows available: {available:,}")
+    for size in sizes:
+        print(f"limit {size:,}")
+        await measure("joinedload", size, repeat, joinedload_path)
+        await measure("projection", size, repeat, projection_path)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Compare the joinedload read path with the flat column projection"
+    )
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000]
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.sizes, args.repeat))
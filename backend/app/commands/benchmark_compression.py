@@ -0,0 +1,60 @@
+import argparse
+import asyncio
+import time
+from typing import List
+
+from pydantic import TypeAdapter
+
+from app.db import SessionLocal
+from app.schemas.car_data_schemas import CarDataResponse
+from app.services import car_data_service
+from app.utils.encoding import COMPRESSORS, compress
+
+
+async def load_car_data(limit: int) -> List[CarDataResponse]:
+    car_data = []
+    async with SessionLocal() as db:
+        async for item in car_data_service.stream_car_data(db):
+            car_data.append(item)
+            if len(car_data) == limit:
+                break
+
+    return car_data
+
+
+def benchmark(body: bytes, repeat: int) -> None:
+    print(f"  {'identity':<8} {len(body):>12,} B")
+    for encoding in COMPRESSORS:
+        start = time.process_time()
+        for _ in range(repeat):
+            compressed = compress(body, encoding)
+        cpu_ms = (time.process_time() - start) / repeat * 1000
+        ratio = len(body) / len(compressed)
+        print(
+            f"  {encoding:<8} {len(compressed):>12,} B"
+            f"  {ratio:6.1f}x  {cpu_ms:9.2f} ms CPU/request"
+        )
+
+
+async def main(sizes: List[int], repeat: int) -> None:
+    car_data = await load_car_data(max(sizes))
+    adapter = TypeAdapter(List[CarDataResponse])
+
+    for size in sizes:
+        rows = car_data[:size]
+        print(f"{len(rows):,} rows, JSON array")
+        benchmark(adapter.dump_json(rows), repeat)
+        print(f"{len(rows):,} rows, NDJSON")
+        ndjson = b"".join(row.model_dump_json().encode() + b"\n" for row in rows)
+        benchmark(ndjson, repeat)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Compare bytes on the wire and CPU cost of each response codec"
+    )
+    parser.add_argument("sizes", type=int, nargs="*", default=[100, 1000, 10000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.sizes, args.repeat))
@@ -0,0 +1,84 @@
+import argparse
+import asyncio
+import time
+from uuid import UUID, uuid4
+
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
+
+from app.db import SessionLocal
+from app.models.brand import Brand
+from app.models.car_model import CarModel
+from app.models.generation import Generation
+from app.models.submodel import Submodel
+from app.repositories.brand import BrandRepository
+from app.schemas.catalog_schemas import CatalogImport
+from app.services import brand_service, catalog_import_service
+from app.services.catalog_version_service import bump_catalog_version
+from app.commands.synthetic_catalog import build_brand, delete_brands
+
+
+async def load_then_delete(brand_id: UUID, db) -> None:
+    # The ORM path before passive deletes: with the whole tree in the
+    # session, the cascade issues one DELETE per model, submodel,
+    # generation and spec.
+    result = await db.execute(
+        select(Brand)
+        .where(Brand.id == brand_id)
+        .options(
+            selectinload(Brand.models)
+            .selectinload(CarModel.submodels)
+            .selectinload(Submodel.generations)
+            .selectinload(Generation.specs)
+        )
+    )
+    await db.delete(result.scalar_one())
+    await db.commit()
+    await bump_catalog_version(db)
+
+
+async def single_delete(brand_id: UUID, db) -> None:
+    await brand_service.delete_brand(brand_id, db)
+
+
+async def main(fanout: int, specs: int) -> None:
+    prefix = f"benchmark-{uuid4().hex[:8]}"
+    names = {"load-then-delete": f"{prefix}-l", "single delete": f"{prefix}-s"}
+    catalog = CatalogImport(
+        brands=[build_brand(name, fanout, specs) for name in names.values()]
+    )
+
+    try:
+        async with SessionLocal() as db:
+            await catalog_import_service.import_catalog(catalog, db)
+            brands = {
+                label: await BrandRepository.select_by_name(db, name)
+                for label, name in names.items()
+            }
+
+        print(f"brand with {fanout**3:,} generations and {fanout**3 * specs:,} specs")
+
+        for label, delete in (
+            ("load-then-delete", load_then_delete),
+            ("single delete", single_delete),
+        ):
+            async with SessionLocal() as db:
+                start = time.perf_counter()
+                await delete(brands[label].id, db)
+                elapsed = time.perf_counter() - start
+
+            print(f"  {label:<16} {elapsed * 1000:9.1f} ms")
+    finally:
+        # Leaves nothing behind if an import or a delete fails halfway.
+        await delete_brands(prefix)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Time deleting a brand with a deep model/generation/spec tree"
+    )
+    parser.add_argument("--fanout", type=int, default=10)
+    parser.add_argument("--specs", type=int, default=50)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.fanout, args.specs))
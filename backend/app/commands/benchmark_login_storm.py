@@ -0,0 +1,75 @@
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Awaitable, Callable, List
+
+import bcrypt
+import httpx
+
+from app.main import app
+from app.dependancies.auth import hash_password, verify_password
+
+
+async def verify_inline(plain_password: str, hashed_password: str) -> bool:
+    # What the handlers did before bcrypt moved to the executor: checkpw
+    # straight on the event loop.
+    return bcrypt.checkpw(plain_password.encode(), hashed_password.encode())
+
+
+def percentile(values: List[float], pct: float) -> float:
+    return statistics.quantiles(values, n=100, method="inclusive")[int(pct) - 1]
+
+
+async def run(
+    verify: Callable[[str, str], Awaitable[bool]],
+    hashed: str,
+    logins: int,
+    concurrency: int,
+    path: str,
+) -> List[float]:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def login() -> None:
+        async with semaphore:
+            await verify("benchmark-password", hashed)
+
+    storm = asyncio.gather(*(login() for _ in range(logins)))
+    latencies = []
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://benchmark"
+    ) as client:
+        while not storm.done():
+            start = time.perf_counter()
+            await client.get(path)
+            latencies.append(time.perf_counter() - start)
+
+    await storm
+    return latencies
+
+
+async def main(logins: int, concurrency: int, path: str) -> None:
+    hashed = await hash_password("benchmark-password")
+
+    print(f"GET {path} during {logins} logins ({concurrency} concurrent)")
+    for name, verify in (("inline", verify_inline), ("executor", verify_password)):
+        latencies = await run(verify, hashed, logins, concurrency, path)
+        print(
+            f"  {name:<9} {len(latencies):6} GETs"
+            f"  p50 {percentile(latencies, 50) * 1000:8.1f} ms"
+            f"  p99 {percentile(latencies, 99) * 1000:8.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Measure catalog GET latency while a login storm runs bcrypt"
+    )
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--path", default="/brands/")
+    args = parser.parse_args()
+
+    asyncio.run(main(args.logins, args.concurrency, args.path))
@@ -0,0 +1,116 @@
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from typing import List
+from uuid import uuid4
+
+from app.db import SessionLocal
+from app.repositories.car_data import CarDataRepository
+from app.schemas.car_data_schemas import CarDataFilter
+from app.schemas.catalog_schemas import CatalogImport
+from app.services import car_data_service, catalog_import_service
+from app.utils.enums import CarDataSortEnum, FuelTypeEnum, SortOrderEnum
+from app.commands.synthetic_catalog import (
+    DRIVETRAINS,
+    TRANSMISSIONS,
+    build_brand,
+    delete_brands,
+)
+
+FANOUT = 5
+SPECS_PER_GENERATION = 40
+
+
+async def seed(prefix: str, target: int, rng: random.Random) -> int:
+    async with SessionLocal() as db:
+        available = await CarDataRepository.count(db)
+
+    per_brand = FANOUT**3 * SPECS_PER_GENERATION
+    for index in range((max(target - available, 0) + per_brand - 1) // per_brand):
+        brand = build_brand(f"{prefix}-{index}", FANOUT, SPECS_PER_GENERATION, rng)
+        catalog = CatalogImport(brands=[brand])
+        async with SessionLocal() as db:
+            await catalog_import_service.import_catalog(catalog, db)
+        available += per_brand
+
+    return available
+
+
+def random_filter(rng: random.Random) -> CarDataFilter:
+    horsepower_min = rng.randint(60, 500)
+    year_min = rng.randint(1990, 2020)
+    return rng.choice(
+        [
+            CarDataFilter(fuel_type=[rng.choice(list(FuelTypeEnum))]),
+            CarDataFilter(
+                horsepower_min=horsepower_min, horsepower_max=horsepower_min + 50
+            ),
+            CarDataFilter(year_min=year_min, year_max=year_min + 2),
+            CarDataFilter(
+                fuel_type=[FuelTypeEnum.electric],
+                drivetrain=[rng.choice(DRIVETRAINS)],
+                zero_to_100_max=round(rng.uniform(3.0, 8.0), 1),
+            ),
+            CarDataFilter(
+                transmission=[rng.choice(TRANSMISSIONS)],
+                weight_max=rng.randint(1000, 1600),
+                top_speed_min=rng.randint(180, 260),
+            ),
+        ]
+    )
+
+
+async def measure(queries: int, limit: int) -> None:
+    async with SessionLocal() as db:
+        available = await CarDataRepository.count(db)
+
+    print(f"car_data search over {available:,} rows ({queries:,} queries per order)")
+    for order in SortOrderEnum:
+        # Reseeded per order so both orders run the same filter/sort mix.
+        order_rng = random.Random(1)
+        latencies: List[float] = []
+        async with SessionLocal() as db:
+            for _ in range(queries):
+                filters = random_filter(order_rng)
+                sort = order_rng.choice(list(CarDataSortEnum))
+                start = time.perf_counter()
+                await car_data_service.search_car_data(db, filters, sort, order, limit)
+                latencies.append(time.perf_counter() - start)
+
+        percentiles = statistics.quantiles(latencies, n=100, method="inclusive")
+        print(
+            f"  {order.value:<4} p50 {percentiles[49] * 1000:9.1f} ms"
+            f"  p95 {percentiles[94] * 1000:9.1f} ms"
+        )
+
+
+async def main(specs: int, queries: int, limit: int, seed_data: bool) -> None:
+    prefix = f"benchmark-{uuid4().hex[:8]}"
+    try:
+        if seed_data:
+            await seed(prefix, specs, random.Random(0))
+        await measure(queries, limit)
+    finally:
+        # Only the brands this run imported carry its prefix.
+        deleted = await delete_brands(prefix)
+        if deleted:
+            print(f"deleted {deleted:,} seeded brands")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Measure filtered car data search latency on a large catalog"
+    )
+    parser.add_argument("--specs", type=int, default=1_000_000)
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument(
+        "--seed",
+        action="store_true",
+        help="Import synthetic brands until car_data holds --specs rows",
+    )
+    args = parser.parse_args()
+
+    asyncio.run(main(args.specs, args.queries, args.limit, args.seed))
@@ -0,0 +1,104 @@
+import argparse
+import asyncio
+import time
+from typing import Any, Callable, List
+from uuid import UUID
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, TypeAdapter, field_serializer
+
+from app.db import SessionLocal
+from app.schemas.base_spec_schemas import BaseSpecification
+from app.schemas.car_data_schemas import CarDataResponse
+from app.schemas.pagination_schemas import PageParams
+from app.services import base_spec_service, car_data_service
+from app.utils.responses import FastJSONResponse
+
+
+class LegacyBaseSpecification(BaseSpecification):
+    # The per-field hook every schema carried before pydantic-core was left
+    # to emit UUIDs itself.
+    @field_serializer("id", "generation_id")
+    def serialize_uuid(self, value: UUID, _info):
+        return str(value)
+
+
+def measure(name: str, rows: int, repeat: int, serialize: Callable[[], bytes]) -> None:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        body = serialize()
+    elapsed = (time.perf_counter() - start) / repeat
+
+    print(
+        f"  {name:<10} {elapsed * 1000:9.2f} ms/request"
+        f"  {1 / elapsed:9.1f} req/s  {rows / elapsed:12,.0f} rows/s"
+        f"  {len(body):>12,} B"
+    )
+
+
+def benchmark(
+    endpoint: str,
+    items: List[BaseModel],
+    legacy_items: List[BaseModel],
+    response_type: Any,
+    repeat: int,
+) -> None:
+    adapter = TypeAdapter(response_type)
+
+    print(f"{endpoint} ({len(items):,} rows)")
+    # FastAPI's default: jsonable_encoder walks the models, running their
+    # serializers, and JSONResponse renders the result with json.dumps.
+    measure(
+        "baseline",
+        len(items),
+        repeat,
+        lambda: JSONResponse(jsonable_encoder(legacy_items)).body,
+    )
+    measure(
+        "fast",
+        len(items),
+        repeat,
+        lambda: FastJSONResponse(adapter.dump_python(items, mode="json")).body,
+    )
+    # What model_response and the response cache send.
+    measure("dump_json", len(items), repeat, lambda: adapter.dump_json(items))
+
+
+async def main(limit: int, repeat: int) -> None:
+    page = PageParams(limit=limit, cursor=None, include_total=False)
+
+    async with SessionLocal() as db:
+        base_specs = await base_spec_service.get_all_base_specifications(db, page)
+        car_data = await car_data_service.get_all_car_data(db, page)
+
+    legacy_base_specs = [
+        LegacyBaseSpecification.model_validate(base_spec.model_dump())
+        for base_spec in base_specs.items
+    ]
+    benchmark(
+        "/base-specifications/",
+        base_specs.items,
+        legacy_base_specs,
+        List[BaseSpecification],
+        repeat,
+    )
+    # car data never had serializers, so only the rendering path differs.
+    benchmark(
+        "/car-data/all",
+        car_data.items,
+        car_data.items,
+        List[CarDataResponse],
+        repeat,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Compare JSON serialization paths on catalog list payloads"
+    )
+    parser.add_argument("--limit", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.limit, args.repeat))
@@ -0,0 +1,77 @@
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from typing import List
+
+from sqlalchemy import func, select, union_all
+
+from app.db import SessionLocal
+from app.models.brand import Brand
+from app.models.car_model import CarModel
+from app.models.generation import Generation
+from app.models.submodel import Submodel
+from app.services import catalog_search_service
+
+TARGET_MS = 20.0
+
+
+async def sample_names(count: int) -> List[str]:
+    names = union_all(
+        *(
+            select(model.name).order_by(func.random()).limit(count)
+            for model in (Brand, CarModel, Submodel, Generation)
+        )
+    )
+    async with SessionLocal() as db:
+        return list((await db.execute(names)).scalars())
+
+
+def keystrokes(names: List[str], count: int, rng: random.Random) -> List[str]:
+    # Replay what a user types: growing prefixes from the minimum length the
+    # endpoint accepts, plus the odd typo that only the trigram match catches.
+    queries = []
+    while len(queries) < count:
+        name = rng.choice(names)
+        for length in range(3, min(len(name), 8) + 1):
+            queries.append(name[:length])
+        if len(name) > 4:
+            typo = rng.randrange(1, len(name) - 1)
+            queries.append(name[:typo] + name[typo + 1 :])
+
+    return queries[:count]
+
+
+async def main(queries: int, limit: int) -> None:
+    rng = random.Random(0)
+    names = await sample_names(200)
+    if not names:
+        print("catalog is empty; import some data first")
+        return
+
+    latencies: List[float] = []
+    async with SessionLocal() as db:
+        for q in keystrokes(names, queries, rng):
+            start = time.perf_counter()
+            await catalog_search_service.search_catalog(db, q, limit)
+            latencies.append(time.perf_counter() - start)
+
+    percentiles = statistics.quantiles(latencies, n=100, method="inclusive")
+    p95 = percentiles[94] * 1000
+    print(f"typeahead ({len(latencies):,} queries, limit {limit})")
+    print(f"  p50 {percentiles[49] * 1000:9.1f} ms")
+    print(f"  p95 {p95:9.1f} ms")
+    print(f"  p99 {percentiles[98] * 1000:9.1f} ms")
+    print(f"  target {TARGET_MS:.0f} ms: {'ok' if p95 < TARGET_MS else 'MISSED'}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Measure catalog name search latency for typeahead queries"
+    )
+    parser.add_argument("--queries", type=int, default=1_000)
+    parser.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.queries, args.limit))
@@ -0,0 +1,85 @@
+import argparse
+import asyncio
+import json
+import time
+from typing import Any, Callable, List
+
+from pydantic import BaseModel, TypeAdapter
+
+from app.db import SessionLocal
+from app.repositories.base_spec import BaseSpecificationRepository
+from app.repositories.car_data import CarDataRepository
+from app.schemas.base_spec_schemas import BaseSpecification
+from app.schemas.car_data_schemas import CarDataResponse
+
+
+def measure(name: str, rows: int, repeat: int, respond: Callable[[], bytes]) -> None:
+    start = time.process_time()
+    for _ in range(repeat):
+        respond()
+    cpu = (time.process_time() - start) / repeat
+
+    print(f"  {name:<22} {cpu / rows * 10_000 * 1000:9.2f} ms CPU per 10k rows")
+
+
+def revalidated(items: List[BaseModel], adapter: TypeAdapter) -> bytes:
+    # What FastAPI does with response_model: dump each model to a dict,
+    # validate the dicts again, then serialize the result.
+    content = adapter.validate_python([item.model_dump() for item in items])
+    return json.dumps(adapter.dump_python(content, mode="json")).encode()
+
+
+def benchmark(
+    endpoint: str,
+    rows: List[Any],
+    schema: type[BaseModel],
+    build: Callable[[Any], BaseModel],
+    repeat: int,
+) -> None:
+    adapter = TypeAdapter(List[schema])
+
+    print(f"{endpoint} ({len(rows):,} rows)")
+    measure(
+        "response_model",
+        len(rows),
+        repeat,
+        lambda: revalidated([build(row) for row in rows], adapter),
+    )
+    measure(
+        "model_response",
+        len(rows),
+        repeat,
+        lambda: adapter.dump_json([build(row) for row in rows]),
+    )
+
+
+async def main(limit: int, repeat: int) -> None:
+    async with SessionLocal() as db:
+        base_specs = await BaseSpecificationRepository.select_all(db, limit)
+        car_data = await CarDataRepository.select_car_data_page(db, limit)
+
+    benchmark(
+        "/base-specifications/",
+        base_specs,
+        BaseSpecification,
+        BaseSpecification.model_validate,
+        repeat,
+    )
+    benchmark(
+        "/car-data/all",
+        car_data,
+        CarDataResponse,
+        lambda row: CarDataResponse.model_construct(**row._mapping),
+        repeat,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Compare CPU spent validating list responses once versus twice"
+    )
+    parser.add_argument("--limit", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.limit, args.repeat))
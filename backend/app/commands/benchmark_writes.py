@@ -0,0 +1,189 @@
+import argparse
+import asyncio
+import time
+from typing import Awaitable, Callable, List
+from uuid import UUID, uuid4
+
+from app.db import SessionLocal
+from app.models.brand import Brand
+from app.models.generation import Generation
+from app.repositories.brand import BrandRepository
+from app.repositories.generation import GenerationRepository
+from app.repositories.submodel import SubmodelRepository
+from app.schemas.brand_schemas import BrandCreate
+from app.schemas.catalog_schemas import CatalogImport
+from app.schemas.generation_schemas import GenerationCreate
+from app.services import brand_service, catalog_import_service, generation_service
+from app.services.car_data_service import refresh_car_data
+from app.services.catalog_version_service import bump_catalog_version
+from app.commands.synthetic_catalog import build_brand, delete_brands
+
+
+async def run(
+    name: str, ids: List[UUID], concurrency: int, write: Callable[..., Awaitable]
+) -> None:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(index: int, id: UUID) -> None:
+        async with semaphore, SessionLocal() as db:
+            await write(index, id, db)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(index, id) for index, id in enumerate(ids)))
+    elapsed = time.perf_counter() - start
+
+    print(f"  {name:<24} {len(ids) / elapsed:9.1f} writes/s")
+
+
+async def select_then_write(prefix: str, count: int, concurrency: int) -> None:
+    # The ORM path the services used before RETURNING: add or load the row,
+    # commit it, refresh it, then commit the version bump separately.
+    ids: List[UUID] = [uuid4() for _ in range(count)]
+
+    async def create(index: int, _: UUID, db) -> None:
+        brand = Brand(name=f"{prefix}-{index}", country="Benchmark")
+        db.add(brand)
+        await db.commit()
+        await db.refresh(brand)
+        await bump_catalog_version(db)
+        ids[index] = brand.id
+
+    async def update(index: int, brand_id: UUID, db) -> None:
+        brand = await BrandRepository.select_by_id(db, brand_id)
+        brand.name = f"{prefix}-{index}-u"
+        await db.commit()
+        await db.refresh(brand)
+        await refresh_car_data(db, "brand_id", brand.id)
+        await bump_catalog_version(db)
+
+    async def delete(_: int, brand_id: UUID, db) -> None:
+        brand = await BrandRepository.select_by_id(db, brand_id)
+        await db.delete(brand)
+        await db.commit()
+        await bump_catalog_version(db)
+
+    await run("select-then-write create", ids, concurrency, create)
+    await run("select-then-write update", ids, concurrency, update)
+    await run("select-then-write delete", ids, concurrency, delete)
+
+
+async def returning(prefix: str, count: int, concurrency: int) -> None:
+    ids: List[UUID] = [uuid4() for _ in range(count)]
+
+    async def create(index: int, _: UUID, db) -> None:
+        brand = await brand_service.create_brand(
+            BrandCreate(name=f"{prefix}-{index}", country="Benchmark"), db
+        )
+        ids[index] = brand.id
+
+    async def update(index: int, brand_id: UUID, db) -> None:
+        await brand_service.update_brand(
+            brand_id, BrandCreate(name=f"{prefix}-{index}-u", country="Benchmark"), db
+        )
+
+    async def delete(_: int, brand_id: UUID, db) -> None:
+        await brand_service.delete_brand(brand_id, db)
+
+    await run("returning create", ids, concurrency, create)
+    await run("returning update", ids, concurrency, update)
+    await run("returning delete", ids, concurrency, delete)
+
+
+async def generation_select_then_write(
+    prefix: str, submodel_id: UUID, count: int, concurrency: int
+) -> None:
+    # Before RETURNING a create looked the parent submodel up first so a
+    # missing one became a 404 rather than a foreign key violation.
+    ids: List[UUID] = [uuid4() for _ in range(count)]
+
+    async def create(index: int, _: UUID, db) -> None:
+        submodel = await SubmodelRepository.select_by_id(db, submodel_id)
+        generation = Generation(
+            submodel_id=submodel.id, name=f"{prefix}-{index}", year_from=2000
+        )
+        db.add(generation)
+        await db.commit()
+        await db.refresh(generation)
+        await bump_catalog_version(db)
+        ids[index] = generation.id
+
+    async def update(index: int, generation_id: UUID, db) -> None:
+        generation = await GenerationRepository.select_by_id(db, generation_id)
+        generation.name = f"{prefix}-{index}-u"
+        generation.year_to = 2010
+        await db.commit()
+        await db.refresh(generation)
+        await refresh_car_data(db, "generation_id", generation.id)
+        await bump_catalog_version(db)
+
+    await run("select-then-write create", ids, concurrency, create)
+    await run("select-then-write update", ids, concurrency, update)
+
+
+async def generation_returning(
+    prefix: str, submodel_id: UUID, count: int, concurrency: int
+) -> None:
+    ids: List[UUID] = [uuid4() for _ in range(count)]
+
+    async def create(index: int, _: UUID, db) -> None:
+        generation = await generation_service.create_generation(
+            GenerationCreate(
+                submodel_id=submodel_id, name=f"{prefix}-{index}", year_from=2000
+            ),
+            db,
+        )
+        ids[index] = generation.id
+
+    async def update(index: int, generation_id: UUID, db) -> None:
+        await generation_service.update_generation(
+            generation_id,
+            GenerationCreate(
+                submodel_id=submodel_id,
+                name=f"{prefix}-{index}-u",
+                year_from=2000,
+                year_to=2010,
+            ),
+            db,
+        )
+
+    await run("returning create", ids, concurrency, create)
+    await run("returning update", ids, concurrency, update)
+
+
+async def seed_submodel(prefix: str) -> UUID:
+    # One brand/model/submodel chain to hang the generations off; deleting
+    # the brand afterwards cascades to everything written under it.
+    catalog = CatalogImport(brands=[build_brand(prefix, 1, 0)])
+    async with SessionLocal() as db:
+        await catalog_import_service.import_catalog(catalog, db)
+        submodel = await SubmodelRepository.select_by_name(db, f"{prefix}-m0-s0")
+    return submodel.id
+
+
+async def main(count: int, concurrency: int) -> None:
+    prefix = f"benchmark-{uuid4().hex[:8]}"
+
+    try:
+        print(f"brands ({count:,} writes, concurrency {concurrency})")
+        await select_then_write(f"{prefix}-s", count, concurrency)
+        await returning(f"{prefix}-r", count, concurrency)
+
+        submodel_id = await seed_submodel(f"{prefix}-parent")
+        print(f"generations ({count:,} writes, concurrency {concurrency})")
+        await generation_select_then_write(
+            f"{prefix}-gs", submodel_id, count, concurrency
+        )
+        await generation_returning(f"{prefix}-gr", submodel_id, count, concurrency)
+    finally:
+        await delete_brands(prefix)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Measure catalog write throughput through the service layer"
+    )
+    parser.add_argument("--count", type=int, default=1_000)
+    parser.add_argument("--concurrency", type=int, default=10)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.count, args.concurrency))
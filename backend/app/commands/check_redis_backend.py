@@ -0,0 +1,99 @@
+import argparse
+import asyncio
+import sys
+from typing import List, Optional
+
+from app.utils.cache_backends import RedisCacheBackend
+
+
+async def check(backend: RedisCacheBackend, client) -> List[str]:
+    failures: List[str] = []
+
+    def expect(name: str, condition: bool) -> None:
+        print(f"  {name:<36} {'ok' if condition else 'FAILED'}")
+        if not condition:
+            failures.append(name)
+
+    await client.set("foreign-key", b"untouched")
+
+    await backend.set("key", b"value")
+    expect("get returns the stored value", await backend.get("key") == b"value")
+    expect(
+        "keys carry the prefix", await client.get(backend.prefix + "key") == b"value"
+    )
+    expect("get misses an unknown key", await backend.get("missing") is None)
+
+    await backend.set("expiring", b"value", ttl=0.05)
+    await asyncio.sleep(0.1)
+    expect("ttl expires the key", await backend.get("expiring") is None)
+
+    await backend.delete("key")
+    expect("delete removes the key", await backend.get("key") is None)
+
+    await backend.set("a", b"1")
+    await backend.set("b", b"2")
+    await backend.clear()
+    expect("clear removes prefixed keys", await backend.get("a") is None)
+    expect(
+        "clear leaves other keys alone",
+        await client.get("foreign-key") == b"untouched",
+    )
+
+    stats = backend.stats()
+    expect("stats count hits and misses", (stats["hits"], stats["misses"]) == (1, 4))
+
+    received: List[str] = []
+    subscribed = asyncio.Event()
+
+    async def listen() -> None:
+        subscriber = backend.subscribe("channel")
+        pending = asyncio.ensure_future(subscriber.__anext__())
+        # Give the SUBSCRIBE a moment to register before publishing.
+        await asyncio.sleep(0.05)
+        subscribed.set()
+        received.append(await pending)
+        await subscriber.aclose()
+
+    listener = asyncio.create_task(listen())
+    await subscribed.wait()
+    await backend.publish("channel", "message")
+    await asyncio.wait_for(listener, timeout=1)
+    expect("publish reaches subscribers", received == ["message"])
+
+    return failures
+
+
+async def main(url: Optional[str]) -> int:
+    if url is None:
+        from fakeredis import FakeAsyncRedis
+
+        client = FakeAsyncRedis()
+    else:
+        from redis import asyncio as aioredis
+
+        client = aioredis.from_url(url)
+
+    backend = RedisCacheBackend(url or "", prefix="check:", client=client)
+    print(f"RedisCacheBackend against {url or 'fakeredis'}")
+    try:
+        failures = await check(backend, client)
+    finally:
+        await client.delete("foreign-key")
+        await backend.close()
+
+    if failures:
+        print(f"{len(failures)} check(s) failed")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Exercise RedisCacheBackend against fakeredis or a real server"
+    )
+    parser.add_argument(
+        "--url", help="Redis URL to check instead of the in-process fakeredis"
+    )
+    args = parser.parse_args()
+
+    sys.exit(asyncio.run(main(args.url)))
@@ -0,0 +1,46 @@
+import argparse
+import asyncio
+from pathlib import Path
+from typing import Optional
+
+from app.db import SessionLocal
+from app.services import car_data_export_service
+from app.utils.enums import ExportFormatEnum
+
+
+async def main(path: Path, export_format: ExportFormatEnum) -> None:
+    written = 0
+    async with SessionLocal() as db:
+        with path.open("wb") as file:
+            async for chunk in car_data_export_service.export_car_data(
+                db, export_format
+            ):
+                written += file.write(chunk)
+
+    print(f"Wrote {written:,} bytes of {export_format.value} to {path}")
+
+
+def _format_from_path(path: Path) -> Optional[ExportFormatEnum]:
+    try:
+        return ExportFormatEnum(path.suffix.lstrip("."))
+    except ValueError:
+        return None
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Snapshot the car data view to disk")
+    parser.add_argument("path", type=Path)
+    parser.add_argument(
+        "--format",
+        choices=[export_format.value for export_format in ExportFormatEnum],
+        help="Defaults to the format matching the file extension",
+    )
+    args = parser.parse_args()
+
+    export_format = (
+        ExportFormatEnum(args.format) if args.format else _format_from_path(args.path)
+    )
+    if export_format is None:
+        parser.error("could not infer --format from the file extension")
+
+    asyncio.run(main(args.path, export_format))
@@ -0,0 +1,25 @@
+import argparse
+import asyncio
+from pathlib import Path
+
+from app.db import SessionLocal
+from app.schemas.catalog_schemas import CatalogImport
+from app.services import catalog_import_service
+
+
+async def main(path: Path, start_chunk: int) -> None:
+    catalog = CatalogImport.model_validate_json(path.read_bytes())
+
+    async with SessionLocal() as db:
+        result = await catalog_import_service.import_catalog(catalog, db, start_chunk)
+
+    print(result.model_dump_json(indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Import a nested catalog document")
+    parser.add_argument("path", type=Path)
+    parser.add_argument("--start-chunk", type=int, default=0)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.path, args.start_chunk))
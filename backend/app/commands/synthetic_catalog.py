@@ -0,0 +1,73 @@
+import random
+from typing import Optional
+
+from sqlalchemy import select
+
+from app.db import SessionLocal
+from app.models.brand import Brand
+from app.schemas.catalog_schemas import (
+    BaseSpecificationImport,
+    BrandImport,
+    CarModelImport,
+    GenerationImport,
+    SubmodelImport,
+)
+from app.services import brand_service
+from app.utils.enums import FuelTypeEnum
+
+DRIVETRAINS = ["FWD", "RWD", "AWD"]
+TRANSMISSIONS = ["manual", "automatic", "dct", "cvt"]
+
+
+def build_spec(rng: random.Random) -> BaseSpecificationImport:
+    return BaseSpecificationImport(
+        year=rng.randint(1990, 2025),
+        fuel_type=rng.choice(list(FuelTypeEnum)),
+        horsepower=rng.randint(60, 700),
+        torque=rng.randint(90, 900),
+        transmission=rng.choice(TRANSMISSIONS),
+        drivetrain=rng.choice(DRIVETRAINS),
+        weight=rng.randint(900, 2600),
+        zero_to_100=round(rng.uniform(2.5, 15.0), 1),
+        top_speed=rng.randint(140, 330),
+    )
+
+
+def build_brand(
+    name: str, fanout: int, specs: int, rng: Optional[random.Random] = None
+) -> BrandImport:
+    rng = rng or random.Random(0)
+    return BrandImport(
+        name=name,
+        country="Benchmark",
+        models=[
+            CarModelImport(
+                name=f"{name}-m{m}",
+                submodels=[
+                    SubmodelImport(
+                        name=f"{name}-m{m}-s{s}",
+                        generations=[
+                            GenerationImport(
+                                name=f"{name}-m{m}-s{s}-g{g}",
+                                specs=[build_spec(rng) for _ in range(specs)],
+                            )
+                            for g in range(fanout)
+                        ],
+                    )
+                    for s in range(fanout)
+                ],
+            )
+            for m in range(fanout)
+        ],
+    )
+
+
+async def delete_brands(prefix: str) -> int:
+    async with SessionLocal() as db:
+        result = await db.execute(select(Brand.id).where(Brand.name.startswith(prefix)))
+        brand_ids = list(result.scalars())
+
+        for brand_id in brand_ids:
+            await brand_service.delete_brand(brand_id, db)
+
+    return len(brand_ids)
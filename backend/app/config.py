@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic import (
     PostgresDsn,
     computed_field,
@@ -17,8 +19,50 @@ class Settings(BaseSettings):
     DB_USER: str
     DB_PASSWORD: str = ""
     DB_NAME: str = ""
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_PRE_PING: bool = False
     JWT: str = ""
 
+    # Read by uvicorn and gunicorn as the default worker count.
+    WEB_CONCURRENCY: int = 1
+
+    BCRYPT_ROUNDS: int = 12
+    BCRYPT_MAX_WORKERS: int = 4
+    BCRYPT_BULK_MAX_WORKERS: int = 8
+
+    AUTH_CACHE_TTL_SECONDS: float = 30.0
+    AUTH_CACHE_MAX_SIZE: int = 10_000
+
+    # The memory backend is private to each process: its pub/sub, and with it
+    # catalog version and principal invalidations, never reaches the other
+    # workers. Run several workers on the redis backend.
+    CACHE_BACKEND: Literal["memory", "redis"] = "memory"
+    CACHE_REDIS_URL: str = "redis://localhost:6379/0"
+    CACHE_KEY_PREFIX: str = "catalog:"
+    CACHE_MEMORY_MAX_BYTES: int = 64 * 1024 * 1024
+
+    CATALOG_VERSION_TTL_SECONDS: float = 1.0
+    CATALOG_REPLICA_ENABLED: bool = True
+    CATALOG_REPLICA_RECONCILE_SECONDS: float = 30.0
+
+    RESPONSE_CACHE_TTL_SECONDS: float = 3600.0
+    RESPONSE_CACHE_COMPRESS: bool = True
+
+    COMPRESSION_MIN_BYTES: int = 1024
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4
+    COMPRESSION_ZSTD_LEVEL: int = 3
+
+    DEFAULT_PAGE_SIZE: int = 100
+    MAX_PAGE_SIZE: int = 1000
+
+    BULK_INSERT_BATCH_SIZE: int = 1000
+    EXPORT_ROW_GROUP_SIZE: int = 50_000
+    CATALOG_IMPORT_CHUNK_SIZE: int = 10
+
     @computed_field  # type: ignore[prop-decorator]
     @property
     def SQLALCHEMY_DATABASE_URI(self) -> PostgresDsn:
@@ -1,4 +1,8 @@
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, UTC
+from typing import List
 from uuid import UUID
 
 import jwt
@@ -7,9 +11,11 @@ from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.cache import cache_backend
 from app.db import get_db
 from app.repositories.user import UserRepository
-from app.models.user import User as UserModel
+from app.schemas.user_schemas import Principal
+from app.utils.cache import TTLCache
 from app.utils.enums import UserRoleEnum
 from app.config import settings
 
@@ -19,22 +25,64 @@ ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_DAYS = 5
 REFRESH_TOKEN_EXPIRE_DAYS = 30
 
+PRINCIPAL_INVALIDATION_CHANNEL = "principal-invalidation"
+
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login")
 
+logger = logging.getLogger(__name__)
+
+# bcrypt releases the GIL while hashing, so a small thread pool is enough to
+# keep it off the event loop and to cap how many hashes run at once.
+bcrypt_executor = ThreadPoolExecutor(
+    max_workers=settings.BCRYPT_MAX_WORKERS, thread_name_prefix="bcrypt"
+)
+
+# Bulk provisioning gets its own pool so thousands of queued hashes never sit
+# in front of interactive logins.
+bcrypt_bulk_executor = ThreadPoolExecutor(
+    max_workers=settings.BCRYPT_BULK_MAX_WORKERS, thread_name_prefix="bcrypt-bulk"
+)
+
+principal_cache = TTLCache(
+    max_size=settings.AUTH_CACHE_MAX_SIZE, ttl=settings.AUTH_CACHE_TTL_SECONDS
+)
 
-def hash_password(password: str) -> str:
+
+def _hash_password(password: str) -> str:
     password_bytes = password.encode('utf-8')
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
     hashed = bcrypt.hashpw(password_bytes, salt)
     return hashed.decode('utf-8')
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
+def _verify_password(plain_password: str, hashed_password: str) -> bool:
     password_bytes = plain_password.encode('utf-8')
     hashed_bytes = hashed_password.encode('utf-8')
     return bcrypt.checkpw(password_bytes, hashed_bytes)
 
 
+async def hash_password(password: str) -> str:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(bcrypt_executor, _hash_password, password)
+
+
+async def hash_passwords(passwords: List[str]) -> List[str]:
+    loop = asyncio.get_running_loop()
+    return await asyncio.gather(
+        *(
+            loop.run_in_executor(bcrypt_bulk_executor, _hash_password, password)
+            for password in passwords
+        )
+    )
+
+
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        bcrypt_executor, _verify_password, plain_password, hashed_password
+    )
+
+
 def create_access_token(user_id: UUID) -> str:
     payload = {
         "sub": str(user_id),
@@ -69,36 +117,67 @@ def verify_token(token: str) -> str:
         raise credentials_exception
 
 
+async def invalidate_principal(user_id: UUID) -> None:
+    principal_cache.delete(user_id)
+    # Other workers hold their own principal_cache; without this they would
+    # keep serving a deactivated or demoted user until the TTL runs out. Only
+    # the redis backend carries the message to other processes, the memory
+    # backend reaches this worker alone.
+    await cache_backend.publish(PRINCIPAL_INVALIDATION_CHANNEL, str(user_id))
+
+
+async def listen_for_principal_invalidations() -> None:
+    while True:
+        try:
+            async for message in cache_backend.subscribe(
+                PRINCIPAL_INVALIDATION_CHANNEL
+            ):
+                principal_cache.delete(UUID(message))
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception(
+                "Principal invalidation subscription failed, resubscribing"
+            )
+            await asyncio.sleep(1)
+
+
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
     db: AsyncSession = Depends(get_db)
-) -> UserModel:
-    user_id = verify_token(token)
-    user = await UserRepository.select_by_id(db, UUID(user_id))
-    
-    if user is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found"
-        )
+) -> Principal:
+    user_id = UUID(verify_token(token))
+    principal = principal_cache.get(user_id)
+
+    if principal is None:
+        user = await UserRepository.select_by_id(db, user_id)
+
+        if user is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="User not found"
+            )
+
+        principal = Principal.model_validate(user)
+        principal_cache.set(user_id, principal)
     
-    if not user.is_active:
+    if not principal.is_active:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Inactive user"
         )
     
-    return user
+    return principal
 
 
 async def get_current_active_user(
-    current_user: UserModel = Depends(get_current_user)
-) -> UserModel:
+    current_user: Principal = Depends(get_current_user)
+) -> Principal:
     return current_user
 
 
 async def require_role(required_role: UserRoleEnum):
-    async def role_checker(current_user: UserModel = Depends(get_current_user)) -> UserModel:
+    async def role_checker(current_user: Principal = Depends(get_current_user)) -> Principal:
         if current_user.role == UserRoleEnum.admin:
             return current_user
         
@@ -111,7 +190,7 @@ async def require_role(required_role: UserRoleEnum):
     return role_checker
 
 
-async def require_admin(current_user: UserModel = Depends(get_current_user)) -> UserModel:
+async def require_admin(current_user: Principal = Depends(get_current_user)) -> Principal:
     if current_user.role != UserRoleEnum.admin:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
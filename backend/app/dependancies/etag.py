@@ -0,0 +1,37 @@
+from typing import Optional
+
+from fastapi import Depends, HTTPException, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db import get_db
+from app.services.catalog_version_service import get_catalog_version, catalog_etag
+from app.utils.encoding import COMPRESSORS, encoded_etag
+
+
+def _matching_etag(if_none_match: str, etag: str) -> Optional[str]:
+    # Compressed responses carry the coding in their ETag, so any of the
+    # per-coding validators of the current version counts as a match.
+    current = {etag} | {encoded_etag(etag, encoding) for encoding in COMPRESSORS}
+    for candidate in (candidate.strip() for candidate in if_none_match.split(",")):
+        if candidate == "*":
+            return etag
+        if candidate.removeprefix("W/") in current:
+            return candidate.removeprefix("W/")
+    return None
+
+
+async def check_catalog_etag(
+    request: Request, response: Response, db: AsyncSession = Depends(get_db)
+) -> str:
+    etag = catalog_etag(await get_catalog_version(db))
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+
+    matched = _matching_etag(request.headers.get("if-none-match", ""), etag)
+    if matched is not None:
+        raise HTTPException(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={**headers, "ETag": matched},
+        )
+
+    response.headers.update(headers)
+    return etag
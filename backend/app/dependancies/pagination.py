@@ -0,0 +1,27 @@
+from fastapi import HTTPException, Query, status
+
+from app.schemas.pagination_schemas import PageParams
+from app.utils.pagination import decode_cursor
+from app.config import settings
+
+
+def get_page_params(
+    limit: int = Query(
+        settings.DEFAULT_PAGE_SIZE,
+        ge=1,
+        le=settings.MAX_PAGE_SIZE,
+        description="Page size",
+    ),
+    cursor: str | None = Query(
+        None, description="Opaque cursor from the X-Next-Cursor header"
+    ),
+    include_total: bool = Query(
+        False, description="Return the total row count in X-Total-Count"
+    ),
+) -> PageParams:
+    try:
+        decoded_cursor = decode_cursor(cursor) if cursor is not None else None
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    return PageParams(limit=limit, cursor=decoded_cursor, include_total=include_total)
@@ -0,0 +1,116 @@
+import json
+from dataclasses import dataclass
+from hashlib import sha256
+from typing import Any, Dict, Optional
+
+from fastapi import Depends, Request, Response
+from pydantic import TypeAdapter
+
+from app.cache import cache_backend
+from app.dependancies.etag import check_catalog_etag
+from app.utils.encoding import (
+    IDENTITY,
+    COMPRESSORS,
+    negotiate_encoding,
+    compress,
+    encoded_etag,
+)
+from app.config import settings
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    body: bytes
+    headers: Dict[str, str]
+
+    def to_bytes(self) -> bytes:
+        return json.dumps(self.headers).encode() + b"\n" + self.body
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "CachedResponse":
+        headers, _, body = data.partition(b"\n")
+        return cls(body=body, headers=json.loads(headers))
+
+
+class CachedRoute:
+    def __init__(self, key: str, accept_encoding: str, adapter: TypeAdapter):
+        self.key = key
+        self.accept_encoding = accept_encoding
+        self.adapter = adapter
+
+    def _encoding(self, body_size: int) -> str:
+        if (
+            not settings.RESPONSE_CACHE_COMPRESS
+            or body_size < settings.COMPRESSION_MIN_BYTES
+        ):
+            return IDENTITY
+        return negotiate_encoding(self.accept_encoding, COMPRESSORS)
+
+    async def _get(self, encoding: str) -> Optional[CachedResponse]:
+        data = await cache_backend.get(f"{self.key}:{encoding}")
+        return CachedResponse.from_bytes(data) if data is not None else None
+
+    async def _set(self, encoding: str, entry: CachedResponse) -> None:
+        await cache_backend.set(
+            f"{self.key}:{encoding}",
+            entry.to_bytes(),
+            ttl=settings.RESPONSE_CACHE_TTL_SECONDS,
+        )
+
+    async def _respond(self, identity: CachedResponse) -> Response:
+        encoding = self._encoding(len(identity.body))
+        entry = identity
+
+        if encoding != IDENTITY:
+            entry = await self._get(encoding)
+            if entry is None:
+                headers = {**identity.headers, "content-encoding": encoding}
+                if "etag" in headers:
+                    headers["etag"] = encoded_etag(headers["etag"], encoding)
+                entry = CachedResponse(
+                    body=compress(identity.body, encoding), headers=headers
+                )
+                await self._set(encoding, entry)
+
+        return Response(
+            content=entry.body,
+            media_type="application/json",
+            headers={**entry.headers, "vary": "Accept-Encoding"},
+        )
+
+    async def lookup(self) -> Optional[Response]:
+        identity = await self._get(IDENTITY)
+        if identity is None:
+            return None
+
+        return await self._respond(identity)
+
+    async def store(self, content: Any, response: Response) -> Response:
+        identity = CachedResponse(
+            body=self.adapter.dump_json(content),
+            headers={
+                name: value
+                for name, value in response.headers.items()
+                if name != "content-length"
+            },
+        )
+        await self._set(IDENTITY, identity)
+        return await self._respond(identity)
+
+
+def cached_response(response_type: Any):
+    adapter = TypeAdapter(response_type)
+
+    async def get_cached_route(
+        request: Request, etag: str = Depends(check_catalog_etag)
+    ) -> CachedRoute:
+        query = sorted(request.query_params.multi_items())
+        digest = sha256(json.dumps([request.url.path, query]).encode()).hexdigest()
+        version = etag.strip('"')
+        return CachedRoute(
+            f"response:{version}:{digest}",
+            request.headers.get("accept-encoding", ""),
+            adapter,
+        )
+
+    return get_cached_route
@@ -0,0 +1,6 @@
+class CatalogTreeRootNotFound(Exception):
+    pass
+
+
+class InvalidCatalogTreeDepth(Exception):
+    pass
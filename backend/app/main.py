@@ -1,16 +1,62 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager, suppress
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.cache import cache_backend
+from app.dependancies.auth import listen_for_principal_invalidations
+from app.middleware.compression import CompressionMiddleware
 from app.routers.main_router import main_router
+from app.services.catalog_version_service import listen_for_catalog_changes
+from app.services.catalog_replica_service import (
+    refresh_catalog_replica,
+    reconcile_catalog_replica,
+)
+from app.config import settings
+from app.utils.responses import FastJSONResponse
+
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if settings.CACHE_BACKEND == "memory" and settings.WEB_CONCURRENCY > 1:
+        logger.warning(
+            "Running %d workers on the memory cache backend: catalog version "
+            "and principal invalidations stay inside each worker until their "
+            "TTL expires. Set CACHE_BACKEND=redis to share them.",
+            settings.WEB_CONCURRENCY,
+        )
+
+    tasks = [
+        asyncio.create_task(listen_for_catalog_changes()),
+        asyncio.create_task(listen_for_principal_invalidations()),
+    ]
+    if settings.CATALOG_REPLICA_ENABLED:
+        await refresh_catalog_replica()
+        tasks.append(asyncio.create_task(reconcile_catalog_replica()))
+
+    yield
+
+    for task in tasks:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+    await cache_backend.close()
 
 
-app = FastAPI()
+app = FastAPI(lifespan=lifespan, default_response_class=FastJSONResponse)
 app.include_router(main_router)
 
+app.add_middleware(CompressionMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "X-Total-Count", "ETag"],
 )
@@ -1,6 +1,6 @@
 from uuid import uuid4
 
-from sqlalchemy import Column, String, Integer, Float, UUID, ForeignKey, Enum
+from sqlalchemy import Column, String, Integer, Float, UUID, ForeignKey, Enum, Index
 from sqlalchemy.orm import relationship
 
 from app.db import Base
@@ -9,6 +9,9 @@ from app.utils.enums import FuelTypeEnum
 
 class BaseSpecification(Base):
     __tablename__ = "base_specs"
+    __table_args__ = (
+        Index("ix_base_specs_generation_id_year", "generation_id", "year"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
     generation_id = Column(
@@ -1,6 +1,6 @@
 from uuid import uuid4
 
-from sqlalchemy import Column, String, UUID
+from sqlalchemy import Column, String, UUID, Index
 from sqlalchemy.orm import relationship
 
 from app.db import Base
@@ -8,11 +8,22 @@ from app.db import Base
 
 class Brand(Base):
     __tablename__ = "brands"
+    __table_args__ = (
+        Index(
+            "ix_brands_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
     name = Column(String, unique=True, index=True, nullable=False)
     country = Column(String)
 
     models = relationship(
-        "CarModel", back_populates="brand", cascade="all, delete-orphan"
+        "CarModel",
+        back_populates="brand",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
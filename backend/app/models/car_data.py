@@ -0,0 +1,69 @@
+from sqlalchemy import (
+    Column,
+    String,
+    Integer,
+    Float,
+    UUID,
+    ForeignKey,
+    Enum,
+    Index,
+    text,
+)
+
+from app.db import Base
+from app.utils.enums import CarDataSortEnum, FuelTypeEnum
+
+
+class CarData(Base):
+    __tablename__ = "car_data"
+    # Search sorts descending with NULLS LAST. A backward scan of the
+    # single-column indexes yields DESC NULLS FIRST, so every descending sort
+    # gets an index in exactly that order, with spec_id as the tiebreaker.
+    __table_args__ = (
+        Index("ix_car_data_spec_id_desc", text("spec_id DESC NULLS LAST")),
+        *(
+            Index(
+                f"ix_car_data_{sort.value}_desc",
+                text(f"{sort.value} DESC NULLS LAST"),
+                "spec_id",
+            )
+            for sort in CarDataSortEnum
+            if sort != CarDataSortEnum.spec_id
+        ),
+    )
+
+    spec_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("base_specs.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+
+    brand_id = Column(UUID(as_uuid=True), nullable=False, index=True)
+    brand_name = Column(String, nullable=False, index=True)
+    brand_country = Column(String)
+
+    model_id = Column(UUID(as_uuid=True), nullable=False, index=True)
+    model_name = Column(String, nullable=False, index=True)
+    model_description = Column(String)
+
+    submodel_id = Column(UUID(as_uuid=True), nullable=False, index=True)
+    submodel_name = Column(String, nullable=False)
+
+    generation_id = Column(UUID(as_uuid=True), nullable=False, index=True)
+    generation_name = Column(String, nullable=False)
+    generation_year_from = Column(Integer)
+    generation_year_to = Column(Integer)
+
+    spec_year = Column(Integer, index=True)
+    engine = Column(String)
+    engine_displacement = Column(Integer)
+    fuel_type = Column(Enum(FuelTypeEnum), nullable=False, index=True)
+    horsepower = Column(Integer, index=True)
+    torque = Column(Integer, index=True)
+    transmission = Column(String, index=True)
+    drivetrain = Column(String, index=True)
+    doors = Column(Integer)
+    seats = Column(Integer)
+    weight = Column(Integer, index=True)
+    zero_to_100 = Column(Float, index=True)
+    top_speed = Column(Integer, index=True)
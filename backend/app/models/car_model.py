@@ -1,5 +1,5 @@
 from uuid import uuid4
-from sqlalchemy import Column, String, UUID, ForeignKey
+from sqlalchemy import Column, String, UUID, ForeignKey, Index
 from sqlalchemy.orm import relationship
 
 from app.db import Base
@@ -7,15 +7,29 @@ from app.db import Base
 
 class CarModel(Base):
     __tablename__ = "models"
+    __table_args__ = (
+        Index(
+            "ix_models_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
     brand_id = Column(
-        UUID(as_uuid=True), ForeignKey("brands.id", ondelete="CASCADE"), nullable=False
+        UUID(as_uuid=True),
+        ForeignKey("brands.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
     )
     name = Column(String, nullable=False, unique=True, index=True)
     description = Column(String)
 
     brand = relationship("Brand", back_populates="models")
     submodels = relationship(
-        "Submodel", back_populates="model", cascade="all, delete-orphan"
+        "Submodel",
+        back_populates="model",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
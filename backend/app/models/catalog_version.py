@@ -0,0 +1,10 @@
+from sqlalchemy import Column, Integer, BigInteger
+
+from app.db import Base
+
+
+class CatalogVersion(Base):
+    __tablename__ = "catalog_version"
+
+    id = Column(Integer, primary_key=True)
+    version = Column(BigInteger, nullable=False, default=0)
@@ -1,6 +1,6 @@
 from uuid import uuid4
 
-from sqlalchemy import Column, String, Integer, UUID, ForeignKey
+from sqlalchemy import Column, String, Integer, UUID, ForeignKey, Index
 from sqlalchemy.orm import relationship
 
 from app.db import Base
@@ -8,12 +8,21 @@ from app.db import Base
 
 class Generation(Base):
     __tablename__ = "generations"
+    __table_args__ = (
+        Index(
+            "ix_generations_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
     submodel_id = Column(
         UUID(as_uuid=True),
         ForeignKey("submodels.id", ondelete="CASCADE"),
         nullable=False,
+        index=True,
     )
 
     name = Column(String, nullable=False, unique=True, index=True)
@@ -22,5 +31,8 @@ class Generation(Base):
 
     submodel = relationship("Submodel", back_populates="generations")
     specs = relationship(
-        "BaseSpecification", back_populates="generation", cascade="all, delete-orphan"
+        "BaseSpecification",
+        back_populates="generation",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
@@ -1,6 +1,6 @@
 from uuid import uuid4
 
-from sqlalchemy import Column, String, UUID, ForeignKey
+from sqlalchemy import Column, String, UUID, ForeignKey, Index
 from sqlalchemy.orm import relationship
 
 from app.db import Base
@@ -8,14 +8,28 @@ from app.db import Base
 
 class Submodel(Base):
     __tablename__ = "submodels"
+    __table_args__ = (
+        Index(
+            "ix_submodels_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
     model_id = Column(
-        UUID(as_uuid=True), ForeignKey("models.id", ondelete="CASCADE"), nullable=False
+        UUID(as_uuid=True),
+        ForeignKey("models.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
     )
     name = Column(String, nullable=False, unique=True, index=True)
 
     model = relationship("CarModel", back_populates="submodels")
     generations = relationship(
-        "Generation", back_populates="submodel", cascade="all, delete-orphan"
+        "Generation",
+        back_populates="submodel",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
@@ -2,7 +2,7 @@ from typing import List, Optional
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, insert, update, func, delete
 
 from app.models.base_spec import BaseSpecification
 
@@ -16,10 +16,21 @@ class BaseSpecificationRepository:
         return result.scalar_one_or_none()
 
     @staticmethod
-    async def select_all(db: AsyncSession) -> List[BaseSpecification]:
-        result = await db.execute(select(BaseSpecification))
+    async def select_all(
+        db: AsyncSession, limit: Optional[int] = None, after: Optional[UUID] = None
+    ) -> List[BaseSpecification]:
+        query = select(BaseSpecification).order_by(BaseSpecification.id)
+        if after is not None:
+            query = query.where(BaseSpecification.id > after)
+
+        result = await db.execute(query.limit(limit))
         return list(result.scalars().all())
 
+    @staticmethod
+    async def count(db: AsyncSession) -> int:
+        result = await db.execute(select(func.count()).select_from(BaseSpecification))
+        return result.scalar_one()
+
     @staticmethod
     async def select_by_generation_id(
         db: AsyncSession, generation_id: UUID
@@ -45,33 +56,43 @@ class BaseSpecificationRepository:
 
     @staticmethod
     async def insert(db: AsyncSession, obj_in: dict) -> BaseSpecification:
-        base_spec = BaseSpecification(**obj_in)
-        db.add(base_spec)
-        await db.commit()
-        await db.refresh(base_spec)
-        return base_spec
+        result = await db.execute(
+            insert(BaseSpecification).values(**obj_in).returning(BaseSpecification)
+        )
+        return result.scalar_one()
 
     @staticmethod
-    async def update(
-        db: AsyncSession, db_obj: BaseSpecification, obj_in: dict
-    ) -> BaseSpecification:
-        for field, value in obj_in.items():
-            setattr(db_obj, field, value)
+    async def select_by_generation_ids(
+        db: AsyncSession, generation_ids: List[UUID]
+    ) -> List[BaseSpecification]:
+        result = await db.execute(
+            select(BaseSpecification).where(
+                BaseSpecification.generation_id.in_(generation_ids)
+            )
+        )
+        return list(result.scalars().all())
 
-        db.add(db_obj)
-        await db.commit()
-        await db.refresh(db_obj)
-        return db_obj
+    @staticmethod
+    async def insert_many(db: AsyncSession, objs_in: List[dict]) -> None:
+        await db.execute(insert(BaseSpecification), objs_in)
 
     @staticmethod
-    async def delete(db: AsyncSession, id: UUID) -> Optional[BaseSpecification]:
+    async def update(
+        db: AsyncSession, id: UUID, obj_in: dict
+    ) -> Optional[BaseSpecification]:
         result = await db.execute(
-            select(BaseSpecification).where(BaseSpecification.id == id)
+            update(BaseSpecification)
+            .where(BaseSpecification.id == id)
+            .values(**obj_in)
+            .returning(BaseSpecification)
         )
-        base_spec = result.scalar_one_or_none()
-
-        if base_spec:
-            await db.delete(base_spec)
-            await db.commit()
+        return result.scalar_one_or_none()
 
-        return base_spec
+    @staticmethod
+    async def delete(db: AsyncSession, id: UUID) -> Optional[BaseSpecification]:
+        result = await db.execute(
+            delete(BaseSpecification)
+            .where(BaseSpecification.id == id)
+            .returning(BaseSpecification)
+        )
+        return result.scalar_one_or_none()
@@ -1,7 +1,9 @@
-from typing import List, Optional
+from typing import Dict, List, Optional
+from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, insert, update, func, delete
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from app.models.brand import Brand
 
@@ -13,10 +15,21 @@ class BrandRepository:
         return result.scalar_one_or_none()
 
     @staticmethod
-    async def select_all(db: AsyncSession) -> List[Brand]:
-        result = await db.execute(select(Brand))
+    async def select_all(
+        db: AsyncSession, limit: Optional[int] = None, after: Optional[UUID] = None
+    ) -> List[Brand]:
+        query = select(Brand).order_by(Brand.id)
+        if after is not None:
+            query = query.where(Brand.id > after)
+
+        result = await db.execute(query.limit(limit))
         return list(result.scalars().all())
 
+    @staticmethod
+    async def count(db: AsyncSession) -> int:
+        result = await db.execute(select(func.count()).select_from(Brand))
+        return result.scalar_one()
+
     @staticmethod
     async def select_by_name(db: AsyncSession, name: str) -> Optional[Brand]:
         result = await db.execute(select(Brand).where(Brand.name == name))
@@ -24,29 +37,29 @@ class BrandRepository:
 
     @staticmethod
     async def insert(db: AsyncSession, obj_in: dict) -> Brand:
-        brand = Brand(**obj_in)
-        db.add(brand)
-        await db.commit()
-        await db.refresh(brand)
-        return brand
+        result = await db.execute(insert(Brand).values(**obj_in).returning(Brand))
+        return result.scalar_one()
 
     @staticmethod
-    async def update(db: AsyncSession, db_obj: Brand, obj_in: dict) -> Brand:
-        for field, value in obj_in.items():
-            setattr(db_obj, field, value)
+    async def upsert_many(db: AsyncSession, objs_in: List[dict]) -> Dict[str, UUID]:
+        stmt = pg_insert(Brand).values(objs_in)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Brand.name],
+            set_={
+                "country": stmt.excluded.country,
+            },
+        ).returning(Brand.name, Brand.id)
+        result = await db.execute(stmt)
+        return {name: id for name, id in result.all()}
 
-        db.add(db_obj)
-        await db.commit()
-        await db.refresh(db_obj)
-        return db_obj
+    @staticmethod
+    async def update(db: AsyncSession, id: UUID, obj_in: dict) -> Optional[Brand]:
+        result = await db.execute(
+            update(Brand).where(Brand.id == id).values(**obj_in).returning(Brand)
+        )
+        return result.scalar_one_or_none()
 
     @staticmethod
     async def delete(db: AsyncSession, id) -> Optional[Brand]:
-        result = await db.execute(select(Brand).where(Brand.id == id))
-        brand = result.scalar_one_or_none()
-
-        if brand:
-            await db.delete(brand)
-            await db.commit()
-
-        return brand
+        result = await db.execute(delete(Brand).where(Brand.id == id).returning(Brand))
+        return result.scalar_one_or_none()
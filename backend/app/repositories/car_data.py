@@ -1,22 +1,231 @@
+from typing import AsyncIterator, Optional, Sequence
+from uuid import UUID
+
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from sqlalchemy.orm import joinedload
+from sqlalchemy import select, insert, delete, cast, func, String, Row
 
+from app.models.car_data import CarData
+from app.schemas.car_data_schemas import CarDataFilter
+from app.utils.enums import CarDataSortEnum, SortOrderEnum
 from app.models.base_spec import BaseSpecification
 from app.models.generation import Generation
 from app.models.submodel import Submodel
 from app.models.car_model import CarModel
+from app.models.brand import Brand
+
+
+CAR_DATA_FACETS = {
+    "fuel_type": CarData.fuel_type,
+    "drivetrain": CarData.drivetrain,
+    "transmission": CarData.transmission,
+    "brand_name": CarData.brand_name,
+    "spec_year": CarData.spec_year,
+}
+
+CAR_DATA_SCOPES = {
+    "brand_id": (CarData.brand_id, Brand.id),
+    "model_id": (CarData.model_id, CarModel.id),
+    "submodel_id": (CarData.submodel_id, Submodel.id),
+    "generation_id": (CarData.generation_id, Generation.id),
+    "spec_id": (CarData.spec_id, BaseSpecification.id),
+}
 
 
 class CarDataRepository:
     @staticmethod
-    async def select_all_car_data(db: AsyncSession) -> list[BaseSpecification]:
+    def _apply_filters(query, filters: CarDataFilter):
+        for column, values in (
+            (CarData.brand_name, filters.brand_name),
+            (CarData.model_name, filters.model_name),
+            (CarData.fuel_type, filters.fuel_type),
+            (CarData.drivetrain, filters.drivetrain),
+            (CarData.transmission, filters.transmission),
+        ):
+            if values:
+                query = query.where(column.in_(values))
+
+        for column, low, high in (
+            (CarData.spec_year, filters.year_min, filters.year_max),
+            (CarData.horsepower, filters.horsepower_min, filters.horsepower_max),
+            (CarData.torque, filters.torque_min, filters.torque_max),
+            (CarData.weight, filters.weight_min, filters.weight_max),
+            (CarData.zero_to_100, filters.zero_to_100_min, filters.zero_to_100_max),
+            (CarData.top_speed, filters.top_speed_min, filters.top_speed_max),
+        ):
+            if low is not None:
+                query = query.where(column >= low)
+            if high is not None:
+                query = query.where(column <= high)
+
+        return query
+
+    @staticmethod
+    def _select_source():
+        return (
+            select(
+                BaseSpecification.id,
+                Brand.id,
+                Brand.name,
+                Brand.country,
+                CarModel.id,
+                CarModel.name,
+                CarModel.description,
+                Submodel.id,
+                Submodel.name,
+                Generation.id,
+                Generation.name,
+                Generation.year_from,
+                Generation.year_to,
+                BaseSpecification.year,
+                BaseSpecification.engine,
+                BaseSpecification.engine_displacement,
+                BaseSpecification.fuel_type,
+                BaseSpecification.horsepower,
+                BaseSpecification.torque,
+                BaseSpecification.transmission,
+                BaseSpecification.drivetrain,
+                BaseSpecification.doors,
+                BaseSpecification.seats,
+                BaseSpecification.weight,
+                BaseSpecification.zero_to_100,
+                BaseSpecification.top_speed,
+            )
+            .select_from(Brand)
+            .join(CarModel, CarModel.brand_id == Brand.id)
+            .join(Submodel, Submodel.model_id == CarModel.id)
+            .join(Generation, Generation.submodel_id == Submodel.id)
+            .join(BaseSpecification, BaseSpecification.generation_id == Generation.id)
+        )
+
+    @staticmethod
+    def _select_columns():
+        return select(
+            cast(CarData.brand_id, String).label("brand_id"),
+            CarData.brand_name,
+            CarData.brand_country,
+            cast(CarData.model_id, String).label("model_id"),
+            CarData.model_name,
+            CarData.model_description,
+            cast(CarData.submodel_id, String).label("submodel_id"),
+            CarData.submodel_name,
+            cast(CarData.generation_id, String).label("generation_id"),
+            CarData.generation_name,
+            CarData.generation_year_from,
+            CarData.generation_year_to,
+            cast(CarData.spec_id, String).label("spec_id"),
+            CarData.spec_year,
+            CarData.engine,
+            CarData.engine_displacement,
+            CarData.fuel_type,
+            CarData.horsepower,
+            CarData.torque,
+            CarData.transmission,
+            CarData.drivetrain,
+            CarData.doors,
+            CarData.seats,
+            CarData.weight,
+            CarData.zero_to_100,
+            CarData.top_speed,
+        )
+
+    @staticmethod
+    def columns() -> list:
+        return list(CarDataRepository._select_columns().selected_columns)
+
+    @staticmethod
+    def _select_car_data(after: Optional[UUID] = None):
+        query = CarDataRepository._select_columns().order_by(CarData.spec_id)
+        if after is not None:
+            query = query.where(CarData.spec_id > after)
+        return query
+
+    @staticmethod
+    async def select_car_data_page(
+        db: AsyncSession, limit: int, after: Optional[UUID] = None
+    ) -> list[Row]:
+        result = await db.execute(
+            CarDataRepository._select_car_data(after).limit(limit)
+        )
+        return list(result.all())
+
+    @staticmethod
+    async def count(db: AsyncSession) -> int:
+        result = await db.execute(select(func.count()).select_from(CarData))
+        return result.scalar_one()
+
+    @staticmethod
+    async def search(
+        db: AsyncSession,
+        filters: CarDataFilter,
+        sort: CarDataSortEnum,
+        order: SortOrderEnum,
+        limit: int,
+        offset: int = 0,
+    ) -> list[Row]:
+        sort_column = getattr(CarData, sort.value)
+        sort_column = (
+            sort_column.desc() if order == SortOrderEnum.desc else sort_column.asc()
+        )
+
+        query = CarDataRepository._apply_filters(
+            CarDataRepository._select_columns(), filters
+        )
         result = await db.execute(
-            select(BaseSpecification).options(
-                joinedload(BaseSpecification.generation)
-                .joinedload(Generation.submodel)
-                .joinedload(Submodel.model)
-                .joinedload(CarModel.brand)
+            query.order_by(sort_column.nulls_last(), CarData.spec_id)
+            .limit(limit)
+            .offset(offset)
+        )
+        return list(result.all())
+
+    @staticmethod
+    async def count_matching(db: AsyncSession, filters: CarDataFilter) -> int:
+        query = CarDataRepository._apply_filters(
+            select(func.count()).select_from(CarData), filters
+        )
+        result = await db.execute(query)
+        return result.scalar_one()
+
+    @staticmethod
+    async def select_facet_counts(
+        db: AsyncSession, filters: CarDataFilter
+    ) -> list[Row]:
+        columns = list(CAR_DATA_FACETS.values())
+        query = select(
+            *columns,
+            *(
+                func.grouping(column).label(f"{name}_grouping")
+                for name, column in CAR_DATA_FACETS.items()
+            ),
+            func.count().label("count"),
+        ).select_from(CarData)
+        query = CarDataRepository._apply_filters(query, filters).group_by(
+            func.grouping_sets(*columns)
+        )
+        result = await db.execute(query)
+        return list(result.all())
+
+    @staticmethod
+    async def stream_car_data(
+        db: AsyncSession, after: Optional[UUID] = None, batch_size: int = 1000
+    ) -> AsyncIterator[Row]:
+        result = await db.stream(
+            CarDataRepository._select_car_data(after).execution_options(
+                yield_per=batch_size
+            )
+        )
+        async for row in result:
+            yield row
+
+    @staticmethod
+    async def refresh(db: AsyncSession, scope: str, ids: Sequence[UUID]) -> None:
+        # Never commits: the rewrite has to land in the same transaction as
+        # the catalog write it mirrors, which bump_catalog_version commits.
+        car_data_column, source_column = CAR_DATA_SCOPES[scope]
+
+        await db.execute(delete(CarData).where(car_data_column.in_(ids)))
+        await db.execute(
+            insert(CarData).from_select(
+                [column.name for column in CarData.__table__.columns],
+                CarDataRepository._select_source().where(source_column.in_(ids)),
             )
         )
-        return list(result.unique().scalars().all())
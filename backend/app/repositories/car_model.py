@@ -1,8 +1,9 @@
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, insert, update, func, delete
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from app.models.car_model import CarModel
 
@@ -14,10 +15,21 @@ class CarModelRepository:
         return result.scalar_one_or_none()
 
     @staticmethod
-    async def select_all(db: AsyncSession) -> List[CarModel]:
-        result = await db.execute(select(CarModel))
+    async def select_all(
+        db: AsyncSession, limit: Optional[int] = None, after: Optional[UUID] = None
+    ) -> List[CarModel]:
+        query = select(CarModel).order_by(CarModel.id)
+        if after is not None:
+            query = query.where(CarModel.id > after)
+
+        result = await db.execute(query.limit(limit))
         return list(result.scalars().all())
 
+    @staticmethod
+    async def count(db: AsyncSession) -> int:
+        result = await db.execute(select(func.count()).select_from(CarModel))
+        return result.scalar_one()
+
     @staticmethod
     async def select_by_brand_id(db: AsyncSession, brand_id: UUID) -> List[CarModel]:
         result = await db.execute(select(CarModel).where(CarModel.brand_id == brand_id))
@@ -34,29 +46,38 @@ class CarModelRepository:
 
     @staticmethod
     async def insert(db: AsyncSession, obj_in: dict) -> CarModel:
-        car_model = CarModel(**obj_in)
-        db.add(car_model)
-        await db.commit()
-        await db.refresh(car_model)
-        return car_model
+        result = await db.execute(insert(CarModel).values(**obj_in).returning(CarModel))
+        return result.scalar_one()
 
     @staticmethod
-    async def update(db: AsyncSession, db_obj: CarModel, obj_in: dict) -> CarModel:
-        for field, value in obj_in.items():
-            setattr(db_obj, field, value)
+    async def upsert_many(
+        db: AsyncSession, objs_in: List[dict]
+    ) -> Dict[str, Tuple[UUID, UUID]]:
+        # Existing models are only updated under the brand they already
+        # belong to; a name owned by another brand is left untouched and
+        # missing from the result.
+        stmt = pg_insert(CarModel).values(objs_in)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[CarModel.name],
+            set_={"description": stmt.excluded.description},
+            where=CarModel.brand_id == stmt.excluded.brand_id,
+        ).returning(CarModel.name, CarModel.id, CarModel.brand_id)
+        result = await db.execute(stmt)
+        return {name: (id, brand_id) for name, id, brand_id in result.all()}
 
-        db.add(db_obj)
-        await db.commit()
-        await db.refresh(db_obj)
-        return db_obj
+    @staticmethod
+    async def update(db: AsyncSession, id: UUID, obj_in: dict) -> Optional[CarModel]:
+        result = await db.execute(
+            update(CarModel)
+            .where(CarModel.id == id)
+            .values(**obj_in)
+            .returning(CarModel)
+        )
+        return result.scalar_one_or_none()
 
     @staticmethod
     async def delete(db: AsyncSession, id: UUID) -> Optional[CarModel]:
-        result = await db.execute(select(CarModel).where(CarModel.id == id))
-        car_model = result.scalar_one_or_none()
-
-        if car_model:
-            await db.delete(car_model)
-            await db.commit()
-
-        return car_model
+        result = await db.execute(
+            delete(CarModel).where(CarModel.id == id).returning(CarModel)
+        )
+        return result.scalar_one_or_none()
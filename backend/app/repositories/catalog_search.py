@@ -0,0 +1,101 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import (
+    select,
+    union_all,
+    literal,
+    null,
+    cast,
+    case,
+    or_,
+    func,
+    String,
+    UUID,
+    Row,
+)
+
+from app.models.brand import Brand
+from app.models.car_model import CarModel
+from app.models.submodel import Submodel
+from app.models.generation import Generation
+from app.utils.enums import CatalogLevelEnum
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+class CatalogSearchRepository:
+    @staticmethod
+    def _select_level(level: CatalogLevelEnum, name_column, q: str, limit: int, *path):
+        prefix_match = name_column.ilike(_escape_like(q) + "%", escape="\\")
+        score = func.similarity(name_column, q) + case((prefix_match, 1.0), else_=0.0)
+
+        path_columns = list(path) + [cast(null(), UUID), cast(null(), String)] * (
+            3 - len(path) // 2
+        )
+
+        return (
+            select(
+                literal(level.value).label("level"),
+                name_column.table.c.id.label("id"),
+                name_column.label("name"),
+                score.label("score"),
+                path_columns[0].label("brand_id"),
+                path_columns[1].label("brand_name"),
+                path_columns[2].label("model_id"),
+                path_columns[3].label("model_name"),
+                path_columns[4].label("submodel_id"),
+                path_columns[5].label("submodel_name"),
+            )
+            .where(or_(prefix_match, name_column.op("%")(q)))
+            .order_by(score.desc())
+            .limit(limit)
+        )
+
+    @staticmethod
+    async def search(db: AsyncSession, q: str, limit: int) -> list[Row]:
+        brands = CatalogSearchRepository._select_level(
+            CatalogLevelEnum.brand, Brand.name, q, limit
+        )
+        models = CatalogSearchRepository._select_level(
+            CatalogLevelEnum.model, CarModel.name, q, limit, Brand.id, Brand.name
+        ).join(Brand, Brand.id == CarModel.brand_id)
+        submodels = (
+            CatalogSearchRepository._select_level(
+                CatalogLevelEnum.submodel,
+                Submodel.name,
+                q,
+                limit,
+                Brand.id,
+                Brand.name,
+                CarModel.id,
+                CarModel.name,
+            )
+            .join(CarModel, CarModel.id == Submodel.model_id)
+            .join(Brand, Brand.id == CarModel.brand_id)
+        )
+        generations = (
+            CatalogSearchRepository._select_level(
+                CatalogLevelEnum.generation,
+                Generation.name,
+                q,
+                limit,
+                Brand.id,
+                Brand.name,
+                CarModel.id,
+                CarModel.name,
+                Submodel.id,
+                Submodel.name,
+            )
+            .join(Submodel, Submodel.id == Generation.submodel_id)
+            .join(CarModel, CarModel.id == Submodel.model_id)
+            .join(Brand, Brand.id == CarModel.brand_id)
+        )
+
+        matches = union_all(brands, models, submodels, generations).subquery()
+        result = await db.execute(
+            select(matches)
+            .order_by(matches.c.score.desc(), matches.c.name)
+            .limit(limit)
+        )
+        return list(result.all())
@@ -0,0 +1,47 @@
+from typing import List, Optional
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
+
+from app.models.brand import Brand
+from app.models.car_model import CarModel
+from app.models.submodel import Submodel
+
+
+class CatalogTreeRepository:
+    @staticmethod
+    async def select_tree(
+        db: AsyncSession,
+        levels: int,
+        brand_id: Optional[UUID] = None,
+        model_id: Optional[UUID] = None,
+    ) -> List[Brand]:
+        query = select(Brand).order_by(Brand.name)
+
+        if brand_id is not None:
+            query = query.where(Brand.id == brand_id)
+
+        models = Brand.models
+        if model_id is not None:
+            query = query.where(
+                Brand.id
+                == select(CarModel.brand_id)
+                .where(CarModel.id == model_id)
+                .scalar_subquery()
+            )
+            models = Brand.models.and_(CarModel.id == model_id)
+
+        # One SELECT ... WHERE parent_id IN (...) per level, however many
+        # brands or models the tree spans.
+        if levels > 1:
+            option = selectinload(models)
+            if levels > 2:
+                option = option.selectinload(CarModel.submodels)
+            if levels > 3:
+                option = option.selectinload(Submodel.generations)
+            query = query.options(option)
+
+        result = await db.execute(query)
+        return list(result.scalars().all())
@@ -0,0 +1,28 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update
+
+from app.models.catalog_version import CatalogVersion
+
+
+CATALOG_VERSION_ID = 1
+
+
+class CatalogVersionRepository:
+    @staticmethod
+    async def select_version(db: AsyncSession) -> int:
+        result = await db.execute(
+            select(CatalogVersion.version).where(
+                CatalogVersion.id == CATALOG_VERSION_ID
+            )
+        )
+        return result.scalar_one()
+
+    @staticmethod
+    async def increment(db: AsyncSession) -> int:
+        result = await db.execute(
+            update(CatalogVersion)
+            .where(CatalogVersion.id == CATALOG_VERSION_ID)
+            .values(version=CatalogVersion.version + 1)
+            .returning(CatalogVersion.version)
+        )
+        return result.scalar_one()
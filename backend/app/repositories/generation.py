@@ -1,8 +1,9 @@
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, insert, update, func, delete
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from app.models.generation import Generation
 
@@ -14,10 +15,26 @@ class GenerationRepository:
         return result.scalar_one_or_none()
 
     @staticmethod
-    async def select_all(db: AsyncSession) -> List[Generation]:
-        result = await db.execute(select(Generation))
+    async def select_all(
+        db: AsyncSession, limit: Optional[int] = None, after: Optional[UUID] = None
+    ) -> List[Generation]:
+        query = select(Generation).order_by(Generation.id)
+        if after is not None:
+            query = query.where(Generation.id > after)
+
+        result = await db.execute(query.limit(limit))
         return list(result.scalars().all())
 
+    @staticmethod
+    async def count(db: AsyncSession) -> int:
+        result = await db.execute(select(func.count()).select_from(Generation))
+        return result.scalar_one()
+
+    @staticmethod
+    async def select_existing_ids(db: AsyncSession, ids: Iterable[UUID]) -> Set[UUID]:
+        result = await db.execute(select(Generation.id).where(Generation.id.in_(ids)))
+        return set(result.scalars().all())
+
     @staticmethod
     async def select_by_submodel_id(
         db: AsyncSession, submodel_id: UUID
@@ -40,29 +57,40 @@ class GenerationRepository:
 
     @staticmethod
     async def insert(db: AsyncSession, obj_in: dict) -> Generation:
-        generation = Generation(**obj_in)
-        db.add(generation)
-        await db.commit()
-        await db.refresh(generation)
-        return generation
+        result = await db.execute(
+            insert(Generation).values(**obj_in).returning(Generation)
+        )
+        return result.scalar_one()
 
     @staticmethod
-    async def update(db: AsyncSession, db_obj: Generation, obj_in: dict) -> Generation:
-        for field, value in obj_in.items():
-            setattr(db_obj, field, value)
+    async def upsert_many(
+        db: AsyncSession, objs_in: List[dict]
+    ) -> Dict[str, Tuple[UUID, UUID]]:
+        stmt = pg_insert(Generation).values(objs_in)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Generation.name],
+            set_={
+                "year_from": stmt.excluded.year_from,
+                "year_to": stmt.excluded.year_to,
+            },
+            where=Generation.submodel_id == stmt.excluded.submodel_id,
+        ).returning(Generation.name, Generation.id, Generation.submodel_id)
+        result = await db.execute(stmt)
+        return {name: (id, submodel_id) for name, id, submodel_id in result.all()}
 
-        db.add(db_obj)
-        await db.commit()
-        await db.refresh(db_obj)
-        return db_obj
+    @staticmethod
+    async def update(db: AsyncSession, id: UUID, obj_in: dict) -> Optional[Generation]:
+        result = await db.execute(
+            update(Generation)
+            .where(Generation.id == id)
+            .values(**obj_in)
+            .returning(Generation)
+        )
+        return result.scalar_one_or_none()
 
     @staticmethod
     async def delete(db: AsyncSession, id: UUID) -> Optional[Generation]:
-        result = await db.execute(select(Generation).where(Generation.id == id))
-        generation = result.scalar_one_or_none()
-
-        if generation:
-            await db.delete(generation)
-            await db.commit()
-
-        return generation
+        result = await db.execute(
+            delete(Generation).where(Generation.id == id).returning(Generation)
+        )
+        return result.scalar_one_or_none()
@@ -1,8 +1,9 @@
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, insert, update, func, delete
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from app.models.submodel import Submodel
 
@@ -14,10 +15,21 @@ class SubmodelRepository:
         return result.scalar_one_or_none()
 
     @staticmethod
-    async def select_all(db: AsyncSession) -> List[Submodel]:
-        result = await db.execute(select(Submodel))
+    async def select_all(
+        db: AsyncSession, limit: Optional[int] = None, after: Optional[UUID] = None
+    ) -> List[Submodel]:
+        query = select(Submodel).order_by(Submodel.id)
+        if after is not None:
+            query = query.where(Submodel.id > after)
+
+        result = await db.execute(query.limit(limit))
         return list(result.scalars().all())
 
+    @staticmethod
+    async def count(db: AsyncSession) -> int:
+        result = await db.execute(select(func.count()).select_from(Submodel))
+        return result.scalar_one()
+
     @staticmethod
     async def select_by_model_id(db: AsyncSession, model_id: UUID) -> List[Submodel]:
         result = await db.execute(select(Submodel).where(Submodel.model_id == model_id))
@@ -30,29 +42,37 @@ class SubmodelRepository:
 
     @staticmethod
     async def insert(db: AsyncSession, obj_in: dict) -> Submodel:
-        submodel = Submodel(**obj_in)
-        db.add(submodel)
-        await db.commit()
-        await db.refresh(submodel)
-        return submodel
+        result = await db.execute(insert(Submodel).values(**obj_in).returning(Submodel))
+        return result.scalar_one()
 
     @staticmethod
-    async def update(db: AsyncSession, db_obj: Submodel, obj_in: dict) -> Submodel:
-        for field, value in obj_in.items():
-            setattr(db_obj, field, value)
+    async def upsert_many(
+        db: AsyncSession, objs_in: List[dict]
+    ) -> Dict[str, Tuple[UUID, UUID]]:
+        # The no-op update makes existing rows come back from RETURNING, but
+        # only when they already sit under the requested model.
+        stmt = pg_insert(Submodel).values(objs_in)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Submodel.name],
+            set_={"name": stmt.excluded.name},
+            where=Submodel.model_id == stmt.excluded.model_id,
+        ).returning(Submodel.name, Submodel.id, Submodel.model_id)
+        result = await db.execute(stmt)
+        return {name: (id, model_id) for name, id, model_id in result.all()}
 
-        db.add(db_obj)
-        await db.commit()
-        await db.refresh(db_obj)
-        return db_obj
+    @staticmethod
+    async def update(db: AsyncSession, id: UUID, obj_in: dict) -> Optional[Submodel]:
+        result = await db.execute(
+            update(Submodel)
+            .where(Submodel.id == id)
+            .values(**obj_in)
+            .returning(Submodel)
+        )
+        return result.scalar_one_or_none()
 
     @staticmethod
     async def delete(db: AsyncSession, id: UUID) -> Optional[Submodel]:
-        result = await db.execute(select(Submodel).where(Submodel.id == id))
-        submodel = result.scalar_one_or_none()
-
-        if submodel:
-            await db.delete(submodel)
-            await db.commit()
-
-        return submodel
+        result = await db.execute(
+            delete(Submodel).where(Submodel.id == id).returning(Submodel)
+        )
+        return result.scalar_one_or_none()
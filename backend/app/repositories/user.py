@@ -1,8 +1,9 @@
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, insert, update, func, delete, or_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from app.models.user import User
 
@@ -14,10 +15,21 @@ class UserRepository:
         return result.scalar_one_or_none()
 
     @staticmethod
-    async def select_all(db: AsyncSession) -> List[User]:
-        result = await db.execute(select(User))
+    async def select_all(
+        db: AsyncSession, limit: Optional[int] = None, after: Optional[UUID] = None
+    ) -> List[User]:
+        query = select(User).order_by(User.id)
+        if after is not None:
+            query = query.where(User.id > after)
+
+        result = await db.execute(query.limit(limit))
         return list(result.scalars().all())
 
+    @staticmethod
+    async def count(db: AsyncSession) -> int:
+        result = await db.execute(select(func.count()).select_from(User))
+        return result.scalar_one()
+
     @staticmethod
     async def select_by_email(db: AsyncSession, email: str) -> Optional[User]:
         result = await db.execute(select(User).where(User.email == email))
@@ -30,30 +42,56 @@ class UserRepository:
 
     @staticmethod
     async def insert(db: AsyncSession, obj_in: dict) -> User:
-        user = User(**obj_in)
-        db.add(user)
-        await db.commit()
-        await db.refresh(user)
-        return user
+        result = await db.execute(insert(User).values(**obj_in).returning(User))
+        return result.scalar_one()
 
     @staticmethod
-    async def update(db: AsyncSession, db_obj: User, obj_in: dict) -> User:
-        for field, value in obj_in.items():
-            if value is not None:
-                setattr(db_obj, field, value)
+    async def insert_if_absent(db: AsyncSession, obj_in: dict) -> Optional[User]:
+        result = await db.execute(
+            pg_insert(User).values(**obj_in).on_conflict_do_nothing().returning(User)
+        )
+        return result.scalar_one_or_none()
 
-        db.add(db_obj)
-        await db.commit()
-        await db.refresh(db_obj)
-        return db_obj
+    @staticmethod
+    async def insert_many_if_absent(
+        db: AsyncSession, objs_in: List[dict]
+    ) -> Dict[str, UUID]:
+        result = await db.execute(
+            pg_insert(User)
+            .values(objs_in)
+            .on_conflict_do_nothing()
+            .returning(User.email, User.id)
+        )
+        return {email: id for email, id in result.all()}
 
     @staticmethod
-    async def delete(db: AsyncSession, id: UUID) -> Optional[User]:
-        result = await db.execute(select(User).where(User.id == id))
-        user = result.scalar_one_or_none()
+    async def select_taken(
+        db: AsyncSession, emails: Iterable[str], usernames: Iterable[str]
+    ) -> Tuple[Set[str], Set[str]]:
+        emails, usernames = set(emails), set(usernames)
+        result = await db.execute(
+            select(User.email, User.username).where(
+                or_(User.email.in_(list(emails)), User.username.in_(list(usernames)))
+            )
+        )
+        rows = result.all()
+        return (
+            {email for email, _ in rows if email in emails},
+            {username for _, username in rows if username in usernames},
+        )
 
-        if user:
-            await db.delete(user)
-            await db.commit()
+    @staticmethod
+    async def update(db: AsyncSession, id: UUID, obj_in: dict) -> Optional[User]:
+        values = {field: value for field, value in obj_in.items() if value is not None}
+        if not values:
+            return await UserRepository.select_by_id(db, id)
+
+        result = await db.execute(
+            update(User).where(User.id == id).values(**values).returning(User)
+        )
+        return result.scalar_one_or_none()
 
-        return user
+    @staticmethod
+    async def delete(db: AsyncSession, id: UUID) -> Optional[User]:
+        result = await db.execute(delete(User).where(User.id == id).returning(User))
+        return result.scalar_one_or_none()
@@ -1,15 +1,22 @@
 from typing import List
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, status, HTTPException, Query
+from fastapi import APIRouter, Depends, status, HTTPException, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db import get_db
+from app.dependancies.pagination import get_page_params
+from app.dependancies.response_cache import CachedRoute, cached_response
 from app.schemas.base_spec_schemas import (
     BaseSpecification,
     BaseSpecificationCreate,
 )
+from app.schemas.bulk_schemas import BulkCreateResult
+from app.schemas.pagination_schemas import PageParams
 from app.services import base_spec_service
+from app.utils.pagination import set_page_headers
+from app.utils.bulk import bulk_status_code, read_bulk_batches
+from app.utils.responses import model_response
 from app.exceptions.base_spec_exc import (
     BaseSpecificationAlreadyExists,
     GenerationNotFound,
@@ -27,7 +34,9 @@ async def post_base_specification(
 ):
     try:
         base_spec = await base_spec_service.create_base_specification(data, db)
-        return base_spec
+        return model_response(
+            base_spec, BaseSpecification, status_code=status.HTTP_201_CREATED
+        )
 
     except GenerationNotFound as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -39,10 +48,43 @@ async def post_base_specification(
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
 
 
+@router.post(
+    "/bulk",
+    status_code=status.HTTP_201_CREATED,
+    response_model=BulkCreateResult,
+    responses={
+        status.HTTP_207_MULTI_STATUS: {"model": BulkCreateResult},
+        status.HTTP_400_BAD_REQUEST: {"model": BulkCreateResult},
+    },
+)
+async def post_base_specifications_bulk(
+    request: Request, db: AsyncSession = Depends(get_db)
+):
+    try:
+        batches = await read_bulk_batches(request)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    result = await base_spec_service.create_base_specifications_bulk(batches, db)
+    return model_response(
+        result, BulkCreateResult, status_code=bulk_status_code(result)
+    )
+
+
 @router.get("/", status_code=status.HTTP_200_OK, response_model=List[BaseSpecification])
-async def get_all_base_specifications(db: AsyncSession = Depends(get_db)):
-    base_specs = await base_spec_service.get_all_base_specifications(db)
-    return base_specs
+async def get_all_base_specifications(
+    response: Response,
+    page: PageParams = Depends(get_page_params),
+    cache: CachedRoute = Depends(cached_response(List[BaseSpecification])),
+    db: AsyncSession = Depends(get_db),
+):
+    cached = await cache.lookup()
+    if cached is not None:
+        return cached
+
+    base_specs = await base_spec_service.get_all_base_specifications(db, page)
+    set_page_headers(response, base_specs)
+    return await cache.store(base_specs.items, response)
 
 
 @router.get(
@@ -57,7 +99,7 @@ async def get_base_specification_by_id(
         base_spec = await base_spec_service.get_base_specification_by_id(
             base_spec_id, db
         )
-        return base_spec
+        return model_response(base_spec, BaseSpecification)
 
     except BaseSpecificationNotFound as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -75,7 +117,7 @@ async def get_base_specifications_by_generation_id(
         base_specs = await base_spec_service.get_base_specifications_by_generation_id(
             generation_id, db
         )
-        return base_specs
+        return model_response(base_specs, List[BaseSpecification])
 
     except GenerationNotFound as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -95,7 +137,7 @@ async def get_base_specifications_by_year_and_generation(
                 year, generation_id, db
             )
         )
-        return base_specs
+        return model_response(base_specs, List[BaseSpecification])
 
     except BaseSpecificationNotFound as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -113,7 +155,7 @@ async def update_base_specification(
         base_spec = await base_spec_service.update_base_specification(
             base_spec_id, data, db
         )
-        return base_spec
+        return model_response(base_spec, BaseSpecification)
 
     except BaseSpecificationNotFound as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -136,7 +178,7 @@ async def delete_base_specification(
 ):
     try:
         base_spec = await base_spec_service.delete_base_specification(base_spec_id, db)
-        return base_spec
+        return model_response(base_spec, BaseSpecification)
 
     except BaseSpecificationNotFound as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
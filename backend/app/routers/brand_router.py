@@ -1,12 +1,17 @@
 from typing import List
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, status, HTTPException, Query
+from fastapi import APIRouter, Depends, status, HTTPException, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db import get_db
+from app.dependancies.pagination import get_page_params
+from app.dependancies.response_cache import CachedRoute, cached_response
 from app.schemas.brand_schemas import Brand, BrandCreate
+from app.schemas.pagination_schemas import PageParams
 from app.services import brand_service
+from app.utils.pagination import set_page_headers
+from app.utils.responses import model_response
 from app.exceptions.brand_exc import BrandAlreadyExists, BrandNotFound
 from app.exceptions.common import DatabaseIntegrityError
 
@@ -18,7 +23,7 @@ router = APIRouter(prefix="/brands")
 async def post_brand(data: BrandCreate, db: AsyncSession = Depends(get_db)):
     try:
         brand = await brand_service.create_brand(data, db)
-        return brand
+        return model_response(brand, Brand, status_code=status.HTTP_201_CREATED)
 
     except BrandAlreadyExists as e:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
@@ -28,16 +33,26 @@ async def post_brand(data: BrandCreate, db: AsyncSession = Depends(get_db)):
 
 
 @router.get("/", status_code=status.HTTP_200_OK, response_model=List[Brand])
-async def get_all_brands(db: AsyncSession = Depends(get_db)):
-    brands = await brand_service.get_all_brands(db)
-    return brands
+async def get_all_brands(
+    response: Response,
+    page: PageParams = Depends(get_page_params),
+    cache: CachedRoute = Depends(cached_response(List[Brand])),
+    db: AsyncSession = Depends(get_db),
+):
+    cached = await cache.lookup()
+    if cached is not None:
+        return cached
+
+    brands = await brand_service.get_all_brands(db, page)
+    set_page_headers(response, brands)
+    return await cache.store(brands.items, response)
 
 
 @router.get("/by-id/{brand_id}", status_code=status.HTTP_200_OK, response_model=Brand)
 async def get_brand_by_id(brand_id: UUID, db: AsyncSession = Depends(get_db)):
     try:
         brand = await brand_service.get_brand_by_id(brand_id, db)
-        return brand
+        return model_response(brand, Brand)
 
     except BrandNotFound as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -50,7 +65,7 @@ async def get_brand_by_name(
 ):
     try:
         brand = await brand_service.get_brand_by_name(name, db)
-        return brand
+        return model_response(brand, Brand)
 
     except BrandNotFound as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -62,7 +77,7 @@ async def update_brand(
 ):
     try:
         brand = await brand_service.update_brand(brand_id, data, db)
-        return brand
+        return model_response(brand, Brand)
 
     except BrandNotFound as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -78,7 +93,7 @@ async def update_brand(
 async def delete_brand(brand_id: UUID, db: AsyncSession = Depends(get_db)):
     try:
         brand = await brand_service.delete_brand(brand_id, db)
-        return brand
+        return model_response(brand, Brand)
 
     except BrandNotFound as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -1,18 +1,119 @@
-from typing import List
+from typing import Annotated, AsyncIterator, List
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, status, Query, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db import get_db
-from app.schemas.car_data_schemas import CarDataResponse
-from app.services import car_data_service
+from app.dependancies.pagination import get_page_params
+from app.dependancies.etag import check_catalog_etag
+from app.dependancies.response_cache import CachedRoute, cached_response
+from app.schemas.car_data_schemas import CarDataResponse, CarDataFilter, CarDataFacets
+from app.schemas.pagination_schemas import PageParams
+from app.services import car_data_service, car_data_export_service
+from app.utils.pagination import set_page_headers
+from app.utils.enums import CarDataSortEnum, SortOrderEnum, ExportFormatEnum
+from app.config import settings
 
 
 router = APIRouter(prefix="/car-data")
 
 
+async def _ndjson(car_data: AsyncIterator[CarDataResponse]) -> AsyncIterator[str]:
+    async for item in car_data:
+        yield item.model_dump_json() + "\n"
+
+
 @router.get(
     "/all", status_code=status.HTTP_200_OK, response_model=List[CarDataResponse]
 )
-async def get_all_car_data(db: AsyncSession = Depends(get_db)):
-    return await car_data_service.get_all_car_data(db)
+async def get_all_car_data(
+    response: Response,
+    page: PageParams = Depends(get_page_params),
+    stream: bool = Query(
+        False, description="Stream every spec after the cursor as NDJSON"
+    ),
+    etag: str = Depends(check_catalog_etag),
+    cache: CachedRoute = Depends(cached_response(List[CarDataResponse])),
+    db: AsyncSession = Depends(get_db),
+):
+    if stream:
+        return StreamingResponse(
+            _ndjson(car_data_service.stream_car_data(db, page.cursor)),
+            media_type="application/x-ndjson",
+            headers={"ETag": etag, "Cache-Control": "no-cache"},
+        )
+
+    cached = await cache.lookup()
+    if cached is not None:
+        return cached
+
+    car_data = await car_data_service.get_all_car_data(db, page)
+    set_page_headers(response, car_data)
+    return await cache.store(car_data.items, response)
+
+
+@router.get(
+    "/search", status_code=status.HTTP_200_OK, response_model=List[CarDataResponse]
+)
+async def search_car_data(
+    response: Response,
+    filters: Annotated[CarDataFilter, Query()],
+    sort: CarDataSortEnum = Query(CarDataSortEnum.spec_id, description="Sort key"),
+    order: SortOrderEnum = Query(SortOrderEnum.asc, description="Sort order"),
+    limit: int = Query(
+        settings.DEFAULT_PAGE_SIZE,
+        ge=1,
+        le=settings.MAX_PAGE_SIZE,
+        description="Page size",
+    ),
+    offset: int = Query(0, ge=0, description="Number of matches to skip"),
+    include_total: bool = Query(
+        False, description="Return the total match count in X-Total-Count"
+    ),
+    cache: CachedRoute = Depends(cached_response(List[CarDataResponse])),
+    db: AsyncSession = Depends(get_db),
+):
+    cached = await cache.lookup()
+    if cached is not None:
+        return cached
+
+    car_data = await car_data_service.search_car_data(
+        db, filters, sort, order, limit, offset, include_total
+    )
+    set_page_headers(response, car_data)
+    return await cache.store(car_data.items, response)
+
+
+@router.get("/facets", status_code=status.HTTP_200_OK, response_model=CarDataFacets)
+async def get_car_data_facets(
+    response: Response,
+    filters: Annotated[CarDataFilter, Query()],
+    cache: CachedRoute = Depends(cached_response(CarDataFacets)),
+    db: AsyncSession = Depends(get_db),
+):
+    cached = await cache.lookup()
+    if cached is not None:
+        return cached
+
+    facets = await car_data_service.get_car_data_facets(db, filters)
+    return await cache.store(facets, response)
+
+
+@router.get("/export", status_code=status.HTTP_200_OK)
+async def export_car_data(
+    format: ExportFormatEnum = Query(
+        ExportFormatEnum.parquet, description="Columnar export format"
+    ),
+    etag: str = Depends(check_catalog_etag),
+    db: AsyncSession = Depends(get_db),
+):
+    return StreamingResponse(
+        car_data_export_service.export_car_data(db, format),
+        media_type=car_data_export_service.EXPORT_MEDIA_TYPES[format],
+        headers={
+            "Content-Disposition": f'attachment; filename="car_data.{format.value}"',
+            "ETag": etag,
+            "Cache-Control": "no-cache",
+        },
+    )
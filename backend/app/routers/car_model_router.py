@@ -1,12 +1,17 @@
 from typing import List
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, status, HTTPException, Query
+from fastapi import APIRouter, Depends, status, HTTPException, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db import get_db
+from app.dependancies.pagination import get_page_params
+from app.dependancies.response_cache import CachedRoute, cached_response
 from app.schemas.car_model_schemas import CarModel, CarModelCreate
+from app.schemas.pagination_schemas import PageParams
 from app.services import car_model_service
+from app.utils.pagination import set_page_headers
+from app.utils.responses import model_response
 from app.exceptions.car_model_exc import (
     CarModelAlreadyExists,
     BrandNotFound,
@@ -22,7 +27,7 @@ router = APIRouter(prefix="/car-models")
 async def post_car_model(data: CarModelCreate, db: AsyncSession = Depends(get_db)):
     try:
         car_model = await car_model_service.create_car_model(data, db)
-        return car_model
+        return model_response(car_model, CarModel, status_code=status.HTTP_201_CREATED)
 
     except BrandNotFound as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -35,9 +40,19 @@ async def post_car_model(data: CarModelCreate, db: AsyncSession = Depends(get_db
 
 
 @router.get("/", status_code=status.HTTP_200_OK, response_model=List[CarModel])
-async def get_all_car_models(db: AsyncSession = Depends(get_db)):
-    car_models = await car_model_service.get_all_car_models(db)
-    return car_models
+async def get_all_car_models(
+    response: Response,
+    page: PageParams = Depends(get_page_params),
+    cache: CachedRoute = Depends(cached_response(List[CarModel])),
+    db: AsyncSession = Depends(get_db),
+):
+    cached = await cache.lookup()
+    if cached is not None:
+        return cached
+
+    car_models = await car_model_service.get_all_car_models(db, page)
+    set_page_headers(response, car_models)
+    return await cache.store(car_models.items, response)
 
 
 @router.get(
@@ -46,7 +61,7 @@ async def get_all_car_models(db: AsyncSession = Depends(get_db)):
 async def get_car_model_by_id(car_model_id: UUID, db: AsyncSession = Depends(get_db)):
     try:
         car_model = await car_model_service.get_car_model_by_id(car_model_id, db)
-        return car_model
+        return model_response(car_model, CarModel)
 
     except CarModelNotFound as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -62,7 +77,7 @@ async def get_car_models_by_brand_id(
 ):
     try:
         car_models = await car_model_service.get_car_models_by_brand_id(brand_id, db)
-        return car_models
+        return model_response(car_models, List[CarModel])
 
     except BrandNotFound as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -78,7 +93,7 @@ async def get_car_model_by_name_and_brand(
         car_model = await car_model_service.get_car_model_by_name_and_brand(
             name, brand_id, db
         )
-        return car_model
+        return model_response(car_model, CarModel)
 
     except CarModelNotFound as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -90,7 +105,7 @@ async def update_car_model(
 ):
     try:
         car_model = await car_model_service.update_car_model(car_model_id, data, db)
-        return car_model
+        return model_response(car_model, CarModel)
 
     except CarModelNotFound as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -108,7 +123,7 @@ async def update_car_model(
 async def delete_car_model(car_model_id: UUID, db: AsyncSession = Depends(get_db)):
     try:
         car_model = await car_model_service.delete_car_model(car_model_id, db)
-        return car_model
+        return model_response(car_model, CarModel)
 
     except CarModelNotFound as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -0,0 +1,61 @@
+from typing import List, Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, status, HTTPException, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db import get_db
+from app.dependancies.response_cache import CachedRoute, cached_response
+from app.schemas.catalog_schemas import (
+    CatalogImport,
+    CatalogImportResult,
+    CatalogTreeBrand,
+)
+from app.services import catalog_import_service, catalog_tree_service
+from app.utils.enums import CatalogLevelEnum
+from app.exceptions.catalog_exc import CatalogTreeRootNotFound, InvalidCatalogTreeDepth
+
+
+router = APIRouter(prefix="/catalog")
+
+
+@router.post(
+    "/import", status_code=status.HTTP_200_OK, response_model=CatalogImportResult
+)
+async def import_catalog(
+    data: CatalogImport,
+    start_chunk: int = Query(0, ge=0, description="Chunk to resume the import from"),
+    db: AsyncSession = Depends(get_db),
+):
+    return await catalog_import_service.import_catalog(data, db, start_chunk)
+
+
+@router.get(
+    "/tree", status_code=status.HTTP_200_OK, response_model=List[CatalogTreeBrand]
+)
+async def get_catalog_tree(
+    response: Response,
+    brand_id: Optional[UUID] = Query(None, description="Only this brand's subtree"),
+    model_id: Optional[UUID] = Query(None, description="Only this model's subtree"),
+    depth: CatalogLevelEnum = Query(
+        CatalogLevelEnum.generation, description="Deepest level to include"
+    ),
+    cache: CachedRoute = Depends(cached_response(List[CatalogTreeBrand])),
+    db: AsyncSession = Depends(get_db),
+):
+    cached = await cache.lookup()
+    if cached is not None:
+        return cached
+
+    try:
+        tree = await catalog_tree_service.get_catalog_tree(
+            db, depth, brand_id, model_id
+        )
+
+    except InvalidCatalogTreeDepth as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    except CatalogTreeRootNotFound as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+    return await cache.store(tree, response)
@@ -1,12 +1,17 @@
 from typing import List
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, status, HTTPException, Query
+from fastapi import APIRouter, Depends, status, HTTPException, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db import get_db
+from app.dependancies.pagination import get_page_params
+from app.dependancies.response_cache import CachedRoute, cached_response
 from app.schemas.generation_schemas import Generation, GenerationCreate
+from app.schemas.pagination_schemas import PageParams
 from app.services import generation_service
+from app.utils.pagination import set_page_headers
+from app.utils.responses import model_response
 from app.exceptions.generation_exc import (
     GenerationAlreadyExists,
     SubmodelNotFound,
@@ -22,7 +27,9 @@ router = APIRouter(prefix="/generations")
 async def post_generation(data: GenerationCreate, db: AsyncSession = Depends(get_db)):
     try:
         generation = await generation_service.create_generation(data, db)
-        return generation
+        return model_response(
+            generation, Generation, status_code=status.HTTP_201_CREATED
+        )
 
     except SubmodelNotFound as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -35,9 +42,19 @@ async def post_generation(data: GenerationCreate, db: AsyncSession = Depends(get
 
 
 @router.get("/", status_code=status.HTTP_200_OK, response_model=List[Generation])
-async def get_all_generations(db: AsyncSession = Depends(get_db)):
-    generations = await generation_service.get_all_generations(db)
-    return generations
+async def get_all_generations(
+    response: Response,
+    page: PageParams = Depends(get_page_params),
+    cache: CachedRoute = Depends(cached_response(List[Generation])),
+    db: AsyncSession = Depends(get_db),
+):
+    cached = await cache.lookup()
+    if cached is not None:
+        return cached
+
+    generations = await generation_service.get_all_generations(db, page)
+    set_page_headers(response, generations)
+    return await cache.store(generations.items, response)
 
 
 @router.get(
@@ -46,7 +63,7 @@ async def get_all_generations(db: AsyncSession = Depends(get_db)):
 async def get_generation_by_id(generation_id: UUID, db: AsyncSession = Depends(get_db)):
     try:
         generation = await generation_service.get_generation_by_id(generation_id, db)
-        return generation
+        return model_response(generation, Generation)
 
     except GenerationNotFound as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -64,7 +81,7 @@ async def get_generations_by_submodel_id(
         generations = await generation_service.get_generations_by_submodel_id(
             submodel_id, db
         )
-        return generations
+        return model_response(generations, List[Generation])
 
     except SubmodelNotFound as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -80,7 +97,7 @@ async def get_generation_by_name_and_submodel(
         generation = await generation_service.get_generation_by_name_and_submodel(
             name, submodel_id, db
         )
-        return generation
+        return model_response(generation, Generation)
 
     except GenerationNotFound as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -94,7 +111,7 @@ async def update_generation(
 ):
     try:
         generation = await generation_service.update_generation(generation_id, data, db)
-        return generation
+        return model_response(generation, Generation)
 
     except GenerationNotFound as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -115,7 +132,7 @@ async def update_generation(
 async def delete_generation(generation_id: UUID, db: AsyncSession = Depends(get_db)):
     try:
         generation = await generation_service.delete_generation(generation_id, db)
-        return generation
+        return model_response(generation, Generation)
 
     except GenerationNotFound as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -0,0 +1,41 @@
+from fastapi import APIRouter, Depends, status
+
+from app.db import get_pool_stats
+from app.cache import cache_backend
+from app.schemas.internal_schemas import (
+    CacheStats,
+    CatalogReplicaStats,
+    PoolStats,
+    SharedCacheStats,
+)
+from app.services.catalog_replica_service import catalog_replica
+from app.dependancies.auth import require_admin, principal_cache
+
+
+router = APIRouter(
+    prefix="/internal", tags=["Internal"], dependencies=[Depends(require_admin)]
+)
+
+
+@router.get("/auth-cache", status_code=status.HTTP_200_OK, response_model=CacheStats)
+async def get_auth_cache_stats():
+    return principal_cache.stats()
+
+
+@router.get("/db-pool", status_code=status.HTTP_200_OK, response_model=PoolStats)
+async def get_db_pool_stats():
+    return get_pool_stats()
+
+
+@router.get("/cache", status_code=status.HTTP_200_OK, response_model=SharedCacheStats)
+async def get_shared_cache_stats():
+    return cache_backend.stats()
+
+
+@router.get(
+    "/catalog-replica",
+    status_code=status.HTTP_200_OK,
+    response_model=CatalogReplicaStats,
+)
+async def get_catalog_replica_stats():
+    return catalog_replica.stats()
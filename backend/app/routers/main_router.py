@@ -7,8 +7,11 @@ from app.routers import (
     generation_router,
     base_spec_router,
     car_data_router,
+    catalog_router,
+    search_router,
     user_router,
     auth_router,
+    internal_router,
 )
 
 
@@ -19,5 +22,8 @@ main_router.include_router(submodel_router.router)
 main_router.include_router(generation_router.router)
 main_router.include_router(base_spec_router.router)
 main_router.include_router(car_data_router.router)
+main_router.include_router(catalog_router.router)
+main_router.include_router(search_router.router)
 main_router.include_router(user_router.router)
 main_router.include_router(auth_router.router)
+main_router.include_router(internal_router.router)
@@ -0,0 +1,36 @@
+from typing import Annotated, List
+
+from fastapi import APIRouter, Depends, status, Query, Response
+from pydantic import StringConstraints
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db import get_db
+from app.dependancies.response_cache import CachedRoute, cached_response
+from app.schemas.search_schemas import CatalogSearchHit
+from app.services import catalog_search_service
+
+
+router = APIRouter(prefix="/search")
+
+
+@router.get("", status_code=status.HTTP_200_OK, response_model=List[CatalogSearchHit])
+async def search_catalog(
+    response: Response,
+    # The trigram indexes only serve patterns of three or more characters;
+    # anything shorter would fall back to a sequential scan of every level.
+    # The length is checked after stripping, so padding can't get around it.
+    q: Annotated[
+        str,
+        StringConstraints(strip_whitespace=True, min_length=3),
+        Query(description="Name or name prefix to look up"),
+    ],
+    limit: int = Query(20, ge=1, le=100, description="Maximum number of hits"),
+    cache: CachedRoute = Depends(cached_response(List[CatalogSearchHit])),
+    db: AsyncSession = Depends(get_db),
+):
+    cached = await cache.lookup()
+    if cached is not None:
+        return cached
+
+    hits = await catalog_search_service.search_catalog(db, q, limit)
+    return await cache.store(hits, response)
@@ -1,12 +1,17 @@
 from typing import List
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, status, HTTPException, Query
+from fastapi import APIRouter, Depends, status, HTTPException, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db import get_db
+from app.dependancies.pagination import get_page_params
+from app.dependancies.response_cache import CachedRoute, cached_response
 from app.schemas.submodel_schemas import Submodel, SubmodelCreate
+from app.schemas.pagination_schemas import PageParams
 from app.services import submodel_service
+from app.utils.pagination import set_page_headers
+from app.utils.responses import model_response
 from app.exceptions.submodel_exc import (
     SubmodelAlreadyExists,
     CarModelNotFound,
@@ -22,7 +27,7 @@ router = APIRouter(prefix="/submodels")
 async def post_submodel(data: SubmodelCreate, db: AsyncSession = Depends(get_db)):
     try:
         submodel = await submodel_service.create_submodel(data, db)
-        return submodel
+        return model_response(submodel, Submodel, status_code=status.HTTP_201_CREATED)
 
     except CarModelNotFound as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -35,9 +40,19 @@ async def post_submodel(data: SubmodelCreate, db: AsyncSession = Depends(get_db)
 
 
 @router.get("/", status_code=status.HTTP_200_OK, response_model=List[Submodel])
-async def get_all_submodels(db: AsyncSession = Depends(get_db)):
-    submodels = await submodel_service.get_all_submodels(db)
-    return submodels
+async def get_all_submodels(
+    response: Response,
+    page: PageParams = Depends(get_page_params),
+    cache: CachedRoute = Depends(cached_response(List[Submodel])),
+    db: AsyncSession = Depends(get_db),
+):
+    cached = await cache.lookup()
+    if cached is not None:
+        return cached
+
+    submodels = await submodel_service.get_all_submodels(db, page)
+    set_page_headers(response, submodels)
+    return await cache.store(submodels.items, response)
 
 
 @router.get(
@@ -46,7 +61,7 @@ async def get_all_submodels(db: AsyncSession = Depends(get_db)):
 async def get_submodel_by_id(submodel_id: UUID, db: AsyncSession = Depends(get_db)):
     try:
         submodel = await submodel_service.get_submodel_by_id(submodel_id, db)
-        return submodel
+        return model_response(submodel, Submodel)
 
     except SubmodelNotFound as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -60,7 +75,7 @@ async def get_submodel_by_id(submodel_id: UUID, db: AsyncSession = Depends(get_d
 async def get_submodels_by_model_id(model_id: UUID, db: AsyncSession = Depends(get_db)):
     try:
         submodels = await submodel_service.get_submodels_by_model_id(model_id, db)
-        return submodels
+        return model_response(submodels, List[Submodel])
 
     except CarModelNotFound as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -73,7 +88,7 @@ async def get_submodel_by_name(
 ):
     try:
         submodel = await submodel_service.get_submodel_by_name(name, db)
-        return submodel
+        return model_response(submodel, Submodel)
 
     except SubmodelNotFound as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -85,7 +100,7 @@ async def update_submodel(
 ):
     try:
         submodel = await submodel_service.update_submodel(submodel_id, data, db)
-        return submodel
+        return model_response(submodel, Submodel)
 
     except SubmodelNotFound as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -103,7 +118,7 @@ async def update_submodel(
 async def delete_submodel(submodel_id: UUID, db: AsyncSession = Depends(get_db)):
     try:
         submodel = await submodel_service.delete_submodel(submodel_id, db)
-        return submodel
+        return model_response(submodel, Submodel)
 
     except SubmodelNotFound as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
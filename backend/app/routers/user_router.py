@@ -1,14 +1,25 @@
 from typing import List
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, status, HTTPException
+from fastapi import APIRouter, Depends, status, HTTPException, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db import get_db
-from app.schemas.user_schemas import User, UserCreate, UserUpdate, UserUpdatePassword
+from app.dependancies.pagination import get_page_params
+from app.schemas.user_schemas import (
+    User,
+    UserCreate,
+    UserUpdate,
+    UserUpdatePassword,
+    Principal,
+)
+from app.schemas.bulk_schemas import BulkCreateResult
+from app.schemas.pagination_schemas import PageParams
 from app.services import user_service
 from app.dependancies.auth import require_admin, get_current_active_user
-from app.models.user import User as UserModel
+from app.utils.pagination import set_page_headers
+from app.utils.bulk import bulk_status_code, read_bulk_rows
+from app.utils.responses import model_response
 from app.exceptions.user_exc import UserAlreadyExists, UserNotFound
 from app.exceptions.common import DatabaseIntegrityError
 
@@ -17,10 +28,16 @@ router = APIRouter(prefix="/users", tags=["Users"])
 
 
 @router.get("/me", status_code=status.HTTP_200_OK, response_model=User)
-async def get_current_user(current_user: UserModel = Depends(get_current_active_user)):
-    from app.schemas.user_schemas import User as UserSchema
+async def get_current_user(
+    current_user: Principal = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db),
+):
+    try:
+        user = await user_service.get_user_by_id(current_user.id, db)
+        return model_response(user, User)
 
-    return UserSchema.model_validate(current_user)
+    except UserNotFound as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
 
 
 @router.get(
@@ -29,9 +46,13 @@ async def get_current_user(current_user: UserModel = Depends(get_current_active_
     response_model=List[User],
     dependencies=[Depends(require_admin)],
 )
-async def get_all_users(db: AsyncSession = Depends(get_db)):
-    users = await user_service.get_all_users(db)
-    return users
+async def get_all_users(
+    page: PageParams = Depends(get_page_params), db: AsyncSession = Depends(get_db)
+):
+    users = await user_service.get_all_users(db, page)
+    response = model_response(users.items, List[User])
+    set_page_headers(response, users)
+    return response
 
 
 @router.get(
@@ -46,7 +67,7 @@ async def get_user_by_id(
 ):
     try:
         user = await user_service.get_user_by_id(user_id, db)
-        return user
+        return model_response(user, User)
 
     except UserNotFound as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -64,7 +85,7 @@ async def create_user(
 ):
     try:
         user = await user_service.create_user(data, db)
-        return user
+        return model_response(user, User, status_code=status.HTTP_201_CREATED)
 
     except UserAlreadyExists as e:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
@@ -73,6 +94,28 @@ async def create_user(
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
 
 
+@router.post(
+    "/bulk",
+    status_code=status.HTTP_201_CREATED,
+    response_model=BulkCreateResult,
+    responses={
+        status.HTTP_207_MULTI_STATUS: {"model": BulkCreateResult},
+        status.HTTP_400_BAD_REQUEST: {"model": BulkCreateResult},
+    },
+    dependencies=[Depends(require_admin)],
+)
+async def create_users_bulk(request: Request, db: AsyncSession = Depends(get_db)):
+    try:
+        rows = await read_bulk_rows(request)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    result = await user_service.create_users_bulk(rows, db)
+    return model_response(
+        result, BulkCreateResult, status_code=bulk_status_code(result)
+    )
+
+
 @router.put(
     "/{user_id}",
     status_code=status.HTTP_200_OK,
@@ -86,7 +129,7 @@ async def update_user(
 ):
     try:
         user = await user_service.update_user(user_id, data, db)
-        return user
+        return model_response(user, User)
 
     except UserNotFound as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -111,7 +154,7 @@ async def update_user_password(
 ):
     try:
         user = await user_service.update_user_password(user_id, data, db)
-        return user
+        return model_response(user, User)
 
     except UserNotFound as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -129,7 +172,7 @@ async def delete_user(
 ):
     try:
         user = await user_service.delete_user(user_id, db)
-        return user
+        return model_response(user, User)
 
     except UserNotFound as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -1,6 +1,6 @@
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, field_serializer
+from pydantic import BaseModel, ConfigDict
 
 from app.utils.enums import FuelTypeEnum
 
@@ -23,16 +23,10 @@ class BaseSpecificationBase(BaseModel):
 
 
 class BaseSpecificationCreate(BaseSpecificationBase):
-    @field_serializer("generation_id")
-    def serialize_generation_id(self, generation_id: UUID, _info):
-        return str(generation_id)
+    pass
 
 
 class BaseSpecification(BaseSpecificationBase):
     model_config = ConfigDict(from_attributes=True)
 
     id: UUID
-
-    @field_serializer("id", "generation_id")
-    def serialize_uuid(self, value: UUID, _info):
-        return str(value)
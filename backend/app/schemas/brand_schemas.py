@@ -1,6 +1,6 @@
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, field_serializer
+from pydantic import BaseModel, ConfigDict
 
 
 class BrandBase(BaseModel):
@@ -16,7 +16,3 @@ class Brand(BrandBase):
     model_config = ConfigDict(from_attributes=True)
 
     id: UUID
-
-    @field_serializer("id")
-    def serialize_id(self, id: UUID, _info):
-        return str(id)
@@ -0,0 +1,13 @@
+from typing import List
+
+from pydantic import BaseModel
+
+
+class BulkRowError(BaseModel):
+    index: int
+    detail: str
+
+
+class BulkCreateResult(BaseModel):
+    created: int
+    errors: List[BulkRowError]
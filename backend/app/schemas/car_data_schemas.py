@@ -1,3 +1,5 @@
+from typing import List
+
 from pydantic import BaseModel
 
 from app.utils.enums import FuelTypeEnum
@@ -34,3 +36,36 @@ class CarDataResponse(BaseModel):
     weight: int | None
     zero_to_100: float | None
     top_speed: int | None
+
+
+class CarDataFilter(BaseModel):
+    brand_name: List[str] | None = None
+    model_name: List[str] | None = None
+    fuel_type: List[FuelTypeEnum] | None = None
+    drivetrain: List[str] | None = None
+    transmission: List[str] | None = None
+    year_min: int | None = None
+    year_max: int | None = None
+    horsepower_min: int | None = None
+    horsepower_max: int | None = None
+    torque_min: int | None = None
+    torque_max: int | None = None
+    weight_min: int | None = None
+    weight_max: int | None = None
+    zero_to_100_min: float | None = None
+    zero_to_100_max: float | None = None
+    top_speed_min: int | None = None
+    top_speed_max: int | None = None
+
+
+class FacetCount(BaseModel):
+    value: str | int | None
+    count: int
+
+
+class CarDataFacets(BaseModel):
+    fuel_type: List[FacetCount]
+    drivetrain: List[FacetCount]
+    transmission: List[FacetCount]
+    brand_name: List[FacetCount]
+    spec_year: List[FacetCount]
@@ -1,6 +1,6 @@
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, field_serializer
+from pydantic import BaseModel, ConfigDict
 
 
 class CarModelBase(BaseModel):
@@ -10,16 +10,10 @@ class CarModelBase(BaseModel):
 
 
 class CarModelCreate(CarModelBase):
-    @field_serializer("brand_id")
-    def serialize_brand_id(self, brand_id: UUID, _info):
-        return str(brand_id)
+    pass
 
 
 class CarModel(CarModelBase):
     model_config = ConfigDict(from_attributes=True)
 
     id: UUID
-
-    @field_serializer("id", "brand_id")
-    def serialize_uuid(self, value: UUID, _info):
-        return str(value)
@@ -0,0 +1,92 @@
+from typing import List
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from app.utils.enums import FuelTypeEnum
+
+
+class BaseSpecificationImport(BaseModel):
+    year: int | None = None
+    engine: str | None = None
+    engine_displacement: int | None = None
+    fuel_type: FuelTypeEnum
+    horsepower: int | None = None
+    torque: int | None = None
+    transmission: str | None = None
+    drivetrain: str | None = None
+    doors: int | None = None
+    seats: int | None = None
+    weight: int | None = None
+    zero_to_100: float | None = None
+    top_speed: int | None = None
+
+
+class GenerationImport(BaseModel):
+    name: str
+    year_from: int | None = None
+    year_to: int | None = None
+    specs: List[BaseSpecificationImport] = []
+
+
+class SubmodelImport(BaseModel):
+    name: str
+    generations: List[GenerationImport] = []
+
+
+class CarModelImport(BaseModel):
+    name: str
+    description: str | None = None
+    submodels: List[SubmodelImport] = []
+
+
+class BrandImport(BaseModel):
+    name: str
+    country: str
+    models: List[CarModelImport] = []
+
+
+class CatalogImport(BaseModel):
+    brands: List[BrandImport]
+
+
+class CatalogImportResult(BaseModel):
+    chunks_total: int
+    chunks_completed: int
+    next_chunk: int | None
+    brands: int
+    models: int
+    submodels: int
+    generations: int
+    specs: int
+    elapsed_seconds: float
+    rows_per_second: float
+    error: str | None = None
+    conflicts: List[str] = []
+
+
+class CatalogTreeGeneration(BaseModel):
+    id: UUID
+    name: str
+    year_from: int | None = None
+    year_to: int | None = None
+
+
+class CatalogTreeSubmodel(BaseModel):
+    id: UUID
+    name: str
+    generations: List[CatalogTreeGeneration] | None = None
+
+
+class CatalogTreeModel(BaseModel):
+    id: UUID
+    name: str
+    description: str | None = None
+    submodels: List[CatalogTreeSubmodel] | None = None
+
+
+class CatalogTreeBrand(BaseModel):
+    id: UUID
+    name: str
+    country: str | None = None
+    models: List[CatalogTreeModel] | None = None
@@ -1,6 +1,6 @@
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, field_serializer
+from pydantic import BaseModel, ConfigDict
 
 
 class GenerationBase(BaseModel):
@@ -11,16 +11,10 @@ class GenerationBase(BaseModel):
 
 
 class GenerationCreate(GenerationBase):
-    @field_serializer("submodel_id")
-    def serialize_submodel_id(self, submodel_id: UUID, _info):
-        return str(submodel_id)
+    pass
 
 
 class Generation(GenerationBase):
     model_config = ConfigDict(from_attributes=True)
 
     id: UUID
-
-    @field_serializer("id", "submodel_id")
-    def serialize_uuid(self, value: UUID, _info):
-        return str(value)
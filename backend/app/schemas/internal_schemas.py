@@ -0,0 +1,44 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class HistogramSnapshot(BaseModel):
+    buckets: dict[str, int]
+    count: int
+    sum: float
+
+
+class PoolStats(BaseModel):
+    size: int
+    checked_in: int
+    checked_out: int
+    overflow: int
+    max_overflow: int
+    wait_seconds: HistogramSnapshot
+
+
+class CacheStats(BaseModel):
+    hits: int
+    misses: int
+    size: int
+    max_size: int
+
+
+class SharedCacheStats(BaseModel):
+    backend: str
+    hits: int
+    misses: int
+    hit_rate: float
+    evictions: Optional[int] = None
+    size: Optional[int] = None
+    bytes: Optional[int] = None
+    max_bytes: Optional[int] = None
+
+
+class CatalogReplicaStats(BaseModel):
+    version: Optional[int]
+    brands: int
+    car_models: int
+    submodels: int
+    generations: int
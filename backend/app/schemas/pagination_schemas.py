@@ -0,0 +1,19 @@
+from typing import Generic, List, TypeVar
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+T = TypeVar("T")
+
+
+class PageParams(BaseModel):
+    limit: int
+    cursor: UUID | None = None
+    include_total: bool = False
+
+
+class Page(BaseModel, Generic[T]):
+    items: List[T]
+    next_cursor: str | None = None
+    total: int | None = None
@@ -0,0 +1,20 @@
+from typing import List
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from app.utils.enums import CatalogLevelEnum
+
+
+class CatalogPathItem(BaseModel):
+    level: CatalogLevelEnum
+    id: UUID
+    name: str
+
+
+class CatalogSearchHit(BaseModel):
+    level: CatalogLevelEnum
+    id: UUID
+    name: str
+    score: float
+    path: List[CatalogPathItem]
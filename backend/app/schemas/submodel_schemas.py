@@ -1,6 +1,6 @@
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, field_serializer
+from pydantic import BaseModel, ConfigDict
 
 
 class SubmodelBase(BaseModel):
@@ -9,16 +9,10 @@ class SubmodelBase(BaseModel):
 
 
 class SubmodelCreate(SubmodelBase):
-    @field_serializer("model_id")
-    def serialize_model_id(self, model_id: UUID, _info):
-        return str(model_id)
+    pass
 
 
 class Submodel(SubmodelBase):
     model_config = ConfigDict(from_attributes=True)
 
     id: UUID
-
-    @field_serializer("id", "model_id")
-    def serialize_uuid(self, value: UUID, _info):
-        return str(value)
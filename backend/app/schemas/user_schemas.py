@@ -1,6 +1,6 @@
 from uuid import UUID
 
-from pydantic import BaseModel, EmailStr, ConfigDict, field_serializer
+from pydantic import BaseModel, EmailStr, ConfigDict
 
 from app.utils.enums import UserRoleEnum
 
@@ -35,9 +35,13 @@ class User(UserBase):
     id: UUID
     is_active: bool
 
-    @field_serializer("id")
-    def serialize_id(self, id: UUID, _info):
-        return str(id)
+
+class Principal(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
+    role: UserRoleEnum
+    is_active: bool
 
 
 class UserLogin(BaseModel):
@@ -1,46 +1,21 @@
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.exc import IntegrityError
-from asyncpg.exceptions import UniqueViolationError
 
 from app.schemas.user_schemas import UserCreate, User as UserSchema, Token, UserLogin
 from app.repositories.user import UserRepository
 from app.dependancies.auth import (
-    hash_password,
     verify_password,
     create_access_token,
     create_refresh_token,
     verify_token,
 )
-from app.exceptions.user_exc import UserAlreadyExists, InvalidCredentials
-from app.exceptions.common import DatabaseIntegrityError
+from app.services import user_service
+from app.exceptions.user_exc import InvalidCredentials
 
 
 async def register_user(user_data: UserCreate, db: AsyncSession) -> UserSchema:
-    existing_user = await UserRepository.select_by_email(db, user_data.email)
-    if existing_user:
-        raise UserAlreadyExists(f"User with email '{user_data.email}' already exists")
-
-    existing_username = await UserRepository.select_by_username(db, user_data.username)
-    if existing_username:
-        raise UserAlreadyExists(
-            f"User with username '{user_data.username}' already exists"
-        )
-
-    try:
-        user_dict = user_data.model_dump(exclude={"password"})
-        user_dict["hashed_password"] = hash_password(user_data.password)
-
-        user = await UserRepository.insert(db, user_dict)
-        return UserSchema.model_validate(user)
-
-    except IntegrityError as e:
-        original = e.orig
-        if isinstance(original, UniqueViolationError):
-            raise UserAlreadyExists("User with this email or username already exists")
-        else:
-            raise DatabaseIntegrityError(str(original))
+    return await user_service.create_user(user_data, db)
 
 
 async def login_user(credentials: UserLogin, db: AsyncSession) -> Token:
@@ -49,7 +24,7 @@ async def login_user(credentials: UserLogin, db: AsyncSession) -> Token:
     if not user:
         raise InvalidCredentials("Invalid email or password")
 
-    if not verify_password(credentials.password, user.hashed_password):
+    if not await verify_password(credentials.password, user.hashed_password):
         raise InvalidCredentials("Invalid email or password")
 
     if not user.is_active:
@@ -1,6 +1,7 @@
-from typing import List
-from uuid import UUID
+from typing import Any, AsyncIterator, List
+from uuid import UUID, uuid4
 
+from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
 from asyncpg.exceptions import UniqueViolationError, ForeignKeyViolationError
@@ -9,31 +10,38 @@ from app.schemas.base_spec_schemas import (
     BaseSpecification as BaseSpecificationSchema,
     BaseSpecificationCreate,
 )
+from app.schemas.bulk_schemas import BulkCreateResult, BulkRowError
+from app.schemas.pagination_schemas import Page, PageParams
 from app.repositories.base_spec import BaseSpecificationRepository
 from app.repositories.generation import GenerationRepository
+from app.utils.pagination import build_page
+from app.utils.bulk import format_validation_error, validate_bulk_row
 from app.exceptions.base_spec_exc import (
     BaseSpecificationAlreadyExists,
     GenerationNotFound,
     BaseSpecificationNotFound,
 )
+from app.services.car_data_service import (
+    refresh_car_data,
+    refresh_car_data_many,
+)
+from app.services.catalog_version_service import bump_catalog_version
+from app.services.catalog_replica_service import (
+    catalog_replica,
+    get_catalog_replica,
+)
 from app.exceptions.common import DatabaseIntegrityError
 
 
 async def create_base_specification(
     base_spec_data: BaseSpecificationCreate, db: AsyncSession
 ) -> BaseSpecificationSchema:
-    generation = await GenerationRepository.select_by_id(
-        db, base_spec_data.generation_id
-    )
-    if not generation:
-        raise GenerationNotFound(
-            f"Generation with id '{base_spec_data.generation_id}' not found"
-        )
-
     try:
         base_spec = await BaseSpecificationRepository.insert(
             db, base_spec_data.model_dump()
         )
+        await refresh_car_data(db, "spec_id", base_spec.id)
+        catalog_replica.advance(await bump_catalog_version(db))
         return BaseSpecificationSchema.model_validate(base_spec)
 
     except IntegrityError as e:
@@ -53,13 +61,112 @@ async def create_base_specification(
             raise DatabaseIntegrityError(str(original))
 
 
+async def _insert_rows(
+    db: AsyncSession, batch: List[tuple[int, dict]], errors: List[BulkRowError]
+) -> List[dict]:
+    # Only reached when the multi-row INSERT failed: each row gets its own
+    # savepoint so the error lands on the row that caused it and the rest of
+    # the batch still goes in.
+    inserted = []
+    for index, base_spec in batch:
+        try:
+            async with db.begin_nested():
+                await BaseSpecificationRepository.insert_many(db, [base_spec])
+        except IntegrityError as e:
+            errors.append(BulkRowError(index=index, detail=str(e.orig)))
+            continue
+
+        inserted.append(base_spec)
+
+    return inserted
+
+
+async def _create_base_specifications_batch(
+    rows: List[Any], offset: int, db: AsyncSession, errors: List[BulkRowError]
+) -> int:
+    valid: List[tuple[int, BaseSpecificationCreate]] = []
+    for index, row in enumerate(rows, start=offset):
+        try:
+            valid.append((index, validate_bulk_row(BaseSpecificationCreate, row)))
+        except ValidationError as e:
+            errors.append(BulkRowError(index=index, detail=format_validation_error(e)))
+
+    generation_ids = {base_spec.generation_id for _, base_spec in valid}
+    replica = await get_catalog_replica(db)
+    existing_generation_ids = (
+        replica.generations.existing_ids(generation_ids)
+        if replica
+        else await GenerationRepository.select_existing_ids(db, generation_ids)
+    )
+
+    batch: List[tuple[int, dict]] = []
+    for index, base_spec in valid:
+        if base_spec.generation_id not in existing_generation_ids:
+            errors.append(
+                BulkRowError(
+                    index=index,
+                    detail=f"Generation with id '{base_spec.generation_id}' not found",
+                )
+            )
+            continue
+
+        batch.append((index, {"id": uuid4(), **base_spec.model_dump()}))
+
+    if not batch:
+        return 0
+
+    try:
+        await BaseSpecificationRepository.insert_many(
+            db, [base_spec for _, base_spec in batch]
+        )
+        inserted = [base_spec for _, base_spec in batch]
+    except IntegrityError:
+        await db.rollback()
+        inserted = await _insert_rows(db, batch, errors)
+
+    if not inserted:
+        await db.rollback()
+        return 0
+
+    await refresh_car_data_many(
+        db, "spec_id", [base_spec["id"] for base_spec in inserted]
+    )
+    # Commits the batch together with its version bump, so a failure in a
+    # later batch can never leave committed rows behind a stale catalog
+    # version.
+    catalog_replica.advance(await bump_catalog_version(db))
+    return len(inserted)
+
+
+async def create_base_specifications_bulk(
+    batches: AsyncIterator[List[Any]], db: AsyncSession
+) -> BulkCreateResult:
+    errors: List[BulkRowError] = []
+    created = 0
+    offset = 0
+
+    # Batches are inserted as they are read, so an NDJSON upload never has
+    # to be held in memory as a whole.
+    async for rows in batches:
+        created += await _create_base_specifications_batch(rows, offset, db, errors)
+        offset += len(rows)
+
+    errors.sort(key=lambda error: error.index)
+    return BulkCreateResult(created=created, errors=errors)
+
+
 async def get_all_base_specifications(
-    db: AsyncSession,
-) -> List[BaseSpecificationSchema]:
-    base_specs = await BaseSpecificationRepository.select_all(db)
-    return [
-        BaseSpecificationSchema.model_validate(base_spec) for base_spec in base_specs
-    ]
+    db: AsyncSession, page: PageParams
+) -> Page[BaseSpecificationSchema]:
+    base_specs = await BaseSpecificationRepository.select_all(
+        db, page.limit + 1, page.cursor
+    )
+    total = await BaseSpecificationRepository.count(db) if page.include_total else None
+    return build_page(
+        [BaseSpecificationSchema.model_validate(base_spec) for base_spec in base_specs],
+        page.limit,
+        total,
+    )
 
 
 async def get_base_specification_by_id(
@@ -78,7 +185,12 @@ async def get_base_specification_by_id(
 async def get_base_specifications_by_generation_id(
     generation_id: UUID, db: AsyncSession
 ) -> List[BaseSpecificationSchema]:
-    generation = await GenerationRepository.select_by_id(db, generation_id)
+    replica = await get_catalog_replica(db)
+    generation = (
+        replica.generations.get(generation_id)
+        if replica
+        else await GenerationRepository.select_by_id(db, generation_id)
+    )
     if not generation:
         raise GenerationNotFound(f"Generation with id '{generation_id}' not found")
 
@@ -110,17 +222,17 @@ async def get_base_specifications_by_year_and_generation(
 async def update_base_specification(
     base_spec_id: UUID, base_spec_data: BaseSpecificationCreate, db: AsyncSession
 ) -> BaseSpecificationSchema:
-    base_spec = await BaseSpecificationRepository.select_by_id(db, base_spec_id)
-
-    if not base_spec:
-        raise BaseSpecificationNotFound(
-            f"Base specification with id '{base_spec_id}' not found"
-        )
-
     try:
         updated_base_spec = await BaseSpecificationRepository.update(
-            db, base_spec, base_spec_data.model_dump()
+            db, base_spec_id, base_spec_data.model_dump()
         )
+        if not updated_base_spec:
+            raise BaseSpecificationNotFound(
+                f"Base specification with id '{base_spec_id}' not found"
+            )
+
+        await refresh_car_data(db, "spec_id", updated_base_spec.id)
+        catalog_replica.advance(await bump_catalog_version(db))
         return BaseSpecificationSchema.model_validate(updated_base_spec)
 
     except IntegrityError as e:
@@ -150,4 +262,5 @@ async def delete_base_specification(
             f"Base specification with id '{base_spec_id}' not found"
         )
 
+    catalog_replica.advance(await bump_catalog_version(db))
     return BaseSpecificationSchema.model_validate(base_spec)
@@ -1,4 +1,3 @@
-from typing import List
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -6,15 +5,26 @@ from sqlalchemy.exc import IntegrityError
 from asyncpg.exceptions import UniqueViolationError
 
 from app.schemas.brand_schemas import Brand as BrandSchema, BrandCreate
+from app.schemas.pagination_schemas import Page, PageParams
 from app.repositories.brand import BrandRepository
+from app.utils.pagination import build_page
 from app.exceptions.brand_exc import BrandAlreadyExists, BrandNotFound
+from app.services.car_data_service import refresh_car_data
+from app.services.catalog_version_service import bump_catalog_version
+from app.services.catalog_replica_service import (
+    catalog_replica,
+    get_catalog_replica,
+)
 from app.exceptions.common import DatabaseIntegrityError
 
 
 async def create_brand(brand_data: BrandCreate, db: AsyncSession) -> BrandSchema:
     try:
         brand = await BrandRepository.insert(db, brand_data.model_dump())
-        return BrandSchema.model_validate(brand)
+        version = await bump_catalog_version(db)
+        brand = BrandSchema.model_validate(brand)
+        catalog_replica.put(version, catalog_replica.brands, brand)
+        return brand
 
     except IntegrityError as e:
         original = e.orig
@@ -28,13 +38,21 @@ async def create_brand(brand_data: BrandCreate, db: AsyncSession) -> BrandSchema
             raise DatabaseIntegrityError(str(original))
 
 
-async def get_all_brands(db: AsyncSession) -> List[BrandSchema]:
-    brands = await BrandRepository.select_all(db)
-    return [BrandSchema.model_validate(brand) for brand in brands]
+async def get_all_brands(db: AsyncSession, page: PageParams) -> Page[BrandSchema]:
+    brands = await BrandRepository.select_all(db, page.limit + 1, page.cursor)
+    total = await BrandRepository.count(db) if page.include_total else None
+    return build_page(
+        [BrandSchema.model_validate(brand) for brand in brands], page.limit, total
+    )
 
 
 async def get_brand_by_id(brand_id: UUID, db: AsyncSession) -> BrandSchema:
-    brand = await BrandRepository.select_by_id(db, brand_id)
+    replica = await get_catalog_replica(db)
+    brand = (
+        replica.brands.get(brand_id)
+        if replica
+        else await BrandRepository.select_by_id(db, brand_id)
+    )
 
     if not brand:
         raise BrandNotFound(f"Brand with id '{brand_id}' not found")
@@ -43,7 +61,12 @@ async def get_brand_by_id(brand_id: UUID, db: AsyncSession) -> BrandSchema:
 
 
 async def get_brand_by_name(name: str, db: AsyncSession) -> BrandSchema:
-    brand = await BrandRepository.select_by_name(db, name)
+    replica = await get_catalog_replica(db)
+    brand = (
+        replica.brands.get_by_name(name)
+        if replica
+        else await BrandRepository.select_by_name(db, name)
+    )
 
     if not brand:
         raise BrandNotFound(f"Brand with name '{name}' not found")
@@ -54,14 +77,18 @@ async def get_brand_by_name(name: str, db: AsyncSession) -> BrandSchema:
 async def update_brand(
     brand_id: UUID, brand_data: BrandCreate, db: AsyncSession
 ) -> BrandSchema:
-    brand = await BrandRepository.select_by_id(db, brand_id)
-
-    if not brand:
-        raise BrandNotFound(f"Brand with id '{brand_id}' not found")
-
     try:
-        updated_brand = await BrandRepository.update(db, brand, brand_data.model_dump())
-        return BrandSchema.model_validate(updated_brand)
+        updated_brand = await BrandRepository.update(
+            db, brand_id, brand_data.model_dump()
+        )
+        if not updated_brand:
+            raise BrandNotFound(f"Brand with id '{brand_id}' not found")
+
+        await refresh_car_data(db, "brand_id", updated_brand.id)
+        version = await bump_catalog_version(db)
+        updated_brand = BrandSchema.model_validate(updated_brand)
+        catalog_replica.put(version, catalog_replica.brands, updated_brand)
+        return updated_brand
 
     except IntegrityError as e:
         original = e.orig
@@ -81,4 +108,6 @@ async def delete_brand(brand_id: UUID, db: AsyncSession) -> BrandSchema:
     if not brand:
         raise BrandNotFound(f"Brand with id '{brand_id}' not found")
 
+    version = await bump_catalog_version(db)
+    catalog_replica.remove(version, catalog_replica.brands, brand_id)
     return BrandSchema.model_validate(brand)
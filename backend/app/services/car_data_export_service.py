@@ -0,0 +1,163 @@
+import asyncio
+import csv
+import io
+from enum import Enum
+from typing import AsyncIterator, List, Sequence
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from sqlalchemy import Row, Integer, Float
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.repositories.car_data import CarDataRepository
+from app.utils.enums import ExportFormatEnum
+from app.config import settings
+
+
+DICTIONARY_COLUMNS = ("brand_name", "model_name", "fuel_type")
+
+EXPORT_MEDIA_TYPES = {
+    ExportFormatEnum.parquet: "application/vnd.apache.parquet",
+    ExportFormatEnum.arrow: "application/vnd.apache.arrow.stream",
+    ExportFormatEnum.csv: "text/csv",
+}
+
+
+class _ChunkSink:
+    """Write-only file object that hands back whatever was written so far."""
+
+    def __init__(self):
+        self.closed = False
+        self._chunks: List[bytes] = []
+        self._position = 0
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def writable(self) -> bool:
+        return True
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _plain(row: Row) -> list:
+    return [value.value if isinstance(value, Enum) else value for value in row]
+
+
+def _arrow_schema(columns: list):
+    fields = []
+    for column in columns:
+        if column.name in DICTIONARY_COLUMNS:
+            arrow_type = pa.dictionary(pa.int32(), pa.string())
+        elif isinstance(column.type, Integer):
+            arrow_type = pa.int32()
+        elif isinstance(column.type, Float):
+            arrow_type = pa.float64()
+        else:
+            arrow_type = pa.string()
+
+        fields.append(pa.field(column.name, arrow_type))
+
+    return pa.schema(fields)
+
+
+def _record_batch(rows: Sequence[Row], schema):
+    arrays = []
+    for field, values in zip(schema, zip(*(_plain(row) for row in rows))):
+        if pa.types.is_dictionary(field.type):
+            arrays.append(pa.array(values, pa.string()).dictionary_encode())
+        else:
+            arrays.append(pa.array(values, field.type))
+
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+class _CsvWriter:
+    def __init__(self, sink: _ChunkSink, columns: list):
+        self._sink = sink
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer)
+        self._writer.writerow(column.name for column in columns)
+
+    def write(self, rows: Sequence[Row]) -> None:
+        self._writer.writerows(_plain(row) for row in rows)
+        self._sink.write(self._buffer.getvalue().encode())
+        self._buffer.seek(0)
+        self._buffer.truncate()
+
+    def close(self) -> None:
+        self.write([])
+
+
+class _ArrowWriter:
+    def __init__(self, sink: _ChunkSink, columns: list):
+        self._schema = _arrow_schema(columns)
+        self._writer = pa.ipc.new_stream(sink, self._schema)
+
+    def write(self, rows: Sequence[Row]) -> None:
+        self._writer.write_batch(_record_batch(rows, self._schema))
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+class _ParquetWriter:
+    def __init__(self, sink: _ChunkSink, columns: list):
+        self._schema = _arrow_schema(columns)
+        self._writer = pq.ParquetWriter(
+            sink,
+            self._schema,
+            compression="zstd",
+            use_dictionary=list(DICTIONARY_COLUMNS),
+        )
+
+    def write(self, rows: Sequence[Row]) -> None:
+        self._writer.write_batch(
+            _record_batch(rows, self._schema), row_group_size=len(rows)
+        )
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+EXPORT_WRITERS = {
+    ExportFormatEnum.parquet: _ParquetWriter,
+    ExportFormatEnum.arrow: _ArrowWriter,
+    ExportFormatEnum.csv: _CsvWriter,
+}
+
+
+async def export_car_data(
+    db: AsyncSession, export_format: ExportFormatEnum
+) -> AsyncIterator[bytes]:
+    sink = _ChunkSink()
+    writer = EXPORT_WRITERS[export_format](sink, CarDataRepository.columns())
+    row_group_size = settings.EXPORT_ROW_GROUP_SIZE
+
+    rows: List[Row] = []
+    async for row in CarDataRepository.stream_car_data(db, batch_size=row_group_size):
+        rows.append(row)
+        if len(rows) == row_group_size:
+            await asyncio.to_thread(writer.write, rows)
+            rows = []
+            yield sink.drain()
+
+    if rows:
+        await asyncio.to_thread(writer.write, rows)
+    await asyncio.to_thread(writer.close)
+    yield sink.drain()
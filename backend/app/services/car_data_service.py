@@ -1,43 +1,86 @@
-from typing import List
+from typing import AsyncIterator, Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.schemas.car_data_schemas import CarDataResponse
-from app.repositories.car_data import CarDataRepository
-
-
-async def get_all_car_data(db: AsyncSession) -> List[CarDataResponse]:
-    specs = await CarDataRepository.select_all_car_data(db)
-    car_data_list = []
-    for spec in specs:
-        print(spec.__dict__)
-        car_data = CarDataResponse(
-            brand_id=str(spec.generation.submodel.model.brand.id),
-            brand_name=spec.generation.submodel.model.brand.name,
-            brand_country=spec.generation.submodel.model.brand.country,
-            model_id=str(spec.generation.submodel.model.id),
-            model_name=spec.generation.submodel.model.name,
-            model_description=spec.generation.submodel.model.description,
-            submodel_id=str(spec.generation.submodel.id),
-            submodel_name=spec.generation.submodel.name,
-            generation_id=str(spec.generation.id),
-            generation_name=spec.generation.name,
-            generation_year_from=spec.generation.year_from,
-            generation_year_to=spec.generation.year_to,
-            spec_id=str(spec.id),
-            spec_year=spec.year,
-            engine=spec.engine,
-            engine_displacement=spec.engine_displacement,
-            fuel_type=spec.fuel_type.value,
-            horsepower=spec.horsepower,
-            torque=spec.torque,
-            transmission=spec.transmission,
-            drivetrain=spec.drivetrain,
-            doors=spec.doors,
-            seats=spec.seats,
-            weight=spec.weight,
-            zero_to_100=spec.zero_to_100,
-            top_speed=spec.top_speed,
-        )
-        car_data_list.append(car_data)
-
-    return car_data_list
+from app.schemas.car_data_schemas import (
+    CarDataResponse,
+    CarDataFilter,
+    CarDataFacets,
+    FacetCount,
+)
+from app.schemas.pagination_schemas import Page, PageParams
+from app.repositories.car_data import CarDataRepository, CAR_DATA_FACETS
+from app.utils.pagination import build_page
+from app.utils.enums import CarDataSortEnum, SortOrderEnum
+
+
+def _to_car_data(row: Row) -> CarDataResponse:
+    # Rows come straight from the car_data table with the exact column types
+    # the schema declares, so validating them again would only cost CPU.
+    return CarDataResponse.model_construct(**row._mapping)
+
+
+async def get_all_car_data(db: AsyncSession, page: PageParams) -> Page[CarDataResponse]:
+    rows = await CarDataRepository.select_car_data_page(db, page.limit + 1, page.cursor)
+    total = await CarDataRepository.count(db) if page.include_total else None
+    return build_page(
+        [_to_car_data(row) for row in rows],
+        page.limit,
+        total,
+        key=lambda car_data: UUID(car_data.spec_id),
+    )
+
+
+async def search_car_data(
+    db: AsyncSession,
+    filters: CarDataFilter,
+    sort: CarDataSortEnum,
+    order: SortOrderEnum,
+    limit: int,
+    offset: int = 0,
+    include_total: bool = False,
+) -> Page[CarDataResponse]:
+    rows = await CarDataRepository.search(db, filters, sort, order, limit, offset)
+    total = (
+        await CarDataRepository.count_matching(db, filters) if include_total else None
+    )
+    return Page(items=[_to_car_data(row) for row in rows], total=total)
+
+
+async def get_car_data_facets(
+    db: AsyncSession, filters: CarDataFilter
+) -> CarDataFacets:
+    counts = {name: [] for name in CAR_DATA_FACETS}
+    for row in await CarDataRepository.select_facet_counts(db, filters):
+        mapping = row._mapping
+        for name in CAR_DATA_FACETS:
+            if mapping[f"{name}_grouping"] == 0:
+                value = mapping[name]
+                counts[name].append(
+                    FacetCount(
+                        value=value.value if name == "fuel_type" else value,
+                        count=mapping["count"],
+                    )
+                )
+                break
+
+    return CarDataFacets(**counts)
+
+
+async def stream_car_data(
+    db: AsyncSession, cursor: Optional[UUID] = None
+) -> AsyncIterator[CarDataResponse]:
+    async for row in CarDataRepository.stream_car_data(db, cursor):
+        yield _to_car_data(row)
+
+
+async def refresh_car_data(db: AsyncSession, scope: str, id: UUID) -> None:
+    await CarDataRepository.refresh(db, scope, [id])
+
+
+async def refresh_car_data_many(
+    db: AsyncSession, scope: str, ids: Sequence[UUID]
+) -> None:
+    await CarDataRepository.refresh(db, scope, ids)
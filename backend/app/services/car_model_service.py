@@ -6,26 +6,33 @@ from sqlalchemy.exc import IntegrityError
 from asyncpg.exceptions import UniqueViolationError, ForeignKeyViolationError
 
 from app.schemas.car_model_schemas import CarModel as CarModelSchema, CarModelCreate
+from app.schemas.pagination_schemas import Page, PageParams
 from app.repositories.car_model import CarModelRepository
 from app.repositories.brand import BrandRepository
+from app.utils.pagination import build_page
 from app.exceptions.car_model_exc import (
     CarModelAlreadyExists,
     BrandNotFound,
     CarModelNotFound,
 )
+from app.services.car_data_service import refresh_car_data
+from app.services.catalog_version_service import bump_catalog_version
+from app.services.catalog_replica_service import (
+    catalog_replica,
+    get_catalog_replica,
+)
 from app.exceptions.common import DatabaseIntegrityError
 
 
 async def create_car_model(
     car_model_data: CarModelCreate, db: AsyncSession
 ) -> CarModelSchema:
-    brand = await BrandRepository.select_by_id(db, car_model_data.brand_id)
-    if not brand:
-        raise BrandNotFound(f"Brand with id '{car_model_data.brand_id}' not found")
-
     try:
         car_model = await CarModelRepository.insert(db, car_model_data.model_dump())
-        return CarModelSchema.model_validate(car_model)
+        version = await bump_catalog_version(db)
+        car_model = CarModelSchema.model_validate(car_model)
+        catalog_replica.put(version, catalog_replica.car_models, car_model)
+        return car_model
 
     except IntegrityError as e:
         original = e.orig
@@ -42,13 +49,25 @@ async def create_car_model(
             raise DatabaseIntegrityError(str(original))
 
 
-async def get_all_car_models(db: AsyncSession) -> List[CarModelSchema]:
-    car_models = await CarModelRepository.select_all(db)
-    return [CarModelSchema.model_validate(car_model) for car_model in car_models]
+async def get_all_car_models(
+    db: AsyncSession, page: PageParams
+) -> Page[CarModelSchema]:
+    car_models = await CarModelRepository.select_all(db, page.limit + 1, page.cursor)
+    total = await CarModelRepository.count(db) if page.include_total else None
+    return build_page(
+        [CarModelSchema.model_validate(car_model) for car_model in car_models],
+        page.limit,
+        total,
+    )
 
 
 async def get_car_model_by_id(car_model_id: UUID, db: AsyncSession) -> CarModelSchema:
-    car_model = await CarModelRepository.select_by_id(db, car_model_id)
+    replica = await get_catalog_replica(db)
+    car_model = (
+        replica.car_models.get(car_model_id)
+        if replica
+        else await CarModelRepository.select_by_id(db, car_model_id)
+    )
 
     if not car_model:
         raise CarModelNotFound(f"Car model with id '{car_model_id}' not found")
@@ -59,18 +78,32 @@ async def get_car_model_by_id(car_model_id: UUID, db: AsyncSession) -> CarModelS
 async def get_car_models_by_brand_id(
     brand_id: UUID, db: AsyncSession
 ) -> List[CarModelSchema]:
-    brand = await BrandRepository.select_by_id(db, brand_id)
+    replica = await get_catalog_replica(db)
+    brand = (
+        replica.brands.get(brand_id)
+        if replica
+        else await BrandRepository.select_by_id(db, brand_id)
+    )
     if not brand:
         raise BrandNotFound(f"Brand with id '{brand_id}' not found")
 
-    car_models = await CarModelRepository.select_by_brand_id(db, brand_id)
+    car_models = (
+        replica.car_models.children(brand_id)
+        if replica
+        else await CarModelRepository.select_by_brand_id(db, brand_id)
+    )
     return [CarModelSchema.model_validate(car_model) for car_model in car_models]
 
 
 async def get_car_model_by_name_and_brand(
     name: str, brand_id: UUID, db: AsyncSession
 ) -> CarModelSchema:
-    car_model = await CarModelRepository.select_by_name_and_brand(db, name, brand_id)
+    replica = await get_catalog_replica(db)
+    car_model = (
+        replica.car_models.get_by_name(name, brand_id)
+        if replica
+        else await CarModelRepository.select_by_name_and_brand(db, name, brand_id)
+    )
 
     if not car_model:
         raise CarModelNotFound(
@@ -83,16 +116,18 @@ async def get_car_model_by_name_and_brand(
 async def update_car_model(
     car_model_id: UUID, car_model_data: CarModelCreate, db: AsyncSession
 ) -> CarModelSchema:
-    car_model = await CarModelRepository.select_by_id(db, car_model_id)
-
-    if not car_model:
-        raise CarModelNotFound(f"Car model with id '{car_model_id}' not found")
-
     try:
         updated_car_model = await CarModelRepository.update(
-            db, car_model, car_model_data.model_dump()
+            db, car_model_id, car_model_data.model_dump()
         )
-        return CarModelSchema.model_validate(updated_car_model)
+        if not updated_car_model:
+            raise CarModelNotFound(f"Car model with id '{car_model_id}' not found")
+
+        await refresh_car_data(db, "model_id", updated_car_model.id)
+        version = await bump_catalog_version(db)
+        updated_car_model = CarModelSchema.model_validate(updated_car_model)
+        catalog_replica.put(version, catalog_replica.car_models, updated_car_model)
+        return updated_car_model
 
     except IntegrityError as e:
         original = e.orig
@@ -115,4 +150,6 @@ async def delete_car_model(car_model_id: UUID, db: AsyncSession) -> CarModelSche
     if not car_model:
         raise CarModelNotFound(f"Car model with id '{car_model_id}' not found")
 
+    version = await bump_catalog_version(db)
+    catalog_replica.remove(version, catalog_replica.car_models, car_model_id)
     return CarModelSchema.model_validate(car_model)
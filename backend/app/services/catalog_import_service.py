@@ -0,0 +1,205 @@
+import time
+from collections import Counter
+from typing import Dict, List, Tuple
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.schemas.catalog_schemas import (
+    BaseSpecificationImport,
+    BrandImport,
+    CatalogImport,
+    CatalogImportResult,
+)
+from app.repositories.brand import BrandRepository
+from app.repositories.car_model import CarModelRepository
+from app.repositories.submodel import SubmodelRepository
+from app.repositories.generation import GenerationRepository
+from app.repositories.base_spec import BaseSpecificationRepository
+from app.services.car_data_service import refresh_car_data_many
+from app.services.catalog_version_service import bump_catalog_version
+from app.config import settings
+
+
+SPEC_FIELDS = list(BaseSpecificationImport.model_fields)
+
+
+def _spec_key(generation_id: UUID, spec) -> tuple:
+    return (generation_id, *(getattr(spec, field) for field in SPEC_FIELDS))
+
+
+def _attached(
+    ids: Dict[str, Tuple[UUID, UUID]],
+    name: str,
+    parent_id: UUID,
+    conflicts: List[str],
+    label: str,
+) -> bool:
+    entry = ids.get(name)
+    if entry is not None and entry[1] == parent_id:
+        return True
+
+    conflicts.append(f"{label} '{name}' already exists under another parent; skipped")
+    return False
+
+
+async def _import_chunk(
+    brands: List[BrandImport], db: AsyncSession, conflicts: List[str]
+) -> dict:
+    brand_rows = {
+        brand.name: {"name": brand.name, "country": brand.country} for brand in brands
+    }
+    brand_ids = await BrandRepository.upsert_many(db, list(brand_rows.values()))
+
+    # Names are unique per table, so an existing model, submodel or
+    # generation listed under a different parent is reported and skipped
+    # together with everything below it, rather than moved.
+    models = [
+        (brand_ids[brand.name], model) for brand in brands for model in brand.models
+    ]
+    model_rows = {
+        model.name: {
+            "name": model.name,
+            "brand_id": brand_id,
+            "description": model.description,
+        }
+        for brand_id, model in models
+    }
+    model_ids = (
+        await CarModelRepository.upsert_many(db, list(model_rows.values()))
+        if model_rows
+        else {}
+    )
+    models = [
+        (model_ids[model.name][0], model)
+        for brand_id, model in models
+        if _attached(model_ids, model.name, brand_id, conflicts, "Car model")
+    ]
+
+    submodels = [
+        (model_id, submodel)
+        for model_id, model in models
+        for submodel in model.submodels
+    ]
+    submodel_rows = {
+        submodel.name: {"name": submodel.name, "model_id": model_id}
+        for model_id, submodel in submodels
+    }
+    submodel_ids = (
+        await SubmodelRepository.upsert_many(db, list(submodel_rows.values()))
+        if submodel_rows
+        else {}
+    )
+    submodels = [
+        (submodel_ids[submodel.name][0], submodel)
+        for model_id, submodel in submodels
+        if _attached(submodel_ids, submodel.name, model_id, conflicts, "Submodel")
+    ]
+
+    generations = [
+        (submodel_id, generation)
+        for submodel_id, submodel in submodels
+        for generation in submodel.generations
+    ]
+    generation_rows = {
+        generation.name: {
+            "name": generation.name,
+            "submodel_id": submodel_id,
+            "year_from": generation.year_from,
+            "year_to": generation.year_to,
+        }
+        for submodel_id, generation in generations
+    }
+    generation_ids = (
+        await GenerationRepository.upsert_many(db, list(generation_rows.values()))
+        if generation_rows
+        else {}
+    )
+    generations = [
+        (generation_ids[generation.name][0], generation)
+        for submodel_id, generation in generations
+        if _attached(
+            generation_ids, generation.name, submodel_id, conflicts, "Generation"
+        )
+    ]
+
+    # Specs have no natural key. Skip the ones already stored with identical
+    # values so that re-running a chunk after a lost response adds nothing.
+    stored_specs = (
+        await BaseSpecificationRepository.select_by_generation_ids(
+            db, [generation_id for generation_id, _ in generations]
+        )
+        if generations
+        else []
+    )
+    existing = Counter(_spec_key(spec.generation_id, spec) for spec in stored_specs)
+
+    spec_rows = []
+    for generation_id, generation in generations:
+        for spec in generation.specs:
+            key = _spec_key(generation_id, spec)
+            if existing[key]:
+                existing[key] -= 1
+                continue
+            spec_rows.append({**spec.model_dump(), "generation_id": generation_id})
+
+    if spec_rows:
+        await BaseSpecificationRepository.insert_many(db, spec_rows)
+
+    await refresh_car_data_many(db, "brand_id", list(brand_ids.values()))
+    await bump_catalog_version(db)
+
+    return {
+        "brands": len(brand_rows),
+        "models": len(models),
+        "submodels": len(submodels),
+        "generations": len(generations),
+        "specs": len(spec_rows),
+    }
+
+
+async def import_catalog(
+    catalog: CatalogImport, db: AsyncSession, start_chunk: int = 0
+) -> CatalogImportResult:
+    chunk_size = settings.CATALOG_IMPORT_CHUNK_SIZE
+    chunks = [
+        catalog.brands[start : start + chunk_size]
+        for start in range(0, len(catalog.brands), chunk_size)
+    ]
+
+    counts = {"brands": 0, "models": 0, "submodels": 0, "generations": 0, "specs": 0}
+    chunks_completed = 0
+    next_chunk = None
+    error = None
+    conflicts: List[str] = []
+    started = time.perf_counter()
+
+    for index in range(start_chunk, len(chunks)):
+        chunk_conflicts: List[str] = []
+        try:
+            chunk_counts = await _import_chunk(chunks[index], db, chunk_conflicts)
+        except SQLAlchemyError as e:
+            await db.rollback()
+            next_chunk = index
+            error = str(getattr(e, "orig", None) or e)
+            break
+
+        chunks_completed += 1
+        conflicts.extend(chunk_conflicts)
+        for key, value in chunk_counts.items():
+            counts[key] += value
+
+    elapsed = time.perf_counter() - started
+    rows = sum(counts.values())
+
+    return CatalogImportResult(
+        chunks_total=len(chunks),
+        chunks_completed=chunks_completed,
+        next_chunk=next_chunk,
+        elapsed_seconds=elapsed,
+        rows_per_second=rows / elapsed if elapsed else 0.0,
+        error=error,
+        conflicts=conflicts,
+        **counts,
+    )
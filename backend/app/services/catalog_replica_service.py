@@ -0,0 +1,80 @@
+import asyncio
+import logging
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db import SessionLocal
+from app.schemas.brand_schemas import Brand as BrandSchema
+from app.schemas.car_model_schemas import CarModel as CarModelSchema
+from app.schemas.submodel_schemas import Submodel as SubmodelSchema
+from app.schemas.generation_schemas import Generation as GenerationSchema
+from app.repositories.brand import BrandRepository
+from app.repositories.car_model import CarModelRepository
+from app.repositories.submodel import SubmodelRepository
+from app.repositories.generation import GenerationRepository
+from app.repositories.catalog_version import CatalogVersionRepository
+from app.services.catalog_version_service import get_catalog_version
+from app.utils.catalog_replica import CatalogReplica
+from app.config import settings
+
+
+logger = logging.getLogger(__name__)
+
+catalog_replica = CatalogReplica()
+
+
+async def get_catalog_replica(db: AsyncSession) -> Optional[CatalogReplica]:
+    if not settings.CATALOG_REPLICA_ENABLED:
+        return None
+
+    if catalog_replica.is_current(await get_catalog_version(db)):
+        return catalog_replica
+
+    return None
+
+
+async def load_catalog_replica(db: AsyncSession) -> None:
+    # Read the version first: if a write lands while the tables are being
+    # read, the replica is tagged older than its contents and simply gets
+    # reloaded again on the next check.
+    version = await CatalogVersionRepository.select_version(db)
+    brands = await BrandRepository.select_all(db)
+    car_models = await CarModelRepository.select_all(db)
+    submodels = await SubmodelRepository.select_all(db)
+    generations = await GenerationRepository.select_all(db)
+
+    catalog_replica.replace(
+        version,
+        (BrandSchema.model_validate(brand) for brand in brands),
+        (CarModelSchema.model_validate(car_model) for car_model in car_models),
+        (SubmodelSchema.model_validate(submodel) for submodel in submodels),
+        (GenerationSchema.model_validate(generation) for generation in generations),
+    )
+
+
+async def refresh_catalog_replica() -> None:
+    catalog_replica.stale.clear()
+    try:
+        async with SessionLocal() as db:
+            version = await CatalogVersionRepository.select_version(db)
+            if version != catalog_replica.version:
+                await load_catalog_replica(db)
+    except Exception:
+        logger.exception("Catalog replica refresh failed")
+        catalog_replica.stale.set()
+
+
+async def reconcile_catalog_replica() -> None:
+    while True:
+        try:
+            await asyncio.wait_for(
+                catalog_replica.stale.wait(),
+                timeout=settings.CATALOG_REPLICA_RECONCILE_SECONDS,
+            )
+        except asyncio.TimeoutError:
+            pass
+
+        await refresh_catalog_replica()
+        if catalog_replica.stale.is_set():
+            await asyncio.sleep(1)
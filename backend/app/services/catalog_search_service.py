@@ -0,0 +1,30 @@
+from typing import List
+
+from sqlalchemy import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.schemas.search_schemas import CatalogSearchHit, CatalogPathItem
+from app.repositories.catalog_search import CatalogSearchRepository
+from app.utils.enums import CatalogLevelEnum
+
+
+def _to_search_hit(row: Row) -> CatalogSearchHit:
+    path = [
+        CatalogPathItem(level=level, id=id, name=name)
+        for level, id, name in (
+            (CatalogLevelEnum.brand, row.brand_id, row.brand_name),
+            (CatalogLevelEnum.model, row.model_id, row.model_name),
+            (CatalogLevelEnum.submodel, row.submodel_id, row.submodel_name),
+        )
+        if id is not None
+    ]
+    return CatalogSearchHit(
+        level=row.level, id=row.id, name=row.name, score=row.score, path=path
+    )
+
+
+async def search_catalog(
+    db: AsyncSession, q: str, limit: int
+) -> List[CatalogSearchHit]:
+    rows = await CatalogSearchRepository.search(db, q, limit)
+    return [_to_search_hit(row) for row in rows]
@@ -0,0 +1,96 @@
+from typing import List, Optional
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.brand import Brand
+from app.models.car_model import CarModel
+from app.models.submodel import Submodel
+from app.schemas.catalog_schemas import (
+    CatalogTreeBrand,
+    CatalogTreeModel,
+    CatalogTreeSubmodel,
+    CatalogTreeGeneration,
+)
+from app.repositories.catalog_tree import CatalogTreeRepository
+from app.exceptions.catalog_exc import CatalogTreeRootNotFound, InvalidCatalogTreeDepth
+from app.utils.enums import CatalogLevelEnum
+
+
+CATALOG_LEVELS = list(CatalogLevelEnum)
+
+
+def _by_name(items: list) -> list:
+    return sorted(items, key=lambda item: item.name)
+
+
+def _to_submodel(submodel: Submodel, levels: int) -> CatalogTreeSubmodel:
+    return CatalogTreeSubmodel(
+        id=submodel.id,
+        name=submodel.name,
+        generations=(
+            [
+                CatalogTreeGeneration(
+                    id=generation.id,
+                    name=generation.name,
+                    year_from=generation.year_from,
+                    year_to=generation.year_to,
+                )
+                for generation in _by_name(submodel.generations)
+            ]
+            if levels > 3
+            else None
+        ),
+    )
+
+
+def _to_model(car_model: CarModel, levels: int) -> CatalogTreeModel:
+    return CatalogTreeModel(
+        id=car_model.id,
+        name=car_model.name,
+        description=car_model.description,
+        submodels=(
+            [
+                _to_submodel(submodel, levels)
+                for submodel in _by_name(car_model.submodels)
+            ]
+            if levels > 2
+            else None
+        ),
+    )
+
+
+def _to_brand(brand: Brand, levels: int) -> CatalogTreeBrand:
+    return CatalogTreeBrand(
+        id=brand.id,
+        name=brand.name,
+        country=brand.country,
+        models=(
+            [_to_model(car_model, levels) for car_model in _by_name(brand.models)]
+            if levels > 1
+            else None
+        ),
+    )
+
+
+async def get_catalog_tree(
+    db: AsyncSession,
+    depth: CatalogLevelEnum = CatalogLevelEnum.generation,
+    brand_id: Optional[UUID] = None,
+    model_id: Optional[UUID] = None,
+) -> List[CatalogTreeBrand]:
+    if brand_id is not None and model_id is not None:
+        raise InvalidCatalogTreeDepth("Root the tree at a brand or a model, not both")
+
+    levels = CATALOG_LEVELS.index(depth) + 1
+    if model_id is not None and levels < 2:
+        raise InvalidCatalogTreeDepth("A tree rooted at a model must include models")
+
+    brands = await CatalogTreeRepository.select_tree(db, levels, brand_id, model_id)
+
+    if model_id is not None and not brands:
+        raise CatalogTreeRootNotFound(f"Car model with id '{model_id}' not found")
+    if brand_id is not None and not brands:
+        raise CatalogTreeRootNotFound(f"Brand with id '{brand_id}' not found")
+
+    return [_to_brand(brand, levels) for brand in brands]
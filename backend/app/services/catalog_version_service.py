@@ -0,0 +1,55 @@
+import asyncio
+import logging
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.cache import cache_backend
+from app.repositories.catalog_version import CatalogVersionRepository
+from app.utils.cache import TTLCache
+from app.config import settings
+
+
+CATALOG_VERSION_CHANNEL = "catalog-version"
+
+logger = logging.getLogger(__name__)
+
+version_cache = TTLCache(max_size=1, ttl=settings.CATALOG_VERSION_TTL_SECONDS)
+
+
+def _observe_version(version: int) -> None:
+    current = version_cache.get("version")
+    if current is None or version > current:
+        version_cache.set("version", version)
+
+
+async def get_catalog_version(db: AsyncSession) -> int:
+    version = version_cache.get("version")
+    if version is None:
+        version = await CatalogVersionRepository.select_version(db)
+        version_cache.set("version", version)
+
+    return version
+
+
+async def bump_catalog_version(db: AsyncSession) -> int:
+    version = await CatalogVersionRepository.increment(db)
+    await db.commit()
+    _observe_version(version)
+    await cache_backend.publish(CATALOG_VERSION_CHANNEL, str(version))
+    return version
+
+
+async def listen_for_catalog_changes() -> None:
+    while True:
+        try:
+            async for message in cache_backend.subscribe(CATALOG_VERSION_CHANNEL):
+                _observe_version(int(message))
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("Catalog version subscription failed, resubscribing")
+            await asyncio.sleep(1)
+
+
+def catalog_etag(version: int) -> str:
+    return f'"catalog-{version}"'
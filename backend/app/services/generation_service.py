@@ -9,28 +9,33 @@ from app.schemas.generation_schemas import (
     Generation as GenerationSchema,
     GenerationCreate,
 )
+from app.schemas.pagination_schemas import Page, PageParams
 from app.repositories.generation import GenerationRepository
 from app.repositories.submodel import SubmodelRepository
+from app.utils.pagination import build_page
 from app.exceptions.generation_exc import (
     GenerationAlreadyExists,
     SubmodelNotFound,
     GenerationNotFound,
 )
+from app.services.car_data_service import refresh_car_data
+from app.services.catalog_version_service import bump_catalog_version
+from app.services.catalog_replica_service import (
+    catalog_replica,
+    get_catalog_replica,
+)
 from app.exceptions.common import DatabaseIntegrityError
 
 
 async def create_generation(
     generation_data: GenerationCreate, db: AsyncSession
 ) -> GenerationSchema:
-    submodel = await SubmodelRepository.select_by_id(db, generation_data.submodel_id)
-    if not submodel:
-        raise SubmodelNotFound(
-            f"Submodel with id '{generation_data.submodel_id}' not found"
-        )
-
     try:
         generation = await GenerationRepository.insert(db, generation_data.model_dump())
-        return GenerationSchema.model_validate(generation)
+        version = await bump_catalog_version(db)
+        generation = GenerationSchema.model_validate(generation)
+        catalog_replica.put(version, catalog_replica.generations, generation)
+        return generation
 
     except IntegrityError as e:
         original = e.orig
@@ -49,15 +54,27 @@ async def create_generation(
             raise DatabaseIntegrityError(str(original))
 
 
-async def get_all_generations(db: AsyncSession) -> List[GenerationSchema]:
-    generations = await GenerationRepository.select_all(db)
-    return [GenerationSchema.model_validate(generation) for generation in generations]
+async def get_all_generations(
+    db: AsyncSession, page: PageParams
+) -> Page[GenerationSchema]:
+    generations = await GenerationRepository.select_all(db, page.limit + 1, page.cursor)
+    total = await GenerationRepository.count(db) if page.include_total else None
+    return build_page(
+        [GenerationSchema.model_validate(generation) for generation in generations],
+        page.limit,
+        total,
+    )
 
 
 async def get_generation_by_id(
     generation_id: UUID, db: AsyncSession
 ) -> GenerationSchema:
-    generation = await GenerationRepository.select_by_id(db, generation_id)
+    replica = await get_catalog_replica(db)
+    generation = (
+        replica.generations.get(generation_id)
+        if replica
+        else await GenerationRepository.select_by_id(db, generation_id)
+    )
 
     if not generation:
         raise GenerationNotFound(f"Generation with id '{generation_id}' not found")
@@ -68,19 +85,33 @@ async def get_generation_by_id(
 async def get_generations_by_submodel_id(
     submodel_id: UUID, db: AsyncSession
 ) -> List[GenerationSchema]:
-    submodel = await SubmodelRepository.select_by_id(db, submodel_id)
+    replica = await get_catalog_replica(db)
+    submodel = (
+        replica.submodels.get(submodel_id)
+        if replica
+        else await SubmodelRepository.select_by_id(db, submodel_id)
+    )
     if not submodel:
         raise SubmodelNotFound(f"Submodel with id '{submodel_id}' not found")
 
-    generations = await GenerationRepository.select_by_submodel_id(db, submodel_id)
+    generations = (
+        replica.generations.children(submodel_id)
+        if replica
+        else await GenerationRepository.select_by_submodel_id(db, submodel_id)
+    )
     return [GenerationSchema.model_validate(generation) for generation in generations]
 
 
 async def get_generation_by_name_and_submodel(
     name: str, submodel_id: UUID, db: AsyncSession
 ) -> GenerationSchema:
-    generation = await GenerationRepository.select_by_name_and_submodel(
-        db, name, submodel_id
+    replica = await get_catalog_replica(db)
+    generation = (
+        replica.generations.get_by_name(name, submodel_id)
+        if replica
+        else await GenerationRepository.select_by_name_and_submodel(
+            db, name, submodel_id
+        )
     )
 
     if not generation:
@@ -94,16 +125,18 @@ async def get_generation_by_name_and_submodel(
 async def update_generation(
     generation_id: UUID, generation_data: GenerationCreate, db: AsyncSession
 ) -> GenerationSchema:
-    generation = await GenerationRepository.select_by_id(db, generation_id)
-
-    if not generation:
-        raise GenerationNotFound(f"Generation with id '{generation_id}' not found")
-
     try:
         updated_generation = await GenerationRepository.update(
-            db, generation, generation_data.model_dump()
+            db, generation_id, generation_data.model_dump()
         )
-        return GenerationSchema.model_validate(updated_generation)
+        if not updated_generation:
+            raise GenerationNotFound(f"Generation with id '{generation_id}' not found")
+
+        await refresh_car_data(db, "generation_id", updated_generation.id)
+        version = await bump_catalog_version(db)
+        updated_generation = GenerationSchema.model_validate(updated_generation)
+        catalog_replica.put(version, catalog_replica.generations, updated_generation)
+        return updated_generation
 
     except IntegrityError as e:
         original = e.orig
@@ -128,4 +161,6 @@ async def delete_generation(generation_id: UUID, db: AsyncSession) -> Generation
     if not generation:
         raise GenerationNotFound(f"Generation with id '{generation_id}' not found")
 
+    version = await bump_catalog_version(db)
+    catalog_replica.remove(version, catalog_replica.generations, generation_id)
     return GenerationSchema.model_validate(generation)
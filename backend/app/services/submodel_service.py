@@ -6,28 +6,33 @@ from sqlalchemy.exc import IntegrityError
 from asyncpg.exceptions import UniqueViolationError, ForeignKeyViolationError
 
 from app.schemas.submodel_schemas import Submodel as SubmodelSchema, SubmodelCreate
+from app.schemas.pagination_schemas import Page, PageParams
 from app.repositories.submodel import SubmodelRepository
 from app.repositories.car_model import CarModelRepository
+from app.utils.pagination import build_page
 from app.exceptions.submodel_exc import (
     SubmodelAlreadyExists,
     CarModelNotFound,
     SubmodelNotFound,
 )
+from app.services.car_data_service import refresh_car_data
+from app.services.catalog_version_service import bump_catalog_version
+from app.services.catalog_replica_service import (
+    catalog_replica,
+    get_catalog_replica,
+)
 from app.exceptions.common import DatabaseIntegrityError
 
 
 async def create_submodel(
     submodel_data: SubmodelCreate, db: AsyncSession
 ) -> SubmodelSchema:
-    car_model = await CarModelRepository.select_by_id(db, submodel_data.model_id)
-    if not car_model:
-        raise CarModelNotFound(
-            f"Car model with id '{submodel_data.model_id}' not found"
-        )
-
     try:
         submodel = await SubmodelRepository.insert(db, submodel_data.model_dump())
-        return SubmodelSchema.model_validate(submodel)
+        version = await bump_catalog_version(db)
+        submodel = SubmodelSchema.model_validate(submodel)
+        catalog_replica.put(version, catalog_replica.submodels, submodel)
+        return submodel
 
     except IntegrityError as e:
         original = e.orig
@@ -46,13 +51,23 @@ async def create_submodel(
             raise DatabaseIntegrityError(str(original))
 
 
-async def get_all_submodels(db: AsyncSession) -> List[SubmodelSchema]:
-    submodels = await SubmodelRepository.select_all(db)
-    return [SubmodelSchema.model_validate(submodel) for submodel in submodels]
+async def get_all_submodels(db: AsyncSession, page: PageParams) -> Page[SubmodelSchema]:
+    submodels = await SubmodelRepository.select_all(db, page.limit + 1, page.cursor)
+    total = await SubmodelRepository.count(db) if page.include_total else None
+    return build_page(
+        [SubmodelSchema.model_validate(submodel) for submodel in submodels],
+        page.limit,
+        total,
+    )
 
 
 async def get_submodel_by_id(submodel_id: UUID, db: AsyncSession) -> SubmodelSchema:
-    submodel = await SubmodelRepository.select_by_id(db, submodel_id)
+    replica = await get_catalog_replica(db)
+    submodel = (
+        replica.submodels.get(submodel_id)
+        if replica
+        else await SubmodelRepository.select_by_id(db, submodel_id)
+    )
 
     if not submodel:
         raise SubmodelNotFound(f"Submodel with id '{submodel_id}' not found")
@@ -63,16 +78,30 @@ async def get_submodel_by_id(submodel_id: UUID, db: AsyncSession) -> SubmodelSch
 async def get_submodels_by_model_id(
     model_id: UUID, db: AsyncSession
 ) -> List[SubmodelSchema]:
-    car_model = await CarModelRepository.select_by_id(db, model_id)
+    replica = await get_catalog_replica(db)
+    car_model = (
+        replica.car_models.get(model_id)
+        if replica
+        else await CarModelRepository.select_by_id(db, model_id)
+    )
     if not car_model:
         raise CarModelNotFound(f"Car model with id '{model_id}' not found")
 
-    submodels = await SubmodelRepository.select_by_model_id(db, model_id)
+    submodels = (
+        replica.submodels.children(model_id)
+        if replica
+        else await SubmodelRepository.select_by_model_id(db, model_id)
+    )
     return [SubmodelSchema.model_validate(submodel) for submodel in submodels]
 
 
 async def get_submodel_by_name(name: str, db: AsyncSession) -> SubmodelSchema:
-    submodel = await SubmodelRepository.select_by_name(db, name)
+    replica = await get_catalog_replica(db)
+    submodel = (
+        replica.submodels.get_by_name(name)
+        if replica
+        else await SubmodelRepository.select_by_name(db, name)
+    )
 
     if not submodel:
         raise SubmodelNotFound(f"Submodel with name '{name}' not found")
@@ -83,16 +112,18 @@ async def get_submodel_by_name(name: str, db: AsyncSession) -> SubmodelSchema:
 async def update_submodel(
     submodel_id: UUID, submodel_data: SubmodelCreate, db: AsyncSession
 ) -> SubmodelSchema:
-    submodel = await SubmodelRepository.select_by_id(db, submodel_id)
-
-    if not submodel:
-        raise SubmodelNotFound(f"Submodel with id '{submodel_id}' not found")
-
     try:
         updated_submodel = await SubmodelRepository.update(
-            db, submodel, submodel_data.model_dump()
+            db, submodel_id, submodel_data.model_dump()
         )
-        return SubmodelSchema.model_validate(updated_submodel)
+        if not updated_submodel:
+            raise SubmodelNotFound(f"Submodel with id '{submodel_id}' not found")
+
+        await refresh_car_data(db, "submodel_id", updated_submodel.id)
+        version = await bump_catalog_version(db)
+        updated_submodel = SubmodelSchema.model_validate(updated_submodel)
+        catalog_replica.put(version, catalog_replica.submodels, updated_submodel)
+        return updated_submodel
 
     except IntegrityError as e:
         original = e.orig
@@ -117,4 +148,6 @@ async def delete_submodel(submodel_id: UUID, db: AsyncSession) -> SubmodelSchema
     if not submodel:
         raise SubmodelNotFound(f"Submodel with id '{submodel_id}' not found")
 
+    version = await bump_catalog_version(db)
+    catalog_replica.remove(version, catalog_replica.submodels, submodel_id)
     return SubmodelSchema.model_validate(submodel)
@@ -1,6 +1,7 @@
-from typing import List
+from typing import Any, List, Set
 from uuid import UUID
 
+from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
 from asyncpg.exceptions import UniqueViolationError
@@ -11,15 +12,23 @@ from app.schemas.user_schemas import (
     UserUpdate,
     UserUpdatePassword,
 )
+from app.schemas.bulk_schemas import BulkCreateResult, BulkRowError
+from app.schemas.pagination_schemas import Page, PageParams
 from app.repositories.user import UserRepository
-from app.dependancies.auth import hash_password
+from app.dependancies.auth import hash_password, hash_passwords, invalidate_principal
+from app.utils.pagination import build_page
+from app.utils.bulk import format_validation_error, validate_bulk_row
 from app.exceptions.user_exc import UserAlreadyExists, UserNotFound
 from app.exceptions.common import DatabaseIntegrityError
+from app.config import settings
 
 
-async def get_all_users(db: AsyncSession) -> List[UserSchema]:
-    users = await UserRepository.select_all(db)
-    return [UserSchema.model_validate(user) for user in users]
+async def get_all_users(db: AsyncSession, page: PageParams) -> Page[UserSchema]:
+    users = await UserRepository.select_all(db, page.limit + 1, page.cursor)
+    total = await UserRepository.count(db) if page.include_total else None
+    return build_page(
+        [UserSchema.model_validate(user) for user in users], page.limit, total
+    )
 
 
 async def get_user_by_id(user_id: UUID, db: AsyncSession) -> UserSchema:
@@ -31,43 +40,127 @@ async def get_user_by_id(user_id: UUID, db: AsyncSession) -> UserSchema:
     return UserSchema.model_validate(user)
 
 
-async def create_user(user_data: UserCreate, db: AsyncSession) -> UserSchema:
-    existing_user = await UserRepository.select_by_email(db, user_data.email)
-    if existing_user:
-        raise UserAlreadyExists(f"User with email '{user_data.email}' already exists")
-
-    existing_username = await UserRepository.select_by_username(db, user_data.username)
-    if existing_username:
-        raise UserAlreadyExists(
+async def _user_already_exists(
+    user_data: UserCreate, db: AsyncSession
+) -> UserAlreadyExists:
+    emails, usernames = await UserRepository.select_taken(
+        db, [user_data.email], [user_data.username]
+    )
+    if emails:
+        return UserAlreadyExists(f"User with email '{user_data.email}' already exists")
+    if usernames:
+        return UserAlreadyExists(
             f"User with username '{user_data.username}' already exists"
         )
+    return UserAlreadyExists("User with this email or username already exists")
 
+
+async def create_user(user_data: UserCreate, db: AsyncSession) -> UserSchema:
     try:
         user_dict = user_data.model_dump(exclude={"password"})
-        user_dict["hashed_password"] = hash_password(user_data.password)
+        user_dict["hashed_password"] = await hash_password(user_data.password)
 
-        user = await UserRepository.insert(db, user_dict)
+        user = await UserRepository.insert_if_absent(db, user_dict)
+        if not user:
+            raise await _user_already_exists(user_data, db)
+
+        await db.commit()
         return UserSchema.model_validate(user)
 
     except IntegrityError as e:
-        original = e.orig
-        if isinstance(original, UniqueViolationError):
-            raise UserAlreadyExists("User with this email or username already exists")
+        raise DatabaseIntegrityError(str(e.orig))
+
+
+async def create_users_bulk(rows: List[Any], db: AsyncSession) -> BulkCreateResult:
+    errors: List[BulkRowError] = []
+    valid: List[tuple[int, UserCreate]] = []
+    emails: Set[str] = set()
+    usernames: Set[str] = set()
+
+    for index, row in enumerate(rows):
+        try:
+            user = validate_bulk_row(UserCreate, row)
+        except ValidationError as e:
+            errors.append(BulkRowError(index=index, detail=format_validation_error(e)))
+            continue
+
+        if user.email in emails or user.username in usernames:
+            errors.append(
+                BulkRowError(
+                    index=index, detail="Email or username repeated in this request"
+                )
+            )
+            continue
+
+        emails.add(user.email)
+        usernames.add(user.username)
+        valid.append((index, user))
+
+    # One lookup for the whole request, so rows that would conflict are
+    # rejected before their passwords go through bcrypt.
+    taken_emails, taken_usernames = await UserRepository.select_taken(
+        db, emails, usernames
+    )
+
+    to_create: List[tuple[int, UserCreate]] = []
+    for index, user in valid:
+        if user.email in taken_emails:
+            detail = f"User with email '{user.email}' already exists"
+        elif user.username in taken_usernames:
+            detail = f"User with username '{user.username}' already exists"
         else:
-            raise DatabaseIntegrityError(str(original))
+            to_create.append((index, user))
+            continue
+
+        errors.append(BulkRowError(index=index, detail=detail))
+
+    hashed_passwords = await hash_passwords([user.password for _, user in to_create])
+
+    created = 0
+    batch_size = settings.BULK_INSERT_BATCH_SIZE
+    for start in range(0, len(to_create), batch_size):
+        batch = to_create[start : start + batch_size]
+        user_rows = [
+            {**user.model_dump(exclude={"password"}), "hashed_password": hashed}
+            for (_, user), hashed in zip(
+                batch, hashed_passwords[start : start + batch_size]
+            )
+        ]
+
+        try:
+            inserted = await UserRepository.insert_many_if_absent(db, user_rows)
+        except IntegrityError as e:
+            await db.rollback()
+            errors.extend(
+                BulkRowError(index=index, detail=str(e.orig)) for index, _ in batch
+            )
+            continue
+
+        await db.commit()
+        created += len(inserted)
+        errors.extend(
+            BulkRowError(
+                index=index, detail="User with this email or username already exists"
+            )
+            for index, user in batch
+            if user.email not in inserted
+        )
+
+    errors.sort(key=lambda error: error.index)
+    return BulkCreateResult(created=created, errors=errors)
 
 
 async def update_user(
     user_id: UUID, user_data: UserUpdate, db: AsyncSession
 ) -> UserSchema:
-    user = await UserRepository.select_by_id(db, user_id)
-
-    if not user:
-        raise UserNotFound(f"User with id '{user_id}' not found")
-
     try:
         update_dict = user_data.model_dump(exclude_unset=True)
-        updated_user = await UserRepository.update(db, user, update_dict)
+        updated_user = await UserRepository.update(db, user_id, update_dict)
+        if not updated_user:
+            raise UserNotFound(f"User with id '{user_id}' not found")
+
+        await db.commit()
+        await invalidate_principal(user_id)
         return UserSchema.model_validate(updated_user)
 
     except IntegrityError as e:
@@ -81,15 +174,15 @@ async def update_user(
 async def update_user_password(
     user_id: UUID, password_data: UserUpdatePassword, db: AsyncSession
 ) -> UserSchema:
-    user = await UserRepository.select_by_id(db, user_id)
-
-    if not user:
-        raise UserNotFound(f"User with id '{user_id}' not found")
-
-    hashed_password = hash_password(password_data.password)
+    hashed_password = await hash_password(password_data.password)
     updated_user = await UserRepository.update(
-        db, user, {"hashed_password": hashed_password}
+        db, user_id, {"hashed_password": hashed_password}
     )
+    if not updated_user:
+        raise UserNotFound(f"User with id '{user_id}' not found")
+
+    await db.commit()
+    await invalidate_principal(user_id)
     return UserSchema.model_validate(updated_user)
 
 
@@ -99,4 +192,7 @@ async def delete_user(user_id: UUID, db: AsyncSession) -> UserSchema:
     if not user:
         raise UserNotFound(f"User with id '{user_id}' not found")
 
+    await db.commit()
+    await invalidate_principal(user_id)
+
     return UserSchema.model_validate(user)
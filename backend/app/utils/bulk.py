@@ -0,0 +1,78 @@
+from typing import Any, AsyncIterator, List, Type, TypeVar
+
+from fastapi import Request, status
+from pydantic import BaseModel, ValidationError
+
+from app.schemas.bulk_schemas import BulkCreateResult
+from app.config import settings
+
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+async def _ndjson_batches(
+    request: Request, batch_size: int
+) -> AsyncIterator[List[Any]]:
+    # Lines are handed on undecoded: validate_bulk_row parses them straight
+    # into the schema, and a malformed line becomes that row's error instead
+    # of failing the batches already inserted.
+    batch: List[Any] = []
+    buffer = b""
+    async for chunk in request.stream():
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        batch.extend(line for line in lines if line.strip())
+        while len(batch) >= batch_size:
+            yield batch[:batch_size]
+            batch = batch[batch_size:]
+
+    if buffer.strip():
+        batch.append(buffer)
+    if batch:
+        yield batch
+
+
+async def _list_batches(rows: List[Any], batch_size: int) -> AsyncIterator[List[Any]]:
+    for start in range(0, len(rows), batch_size):
+        yield rows[start : start + batch_size]
+
+
+async def read_bulk_batches(
+    request: Request, batch_size: int = settings.BULK_INSERT_BATCH_SIZE
+) -> AsyncIterator[List[Any]]:
+    if request.headers.get("content-type", "").startswith("application/x-ndjson"):
+        return _ndjson_batches(request, batch_size)
+
+    rows = await request.json()
+    if not isinstance(rows, list):
+        raise ValueError("Expected a JSON array of rows")
+    return _list_batches(rows, batch_size)
+
+
+async def read_bulk_rows(request: Request) -> List[Any]:
+    return [row async for batch in await read_bulk_batches(request) for row in batch]
+
+
+def validate_bulk_row(model: Type[ModelT], row: Any) -> ModelT:
+    if isinstance(row, bytes):
+        return model.model_validate_json(row)
+    return model.model_validate(row)
+
+
+def format_validation_error(error: ValidationError) -> str:
+    # A malformed NDJSON line fails as a whole and has no field location.
+    return "; ".join(
+        f"{'.'.join(str(part) for part in item['loc'])}: {item['msg']}"
+        if item["loc"]
+        else item["msg"]
+        for item in error.errors()
+    )
+
+
+def bulk_status_code(result: BulkCreateResult) -> int:
+    # An empty upload failed nothing, so it is not a client error.
+    if result.created == 0 and result.errors:
+        return status.HTTP_400_BAD_REQUEST
+    if result.errors:
+        return status.HTTP_207_MULTI_STATUS
+    return status.HTTP_201_CREATED
@@ -0,0 +1,170 @@
+import asyncio
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Optional
+
+
+class CacheBackend(ABC):
+    name: str
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+
+    def _record(self, value: Optional[bytes]) -> Optional[bytes]:
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[bytes]: ...
+
+    @abstractmethod
+    async def set(
+        self, key: str, value: bytes, ttl: Optional[float] = None
+    ) -> None: ...
+
+    @abstractmethod
+    async def delete(self, key: str) -> None: ...
+
+    @abstractmethod
+    async def clear(self) -> None: ...
+
+    @abstractmethod
+    async def publish(self, channel: str, message: str) -> None: ...
+
+    @abstractmethod
+    def subscribe(self, channel: str) -> AsyncIterator[str]: ...
+
+    async def close(self) -> None:
+        pass
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "backend": self.name,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+class MemoryCacheBackend(CacheBackend):
+    name = "memory"
+
+    def __init__(self, max_bytes: int):
+        super().__init__()
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.evictions = 0
+        self._entries: OrderedDict[str, tuple[Optional[float], bytes]] = OrderedDict()
+        self._subscribers: dict[str, set[asyncio.Queue]] = {}
+
+    def _pop(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.bytes -= len(entry[1])
+
+    async def get(self, key: str) -> Optional[bytes]:
+        entry = self._entries.get(key)
+
+        if entry is not None and entry[0] is not None and entry[0] < time.monotonic():
+            self._pop(key)
+            entry = None
+
+        if entry is not None:
+            self._entries.move_to_end(key)
+
+        return self._record(entry[1] if entry is not None else None)
+
+    async def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        if len(value) > self.max_bytes:
+            return
+
+        self._pop(key)
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        self._entries[key] = (expires_at, value)
+        self.bytes += len(value)
+
+        while self.bytes > self.max_bytes:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self.bytes -= len(evicted)
+            self.evictions += 1
+
+    async def delete(self, key: str) -> None:
+        self._pop(key)
+
+    async def clear(self) -> None:
+        self._entries.clear()
+        self.bytes = 0
+
+    async def publish(self, channel: str, message: str) -> None:
+        for queue in self._subscribers.get(channel, ()):
+            queue.put_nowait(message)
+
+    async def subscribe(self, channel: str) -> AsyncIterator[str]:
+        queue: asyncio.Queue = asyncio.Queue()
+        self._subscribers.setdefault(channel, set()).add(queue)
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            self._subscribers[channel].discard(queue)
+
+    def stats(self) -> dict:
+        return {
+            **super().stats(),
+            "evictions": self.evictions,
+            "size": len(self._entries),
+            "bytes": self.bytes,
+            "max_bytes": self.max_bytes,
+        }
+
+
+class RedisCacheBackend(CacheBackend):
+    name = "redis"
+
+    def __init__(self, url: str, prefix: str = "", client: Optional[Any] = None):
+        # redis is the optional "redis" extra, so it is only imported when the
+        # redis backend is actually configured.
+        from redis import asyncio as aioredis
+
+        super().__init__()
+        self.prefix = prefix
+        self._client = client if client is not None else aioredis.from_url(url)
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return self._record(await self._client.get(self.prefix + key))
+
+    async def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        await self._client.set(
+            self.prefix + key, value, px=int(ttl * 1000) if ttl is not None else None
+        )
+
+    async def delete(self, key: str) -> None:
+        await self._client.delete(self.prefix + key)
+
+    async def clear(self) -> None:
+        keys = [key async for key in self._client.scan_iter(match=self.prefix + "*")]
+        if keys:
+            await self._client.delete(*keys)
+
+    async def publish(self, channel: str, message: str) -> None:
+        await self._client.publish(self.prefix + channel, message)
+
+    async def subscribe(self, channel: str) -> AsyncIterator[str]:
+        pubsub = self._client.pubsub()
+        await pubsub.subscribe(self.prefix + channel)
+        try:
+            async for message in pubsub.listen():
+                if message["type"] == "message":
+                    yield message["data"].decode()
+        finally:
+            await pubsub.unsubscribe()
+            await pubsub.aclose()
+
+    async def close(self) -> None:
+        await self._client.aclose()
@@ -0,0 +1,134 @@
+import asyncio
+from typing import Any, Dict, Iterable, List, Optional
+from uuid import UUID
+
+
+class ReplicaTable:
+    def __init__(self, parent_field: Optional[str] = None):
+        self.parent_field = parent_field
+        self.by_id: Dict[UUID, Any] = {}
+        self.by_name: Dict[str, UUID] = {}
+        # Insertion-ordered sets of child ids per parent id.
+        self.by_parent: Dict[UUID, Dict[UUID, None]] = {}
+
+    def get(self, id: UUID) -> Optional[Any]:
+        return self.by_id.get(id)
+
+    def get_by_name(self, name: str, parent_id: Optional[UUID] = None) -> Optional[Any]:
+        id = self.by_name.get(name)
+        if id is None:
+            return None
+
+        item = self.by_id[id]
+        if parent_id is not None and getattr(item, self.parent_field) != parent_id:
+            return None
+        return item
+
+    def children(self, parent_id: UUID) -> List[Any]:
+        return [self.by_id[id] for id in self.by_parent.get(parent_id, ())]
+
+    def existing_ids(self, ids: Iterable[UUID]) -> set[UUID]:
+        return {id for id in ids if id in self.by_id}
+
+    def put(self, item: Any) -> None:
+        self.discard(item.id)
+        self.by_id[item.id] = item
+        self.by_name[item.name] = item.id
+        if self.parent_field:
+            parent_id = getattr(item, self.parent_field)
+            self.by_parent.setdefault(parent_id, {})[item.id] = None
+
+    def discard(self, id: UUID) -> Optional[Any]:
+        item = self.by_id.pop(id, None)
+        if item is None:
+            return None
+
+        if self.by_name.get(item.name) == id:
+            del self.by_name[item.name]
+
+        if self.parent_field:
+            parent_id = getattr(item, self.parent_field)
+            siblings = self.by_parent.get(parent_id, {})
+            siblings.pop(id, None)
+            if not siblings:
+                self.by_parent.pop(parent_id, None)
+
+        return item
+
+    def __len__(self) -> int:
+        return len(self.by_id)
+
+
+class CatalogReplica:
+    def __init__(self):
+        self.version: Optional[int] = None
+        self.stale = asyncio.Event()
+        self._reset()
+
+    def _reset(self) -> None:
+        self.brands = ReplicaTable()
+        self.car_models = ReplicaTable("brand_id")
+        self.submodels = ReplicaTable("model_id")
+        self.generations = ReplicaTable("submodel_id")
+        self._levels = [self.brands, self.car_models, self.submodels, self.generations]
+
+    def is_current(self, version: int) -> bool:
+        if self.version is not None and self.version == version:
+            return True
+
+        self.stale.set()
+        return False
+
+    def replace(
+        self,
+        version: int,
+        brands: Iterable[Any],
+        car_models: Iterable[Any],
+        submodels: Iterable[Any],
+        generations: Iterable[Any],
+    ) -> None:
+        self._reset()
+        for table, items in zip(
+            self._levels, (brands, car_models, submodels, generations)
+        ):
+            for item in items:
+                table.put(item)
+
+        self.version = version
+
+    def advance(self, version: int) -> bool:
+        # A write can only be applied on top of the version it was made
+        # against; anything else means another writer got in between, so
+        # leave the replica behind and let reconciliation reload it.
+        if self.version is None or version != self.version + 1:
+            self.stale.set()
+            return False
+
+        self.version = version
+        return True
+
+    def put(self, version: int, table: ReplicaTable, item: Any) -> None:
+        if self.advance(version):
+            table.put(item)
+
+    def remove(self, version: int, table: ReplicaTable, id: UUID) -> None:
+        if self.advance(version):
+            self._remove(self._levels.index(table), id)
+
+    def _remove(self, level: int, id: UUID) -> None:
+        self._levels[level].discard(id)
+
+        # Mirror ON DELETE CASCADE for the levels below.
+        if level + 1 < len(self._levels):
+            children = self._levels[level + 1]
+            for child_id in list(children.by_parent.get(id, ())):
+                self._remove(level + 1, child_id)
+
+    def stats(self) -> dict:
+        return {
+            "version": self.version,
+            "brands": len(self.brands),
+            "car_models": len(self.car_models),
+            "submodels": len(self.submodels),
+            "generations": len(self.generations),
+        }
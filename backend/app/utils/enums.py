@@ -13,3 +13,33 @@ class UserRoleEnum(Enum):
     admin = "admin"
     car_specialist = "car_specialist"
     user = "user"
+
+
+class SortOrderEnum(Enum):
+    asc = "asc"
+    desc = "desc"
+
+
+class CarDataSortEnum(Enum):
+    spec_id = "spec_id"
+    spec_year = "spec_year"
+    horsepower = "horsepower"
+    torque = "torque"
+    weight = "weight"
+    zero_to_100 = "zero_to_100"
+    top_speed = "top_speed"
+    brand_name = "brand_name"
+    model_name = "model_name"
+
+
+class CatalogLevelEnum(Enum):
+    brand = "brand"
+    model = "model"
+    submodel = "submodel"
+    generation = "generation"
+
+
+class ExportFormatEnum(Enum):
+    parquet = "parquet"
+    arrow = "arrow"
+    csv = "csv"
@@ -0,0 +1,40 @@
+import base64
+import binascii
+from typing import Any, Callable, List, Optional
+from uuid import UUID
+
+from fastapi import Response
+
+from app.schemas.pagination_schemas import Page
+
+
+def encode_cursor(id: UUID) -> str:
+    return base64.urlsafe_b64encode(id.bytes).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str) -> UUID:
+    try:
+        return UUID(bytes=base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (binascii.Error, ValueError):
+        raise ValueError(f"Invalid cursor '{cursor}'")
+
+
+def build_page(
+    items: List[Any],
+    limit: int,
+    total: Optional[int] = None,
+    key: Callable[[Any], UUID] = lambda item: item.id,
+) -> Page:
+    next_cursor = None
+    if len(items) > limit:
+        items = items[:limit]
+        next_cursor = encode_cursor(key(items[-1]))
+
+    return Page(items=items, next_cursor=next_cursor, total=total)
+
+
+def set_page_headers(response: Response, page: Page) -> None:
+    if page.next_cursor is not None:
+        response.headers["X-Next-Cursor"] = page.next_cursor
+    if page.total is not None:
+        response.headers["X-Total-Count"] = str(page.total)
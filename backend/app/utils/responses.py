@@ -0,0 +1,29 @@
+from functools import lru_cache
+from typing import Any
+
+import orjson
+from fastapi import Response, status
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+@lru_cache
+def _type_adapter(response_type: Any) -> TypeAdapter:
+    return TypeAdapter(response_type)
+
+
+def model_response(
+    content: Any, response_type: Any, status_code: int = status.HTTP_200_OK
+) -> Response:
+    return Response(
+        content=_type_adapter(response_type).dump_json(content),
+        status_code=status_code,
+        media_type="application/json",
+    )